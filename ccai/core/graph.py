@@ -2,22 +2,43 @@
 
 from pathlib import Path
 from typing import Dict, Optional, List
+import sys
 import time
 
 from ccai.core.models import ConceptNode, PropertySpec
-from ccai.io.persistence import GraphPersistence
+from ccai.io.persistence import GraphPersistence, InMemoryPersistence
 
 class ConceptGraph:
-    """The main in-memory representation and manager of the knowledge graph."""
-
-    def __init__(self, storage_path: Path):
+    """
+    The main in-memory representation and manager of the knowledge graph.
+    Node names, aliases, relation types and relation targets are interned,
+    so the same concept name is one string object throughout the graph.
+    """
+
+    def __init__(self, storage_path: Optional[Path]):
+        """Persists the graph under storage_path, or only in memory if it is None."""
         self._nodes: Dict[str, ConceptNode] = {}
-        self._persistence = GraphPersistence(storage_path)
+        # Every node by its name and by each of its lowercased aliases. A name
+        # takes precedence over an alias, and the first node with an alias keeps it.
+        self._by_name: Dict[str, ConceptNode] = {}
+        if storage_path is None:
+            self._persistence = InMemoryPersistence()
+        else:
+            self._persistence = GraphPersistence(storage_path)
+
+    @classmethod
+    def in_memory(cls) -> "ConceptGraph":
+        """Creates a graph that is never written to disk, e.g. for tests."""
+        return cls(None)
 
     def load_from_disk(self):
         """Loads the graph state from the disk by loading the last snapshot
         and replaying any subsequent mutations from the WAL."""
-        self._nodes, last_snapshot_ts = self._persistence.load_snapshot()
+        nodes, last_snapshot_ts = self._persistence.load_snapshot()
+        for node in nodes.values():
+            self._intern_node(node)
+        self._nodes = {node.name: node for node in nodes.values()}
+        self._rebuild_index()
         mutations = self._persistence.load_mutations_after(last_snapshot_ts)
         if mutations:
             print("Replaying new mutations...")
@@ -25,25 +46,58 @@ class ConceptGraph:
     
     def get_node(self, name: str) -> Optional[ConceptNode]:
         """Retrieves a node by name or any of its aliases."""
-        clean = name.lower().strip()
-        node = self._nodes.get(clean)
-        if node:
-            return node
-
-        for n in self._nodes.values():
-            if clean in [a.lower() for a in n.aliases]:
-                return n
-
-        return None
+        return self._by_name.get(name.lower().strip())
 
     def add_node(self, node: ConceptNode):
         """Adds a new node to the graph and logs the mutation."""
         if node.name in self._nodes:
             # For simplicity, we'll just log an update. A real system might merge.
             print(f"Node '{node.name}' already exists. Updating.")
-        self._nodes[node.name] = node
+        self._put_node(node)
         self._persistence.log_mutation("ADD_NODE", node_data=node.model_dump())
 
+    def add_alias(self, node_name: str, alias: str):
+        """Adds an alternative name to a node and logs the mutation."""
+        node = self.get_node(node_name)
+        if not node:
+            return
+        alias = sys.intern(alias.lower().strip())
+        if alias in node.aliases:
+            return
+        node.aliases.append(alias)
+        self._by_name.setdefault(alias, node)
+        self._persistence.log_mutation("ADD_ALIAS", node=node.name, alias=alias)
+
+    def _put_node(self, node: ConceptNode):
+        """Stores a node and indexes its name and aliases."""
+        self._intern_node(node)
+        replaced = self._nodes.get(node.name)
+        self._nodes[node.name] = node
+        if replaced is not None:
+            # The aliases of the replaced node may point elsewhere now
+            self._rebuild_index()
+            return
+        self._by_name[node.name] = node
+        for alias in node.aliases:
+            self._by_name.setdefault(alias.lower(), node)
+
+    @staticmethod
+    def _intern_node(node: ConceptNode):
+        """Interns the names a node refers to."""
+        node.name = sys.intern(node.name)
+        node.aliases = [sys.intern(alias) for alias in node.aliases]
+        node.relations = {
+            sys.intern(rel): [sys.intern(target) for target in targets]
+            for rel, targets in node.relations.items()
+        }
+
+    def _rebuild_index(self):
+        """Indexes all nodes by name and alias."""
+        self._by_name = dict(self._nodes)
+        for node in self._nodes.values():
+            for alias in node.aliases:
+                self._by_name.setdefault(alias.lower(), node)
+
     def update_property(self, node_name: str, category: str, value: str):
         """Increment property statistics and recalc scores safely."""
         node = self.get_node(node_name)
@@ -75,11 +129,10 @@ class ConceptGraph:
             
         # This is a simplified example. Your full spec has different edge dicts.
         # We'll add to the generic 'relations' dict for now.
-        if relation_type not in source_node.relations:
-            source_node.relations[relation_type] = []
-
-        if dst_name not in source_node.relations[relation_type]:
-            source_node.relations[relation_type].append(dst_name)
+        relation_type, dst_name = sys.intern(relation_type), sys.intern(dst_name)
+        targets = source_node.relations.setdefault(relation_type, [])
+        if dst_name not in targets:
+            targets.append(dst_name)
             source_node.metadata["last_updated"] = time.time()
             self._persistence.log_mutation(
                 "ADD_EDGE", src=src_name, rel=relation_type, dst=dst_name
@@ -100,14 +153,20 @@ class ConceptGraph:
             if op == "ADD_NODE":
                 node_data = mut.get("node_data", {})
                 if node_data:
-                    self._nodes[node_data["name"]] = ConceptNode(**node_data)
+                    self._put_node(ConceptNode(**node_data))
             elif op == "ADD_EDGE":
                 src, rel, dst = mut.get("src"), mut.get("rel"), mut.get("dst")
                 if src and rel and dst and src in self._nodes:
-                    if rel not in self._nodes[src].relations:
-                        self._nodes[src].relations[rel] = []
-                    if dst not in self._nodes[src].relations[rel]:
-                        self._nodes[src].relations[rel].append(dst)
+                    rel, dst = sys.intern(rel), sys.intern(dst)
+                    targets = self._nodes[src].relations.setdefault(rel, [])
+                    if dst not in targets:
+                        targets.append(dst)
+            elif op == "ADD_ALIAS":
+                node, alias = mut.get("node"), mut.get("alias")
+                if node in self._nodes and alias and alias not in self._nodes[node].aliases:
+                    alias = sys.intern(alias)
+                    self._nodes[node].aliases.append(alias)
+                    self._by_name.setdefault(alias, self._nodes[node])
             elif op == "UPDATE_PROPERTY":
                 node = mut.get("node")
                 cat = mut.get("category")
@@ -31,6 +31,8 @@ class ConceptNode(BaseModel):
     property_stats: Dict[str, Dict[str, int]] = Field(default_factory=dict)
 
     structure: Dict[str, List[str]] = Field(default_factory=dict)
+    # Relation type -> target concept names, e.g. {"is_a": ["tool"]}. The
+    # reasoning subsystems, model_dump and the WAL all use this plain shape.
     relations: Dict[str, List[str]] = Field(default_factory=dict)
     functions: Dict[str, List[str]] = Field(default_factory=dict)
     logic: Dict[str, Any] = Field(default_factory=dict)
@@ -110,3 +110,41 @@ class GraphPersistence:
         
         print(f"Loaded {len(mutations)} new mutations from WAL.")
         return mutations
+
+
+class InMemoryPersistence:
+    """
+    Keeps the snapshot and the Write-Ahead Log of a concept graph in memory.
+    It has the interface of GraphPersistence without touching the disk or
+    starting a writer thread, for tests and throwaway graphs.
+    """
+
+    def __init__(self):
+        self._snapshot: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_timestamp = 0.0
+        self._mutations: List[Dict[str, Any]] = []
+
+    def save_snapshot(self, nodes: Dict[str, ConceptNode]):
+        """Saves a copy of the entire graph."""
+        self._snapshot = {name: node.model_dump() for name, node in nodes.items()}
+        self._snapshot_timestamp = time.time()
+
+    def load_snapshot(self) -> Tuple[Dict[str, ConceptNode], float]:
+        """Loads the graph from the last snapshot, if there is one."""
+        nodes = {name: ConceptNode(**data) for name, data in self._snapshot.items()}
+        return nodes, self._snapshot_timestamp
+
+    def log_mutation(self, op: str, **data: Any):
+        """Appends a single mutation operation to the log."""
+        self._mutations.append({
+            "ts": time.time(),
+            "op": op,
+            **data
+        })
+
+    def stop(self):
+        """Nothing to flush; the log is always up to date."""
+
+    def load_mutations_after(self, timestamp: float) -> List[Dict[str, Any]]:
+        """Loads all mutations from the log that occurred after the given timestamp."""
+        return [entry for entry in self._mutations if entry["ts"] > timestamp]
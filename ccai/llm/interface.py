@@ -26,6 +26,19 @@ from ccai.llm.ira_language import IRALanguageModule
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Multi-word entities that are joined with underscores before extraction
+_MULTI_WORD_ENTITY_RE = re.compile(
+    r'artificial intelligence|machine learning|deep learning|neural network'
+    r'|police officer|human being|living being'
+)
+
+# Knowledge triplet patterns. They are matched separately because the
+# matches of different patterns may overlap, e.g. in "dog has fur can bark".
+_IS_A_RE = re.compile(r'([a-z_]+)\s+is\s+(?:a|an)\s+([a-z_]+)')
+_HAS_RE = re.compile(r'([a-z_]+)\s+has\s+([a-z_]+)')
+_CAN_RE = re.compile(r'([a-z_]+)\s+can\s+([a-z_]+)')
+_IS_PROPERTY_RE = re.compile(r'([a-z_]+)\s+is\s+([a-z_]+)(?:\s+and\s+([a-z_]+))?')
+
 class EmbeddedLLM:
     """
     A lightweight embedded language model implementation based on the IRA philosophy.
@@ -336,16 +349,10 @@ class EmbeddedLLM:
         text = text.lower().strip()
         
         # Pre-process text to handle multi-word entities
-        text = re.sub(r'artificial intelligence', 'artificial_intelligence', text)
-        text = re.sub(r'machine learning', 'machine_learning', text)
-        text = re.sub(r'deep learning', 'deep_learning', text)
-        text = re.sub(r'neural network', 'neural_network', text)
-        text = re.sub(r'police officer', 'police_officer', text)
-        text = re.sub(r'human being', 'human_being', text)
-        text = re.sub(r'living being', 'living_being', text)
+        text = _MULTI_WORD_ENTITY_RE.sub(lambda match: match.group(0).replace(' ', '_'), text)
         
         # Look for "X is a Y" patterns
-        is_a_matches = re.finditer(r'([a-z_]+)\s+is\s+(?:a|an)\s+([a-z_]+)', text)
+        is_a_matches = _IS_A_RE.finditer(text)
         for match in is_a_matches:
             subject = match.group(1).strip()
             obj = match.group(2).strip()
@@ -355,7 +362,7 @@ class EmbeddedLLM:
             triplets.append({"subject": subject, "relation": "is_a", "object": obj})
         
         # Look for "X has Y" patterns
-        has_matches = re.finditer(r'([a-z_]+)\s+has\s+([a-z_]+)', text)
+        has_matches = _HAS_RE.finditer(text)
         for match in has_matches:
             subject = match.group(1).strip()
             obj = match.group(2).strip()
@@ -365,7 +372,7 @@ class EmbeddedLLM:
             triplets.append({"subject": subject, "relation": "has_part", "object": obj})
         
         # Look for "X can Y" patterns
-        can_matches = re.finditer(r'([a-z_]+)\s+can\s+([a-z_]+)', text)
+        can_matches = _CAN_RE.finditer(text)
         for match in can_matches:
             subject = match.group(1).strip()
             obj = match.group(2).strip()
@@ -375,7 +382,7 @@ class EmbeddedLLM:
             triplets.append({"subject": subject, "relation": "can_do", "object": obj})
             
         # Look for "X is Y" patterns (for properties)
-        is_prop_matches = re.finditer(r'([a-z_]+)\s+is\s+([a-z_]+)(?:\s+and\s+([a-z_]+))?', text)
+        is_prop_matches = _IS_PROPERTY_RE.finditer(text)
         for match in is_prop_matches:
             subject = match.group(1).strip()
             prop1 = match.group(2).strip()
@@ -1,93 +1,277 @@
 # ccai/nlp/extractor.py
 
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
 import spacy
-from spacy.tokens import Doc
+from spacy.language import Language
+from spacy.matcher import DependencyMatcher
+from spacy.tokens import Doc, DocBin, Span, Token
 
 from ccai.core.graph import ConceptGraph
 from ccai.core.models import ConceptNode, PropertySpec
 from ccai.nlp.primitives import PrimitiveManager
 
+# Pipeline components no extraction rule reads. The rules need the parser
+# for dep_ and sentences, the tagger and attribute ruler for pos_ and the
+# lemmatizer for lemma_. The senter is disabled by default, so excluding it
+# only saves loading its weights.
+EXCLUDED_COMPONENTS = ["ner", "senter"]
+
+# The spaCy pipeline shared by all extractors, loaded on first use
+_nlp: Optional[Language] = None
+
+# Dependency patterns of the relation rules. The first token of each
+# pattern is its anchor; a rule uses the first matching child of each kind,
+# like next() over token.children.
+_RELATION_PATTERNS = {
+    "IS_A": [
+        {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"DEP": "ROOT", "LEMMA": "be"}},
+        {"LEFT_ID": "verb", "REL_OP": ">", "RIGHT_ID": "subject",
+         "RIGHT_ATTRS": {"DEP": {"IN": ["nsubj", "nsubjpass"]}}},
+        {"LEFT_ID": "verb", "REL_OP": ">", "RIGHT_ID": "attribute", "RIGHT_ATTRS": {"DEP": "attr"}},
+    ],
+    "HAS_PART": [
+        {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"LEMMA": "have"}},
+        {"LEFT_ID": "verb", "REL_OP": ">", "RIGHT_ID": "subject", "RIGHT_ATTRS": {"DEP": "nsubj"}},
+        {"LEFT_ID": "verb", "REL_OP": ">", "RIGHT_ID": "object", "RIGHT_ATTRS": {"DEP": "dobj"}},
+    ],
+    "USED_FOR": [
+        {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"LEMMA": "use"}},
+        {"LEFT_ID": "verb", "REL_OP": "<", "RIGHT_ID": "be", "RIGHT_ATTRS": {"LEMMA": "be"}},
+        {"LEFT_ID": "be", "REL_OP": ">", "RIGHT_ID": "subject", "RIGHT_ATTRS": {"DEP": "nsubjpass"}},
+        {"LEFT_ID": "verb", "REL_OP": ">", "RIGHT_ID": "prep", "RIGHT_ATTRS": {"DEP": "prep", "ORTH": "for"}},
+        {"LEFT_ID": "prep", "REL_OP": ">", "RIGHT_ID": "purpose", "RIGHT_ATTRS": {}},
+    ],
+    "CAN_DO": [
+        {"RIGHT_ID": "modal", "RIGHT_ATTRS": {"LEMMA": "can", "DEP": "aux"}},
+        {"LEFT_ID": "modal", "REL_OP": "<", "RIGHT_ID": "action", "RIGHT_ATTRS": {}},
+        {"LEFT_ID": "action", "REL_OP": ">", "RIGHT_ID": "subject", "RIGHT_ATTRS": {"DEP": "nsubj"}},
+    ],
+    "AGENT_ACTION_OBJECT": [
+        {"RIGHT_ID": "verb", "RIGHT_ATTRS": {"POS": "VERB", "DEP": {"IN": ["ROOT", "ccomp", "xcomp"]}}},
+        {"LEFT_ID": "verb", "REL_OP": ">", "RIGHT_ID": "agent",
+         "RIGHT_ATTRS": {"DEP": {"IN": ["nsubj", "nsubj:pass"]}}},
+        {"LEFT_ID": "verb", "REL_OP": ">", "RIGHT_ID": "object", "RIGHT_ATTRS": {"DEP": "dobj"}},
+    ],
+}
+
+# Matches of each rule by anchor token index, as token indices in pattern order
+RelationMatches = Dict[str, Dict[int, Tuple[int, ...]]]
+
+
+def _get_nlp() -> Language:
+    """Loads the spaCy model the first time it is needed."""
+    global _nlp
+    if _nlp is None:
+        _nlp = spacy.load("en_core_web_sm", exclude=EXCLUDED_COMPONENTS)
+    return _nlp
+
+
 class InformationExtractor:
     """
     Processes natural language to extract a rich set of concepts,
     properties, and relationships, populating the concept graph.
     """
-    def __init__(self, graph: ConceptGraph, primitive_manager: PrimitiveManager):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, graph: ConceptGraph, primitive_manager: PrimitiveManager,
+                 nlp: Optional[Language] = None, doc_cache_size: int = 0):
         self.graph = graph
         self.primitives = primitive_manager
+        # A preloaded pipeline, e.g. shared between tests; None uses the
+        # module's pipeline
+        self._nlp = nlp
+        # LRU cache of parsed Docs by exact text, off when the size is 0
+        self.doc_cache_size = doc_cache_size
+        self._doc_cache: "OrderedDict[str, Doc]" = OrderedDict()
+        self._matcher: Optional[DependencyMatcher] = None
+
+    @property
+    def nlp(self) -> Language:
+        """The spaCy pipeline, loaded when the first text is processed."""
+        if self._nlp is None:
+            return _get_nlp()
+        return self._nlp
+
+    @property
+    def matcher(self) -> DependencyMatcher:
+        """The dependency matcher of the relation rules, built on first use."""
+        if self._matcher is None:
+            self._matcher = DependencyMatcher(self.nlp.vocab)
+            for label, pattern in _RELATION_PATTERNS.items():
+                self._matcher.add(label, [pattern])
+        return self._matcher
+
+    def reset(self, graph: ConceptGraph):
+        """Binds the extractor to another graph, keeping the loaded pipeline."""
+        self.graph = graph
+
+    def _parse(self, texts: List[str]) -> Iterable[Doc]:
+        """
+        Parses texts as a batch with nlp.pipe. With the Doc cache on, only
+        texts that were not parsed before are sent through the pipeline.
+        """
+        if not self.doc_cache_size:
+            return self.nlp.pipe(texts, batch_size=64)
+
+        missing = [text for text in dict.fromkeys(texts) if text not in self._doc_cache]
+        for text, doc in zip(missing, self.nlp.pipe(missing, batch_size=64)):
+            self._doc_cache[text] = doc
+
+        docs = []
+        for text in texts:
+            self._doc_cache.move_to_end(text)
+            docs.append(self._doc_cache[text])
+
+        self._evict_docs()
+        return docs
+
+    def _evict_docs(self):
+        """Drops the least recently used Docs beyond the cache size."""
+        while len(self._doc_cache) > self.doc_cache_size:
+            self._doc_cache.popitem(last=False)
+
+    def save_doc_cache(self, path: Path):
+        """Writes the cached Docs to a DocBin file, e.g. to reuse them in another run."""
+        DocBin(docs=self._doc_cache.values()).to_disk(path)
 
-    def ingest_text(self, text: str):
-        """Processes a block of text, running all extraction rules."""
-        doc = self.nlp(text)
+    def load_doc_cache(self, path: Path):
+        """
+        Adds the Docs of a file written by save_doc_cache to the cache. The
+        file must have been written with the same model, which is not checked.
+        Nothing is added if the file cannot be read.
+        """
+        docs = list(DocBin().from_disk(path).get_docs(self.nlp.vocab))
+        for doc in docs:
+            self._doc_cache[doc.text] = doc
+        self._evict_docs()
+
+    def ingest_text(self, text: Union[str, Iterable[str]]):
+        """Processes a block of text, or several, running all extraction rules."""
+        texts = [text] if isinstance(text, str) else text
+        self.ingest_texts(texts)
+
+    def ingest_texts(self, texts: Iterable[str]):
+        """
+        Processes several blocks of text, running all extraction rules.
+        The texts are parsed as one batch with nlp.pipe, and the rules run
+        on the sentences of that parse. Only the sentences derived from
+        relative clauses are parsed again, as a second batch.
+        """
         print("📝 Starting advanced information extraction...")
-        
-        # Pre-process the text to handle common patterns
-        # This helps with statements like "a dog is an animal that barks"
-        sentences = []
-        for sent in doc.sents:
-            # Check for compound statements with "that" clauses
-            sent_text = sent.text
-            if " that " in sent_text or " which " in sent_text:
-                # Split into base statement and properties
-                base_parts = sent_text.split(" that ", 1)
-                if len(base_parts) == 1:
-                    base_parts = sent_text.split(" which ", 1)
-                
-                if len(base_parts) > 1:
-                    base_statement = base_parts[0] + "."
-                    properties = base_parts[1]
-                    
-                    # Extract subject from base statement
-                    base_doc = self.nlp(base_statement)
-                    subject = None
-                    for token in base_doc:
-                        if token.dep_ in ("nsubj", "nsubjpass"):
-                            subject = token.text
-                            break
-                    
-                    # Create additional sentences for properties
-                    if subject:
-                        # Handle multiple properties separated by "and"
-                        property_parts = properties.split(" and ")
-                        for prop in property_parts:
-                            # Create a new sentence for each property
-                            if not prop.strip().endswith("."):
-                                prop = prop.strip() + "."
-                            
-                            # Add the subject if the property doesn't start with a pronoun
-                            prop_words = prop.split()
-                            if prop_words and prop_words[0].lower() not in ["it", "they", "he", "she"]:
-                                property_sent = f"{subject} {prop}"
-                            else:
-                                property_sent = prop
-                            
-                            sentences.append(property_sent)
-                    
-                    # Also keep the original sentence
-                    sentences.append(sent_text)
-                else:
-                    sentences.append(sent_text)
-            else:
-                sentences.append(sent_text)
-        
+
+        docs = list(self._parse(list(texts)))
+        matches_by_doc = {id(doc): self._match_relations(doc) for doc in docs}
+        sentences = self._split_sentences(docs)
+        derived_docs = iter(self._parse([s for s in sentences if isinstance(s, str)]))
+
         # Process all sentences (original and derived)
-        for sent_text in sentences:
-            sent_doc = self.nlp(sent_text)
-            for sent in sent_doc.sents:
-                # Run all specialized extraction rules on the sentence
-                self._extract_is_a(sent)
-                self._extract_has_part(sent)
-                self._extract_used_for(sent)
-                self._extract_can_do(sent)
-                self._extract_agent_action_object(sent)
-                self._extract_adjective_property(sent)
-                self._extract_alias(sent)
-                self._extract_compound_statement(sent)
-                self._extract_simple_properties(sent)
+        for sentence in sentences:
+            if isinstance(sentence, str):
+                sent_doc = next(derived_docs)
+                matches = self._match_relations(sent_doc)
+                for sent in sent_doc.sents:
+                    self._extract_sentence(sent, matches)
+            else:
+                self._extract_sentence(sentence, matches_by_doc[id(sentence.doc)])
         
         print("✅ Text ingestion complete.")
 
+    def _extract_sentence(self, sent: Span, matches: RelationMatches):
+        """Runs all specialized extraction rules on a sentence."""
+        self._extract_is_a(sent, matches)
+        self._extract_has_part(sent, matches)
+        self._extract_used_for(sent, matches)
+        self._extract_can_do(sent, matches)
+        self._extract_agent_action_object(sent, matches)
+        self._extract_adjective_property(sent)
+        self._extract_alias(sent)
+        self._extract_compound_statement(sent)
+        self._extract_simple_properties(sent)
+
+    def _match_relations(self, doc: Doc) -> RelationMatches:
+        """
+        Runs the dependency patterns of the relation rules over a parsed text.
+        The matcher yields every combination of matching children, so only
+        the one with the first child of each kind is kept per anchor token.
+        """
+        matches: RelationMatches = {label: {} for label in _RELATION_PATTERNS}
+        for match_id, token_ids in self.matcher(doc):
+            rule_matches = matches[doc.vocab.strings[match_id]]
+            token_ids = tuple(token_ids)
+            anchor = token_ids[0]
+            if anchor not in rule_matches or token_ids < rule_matches[anchor]:
+                rule_matches[anchor] = token_ids
+        return matches
+
+    @staticmethod
+    def _sentence_matches(matches: RelationMatches, label: str, sent: Span) -> List[Tuple[Token, ...]]:
+        """Returns the matches of a rule anchored in a sentence, in token order."""
+        return [
+            tuple(sent.doc[i] for i in token_ids)
+            for anchor, token_ids in sorted(matches[label].items())
+            if sent.start <= anchor < sent.end
+        ]
+
+    def _split_sentences(self, docs: List[Doc]) -> List[Union[Span, str]]:
+        """
+        Pre-processes parsed texts to handle common patterns.
+        This helps with statements like "a dog is an animal that barks",
+        which yield one extra sentence per property besides the original.
+        Returns the sentences in processing order: the original sentences
+        as spans of the parsed texts and the extra ones as text.
+        """
+        # Check for compound statements with "that" clauses and split them
+        # into base statement and properties
+        splits = []
+        for doc in docs:
+            for sent in doc.sents:
+                sent_text = sent.text
+                base_parts = [sent_text]
+                if " that " in sent_text or " which " in sent_text:
+                    base_parts = sent_text.split(" that ", 1)
+                    if len(base_parts) == 1:
+                        base_parts = sent_text.split(" which ", 1)
+                splits.append((sent, base_parts))
+
+        # The base statements are parsed as one batch to find their subjects
+        base_docs = iter(self._parse([parts[0] + "." for _, parts in splits if len(parts) > 1]))
+
+        sentences: List[Union[Span, str]] = []
+        for sent, base_parts in splits:
+            if len(base_parts) > 1:
+                properties = base_parts[1]
+                
+                # Extract subject from base statement
+                base_doc = next(base_docs)
+                subject = None
+                for token in base_doc:
+                    if token.dep_ in ("nsubj", "nsubjpass"):
+                        subject = token.text
+                        break
+                
+                # Create additional sentences for properties
+                if subject:
+                    # Handle multiple properties separated by "and"
+                    property_parts = properties.split(" and ")
+                    for prop in property_parts:
+                        # Create a new sentence for each property
+                        if not prop.strip().endswith("."):
+                            prop = prop.strip() + "."
+                        
+                        # Add the subject if the property doesn't start with a pronoun
+                        prop_words = prop.split()
+                        if prop_words and prop_words[0].lower() not in ["it", "they", "he", "she"]:
+                            property_sent = f"{subject} {prop}"
+                        else:
+                            property_sent = prop
+                        
+                        sentences.append(property_sent)
+
+            # Also keep the original sentence
+            sentences.append(sent)
+        return sentences
+
     def _get_or_create_node(self, name: str, ctype: str = "entity") -> ConceptNode:
         """Helper to retrieve a node or create it if it doesn't exist."""
         clean_name = name.lower().strip()
@@ -103,55 +287,38 @@ class InformationExtractor:
             self.graph.add_node(node)
         return node
 
-    def _extract_is_a(self, sent: Doc):
+    def _extract_is_a(self, sent: Span, matches: RelationMatches):
         """Extracts 'X is a Y' relationships where Y is a noun."""
-        for token in sent:
-            if token.dep_ == "ROOT" and token.lemma_ == "be":
-                subject = next((c for c in token.children if c.dep_ in ("nsubj", "nsubjpass")), None)
-                attribute = next((c for c in token.children if c.dep_ == "attr"), None)
-                if subject and attribute and attribute.pos_ in ("NOUN", "PROPN", "ADJ"):
-                    print(f"  -> Found IS-A: '{subject.text}' is a '{attribute.text}'")
-                    subj_node = self._get_or_create_node(subject.text)
-                    attr_node = self._get_or_create_node(attribute.text)
-                    self.graph.add_edge(subj_node.name, "is_a", attr_node.name)
+        for _, subject, attribute in self._sentence_matches(matches, "IS_A", sent):
+            if attribute.pos_ in ("NOUN", "PROPN", "ADJ"):
+                print(f"  -> Found IS-A: '{subject.text}' is a '{attribute.text}'")
+                subj_node = self._get_or_create_node(subject.text)
+                attr_node = self._get_or_create_node(attribute.text)
+                self.graph.add_edge(subj_node.name, "is_a", attr_node.name)
 
-    def _extract_has_part(self, sent: Doc):
+    def _extract_has_part(self, sent: Span, matches: RelationMatches):
         """Extracts 'X has Y' (composition) relationships."""
-        for token in sent:
-            if token.lemma_ == "have":
-                subject = next((c for c in token.children if c.dep_ == "nsubj"), None)
-                obj = next((c for c in token.children if c.dep_ == "dobj"), None)
-                if subject and obj:
-                    print(f"  -> Found HAS-PART: '{subject.text}' has '{obj.text}'")
-                    subj_node = self._get_or_create_node(subject.text)
-                    obj_node = self._get_or_create_node(obj.text)
-                    self.graph.add_edge(subj_node.name, "has_part", obj_node.name)
+        for _, subject, obj in self._sentence_matches(matches, "HAS_PART", sent):
+            print(f"  -> Found HAS-PART: '{subject.text}' has '{obj.text}'")
+            subj_node = self._get_or_create_node(subject.text)
+            obj_node = self._get_or_create_node(obj.text)
+            self.graph.add_edge(subj_node.name, "has_part", obj_node.name)
 
-    def _extract_used_for(self, sent: Doc):
+    def _extract_used_for(self, sent: Span, matches: RelationMatches):
         """Extracts 'X is used for Y' (purpose) relationships."""
-        for token in sent:
-            if token.lemma_ == "use" and token.head.lemma_ == "be":
-                subject = next((c for c in token.head.children if c.dep_ == "nsubjpass"), None)
-                purpose = next((p.children for p in token.children if p.dep_ == "prep" and p.text == "for"), None)
-                if subject and purpose:
-                    purpose_token = next(purpose, None)
-                    if purpose_token:
-                        print(f"  -> Found USED-FOR: '{subject.text}' is used for '{purpose_token.text}'")
-                        subj_node = self._get_or_create_node(subject.text)
-                        purpose_node = self._get_or_create_node(purpose_token.text, ctype="event")
-                        self.graph.add_edge(subj_node.name, "used_for", purpose_node.name)
-
-    def _extract_can_do(self, sent: Doc):
+        for _, _, subject, _, purpose_token in self._sentence_matches(matches, "USED_FOR", sent):
+            print(f"  -> Found USED-FOR: '{subject.text}' is used for '{purpose_token.text}'")
+            subj_node = self._get_or_create_node(subject.text)
+            purpose_node = self._get_or_create_node(purpose_token.text, ctype="event")
+            self.graph.add_edge(subj_node.name, "used_for", purpose_node.name)
+
+    def _extract_can_do(self, sent: Span, matches: RelationMatches):
         """Extracts 'X can do Y' (capability) relationships."""
-        for token in sent:
-            if token.lemma_ == "can" and token.dep_ == "aux":
-                subject = next((c for c in token.head.children if c.dep_ == "nsubj"), None)
-                action = token.head
-                if subject and action:
-                    print(f"  -> Found CAN-DO: '{subject.text}' can '{action.lemma_}'")
-                    subj_node = self._get_or_create_node(subject.text)
-                    action_node = self._get_or_create_node(action.lemma_, ctype="event")
-                    self.graph.add_edge(subj_node.name, "can_do", action_node.name)
+        for _, action, subject in self._sentence_matches(matches, "CAN_DO", sent):
+            print(f"  -> Found CAN-DO: '{subject.text}' can '{action.lemma_}'")
+            subj_node = self._get_or_create_node(subject.text)
+            action_node = self._get_or_create_node(action.lemma_, ctype="event")
+            self.graph.add_edge(subj_node.name, "can_do", action_node.name)
 
     def _extract_adjective_property(self, sent: Doc):
         """
@@ -161,7 +328,8 @@ class InformationExtractor:
             if token.pos_ == "ADJ" and token.dep_ in ("acomp", "amod"):
                 subject = token.head if token.dep_ == "amod" else next((c for c in token.head.children if c.dep_ == "nsubj"), None)
                 if subject:
-                    prop_value = token.text
+                    # spaCy keeps the lowercase form of each word in its vocabulary
+                    prop_value = token.lower_
                     primitive_info = self.primitives.get_info(prop_value)
                     if not primitive_info: continue
 
@@ -209,37 +377,27 @@ class InformationExtractor:
                 if subject and obj:
                     print(f"  -> Found ALIAS: '{subject.text}' is called '{obj.text}'")
                     node = self._get_or_create_node(subject.text)
-                    alias = obj.text.lower().strip()
-                    if alias not in node.aliases:
-                        node.aliases.append(alias)
+                    self.graph.add_alias(node.name, obj.text)
                         
-    def _extract_agent_action_object(self, sent: Doc):
+    def _extract_agent_action_object(self, sent: Span, matches: RelationMatches):
         """
         Extracts 'X does Y to Z' (agent-action-object) relationships.
         This captures active voice sentences where an agent performs an action on an object.
         """
-        for token in sent:
-            # Look for verbs that are the root of the sentence or a main verb
-            if token.pos_ == "VERB" and token.dep_ in ("ROOT", "ccomp", "xcomp"):
-                # Find the subject (agent)
-                agent = next((c for c in token.children if c.dep_ in ("nsubj", "nsubj:pass")), None)
-                
-                # Find the direct object
-                obj = next((c for c in token.children if c.dep_ == "dobj"), None)
-                
-                # If we have both agent and object, create the relationship
-                if agent and obj:
-                    action = token.lemma_
-                    print(f"  -> Found AGENT-ACTION-OBJECT: '{agent.text}' {action} '{obj.text}'")
-                    
-                    # Create or get nodes
-                    agent_node = self._get_or_create_node(agent.text, ctype="agent")
-                    action_node = self._get_or_create_node(action, ctype="event")
-                    obj_node = self._get_or_create_node(obj.text)
-                    
-                    # Add relationships
-                    self.graph.add_edge(agent_node.name, "performs", action_node.name)
-                    self.graph.add_edge(action_node.name, "affects", obj_node.name)
+        # Verbs that are the root of the sentence or a main verb, with an
+        # agent and a direct object
+        for token, agent, obj in self._sentence_matches(matches, "AGENT_ACTION_OBJECT", sent):
+            action = token.lemma_
+            print(f"  -> Found AGENT-ACTION-OBJECT: '{agent.text}' {action} '{obj.text}'")
+            
+            # Create or get nodes
+            agent_node = self._get_or_create_node(agent.text, ctype="agent")
+            action_node = self._get_or_create_node(action, ctype="event")
+            obj_node = self._get_or_create_node(obj.text)
+            
+            # Add relationships
+            self.graph.add_edge(agent_node.name, "performs", action_node.name)
+            self.graph.add_edge(action_node.name, "affects", obj_node.name)
     
     def _extract_simple_properties(self, sent: Doc):
         """
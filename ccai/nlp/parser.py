@@ -2,18 +2,36 @@
 
 import spacy
 import re
+from spacy.language import Language
 from spacy.tokens import Token, Span
 from typing import Optional, Dict, Any, List, Tuple
 
 from ccai.core.models import Signal
 
+# Definition requests with a single-word object, like "define car" or
+# "describe a knife", are answered without parsing
+_DEFINITION_RE = re.compile(r"^(?:define|describe|explain)\s+(?:(?:a|an|the)\s+)?([a-z_]+)$")
+
+# Words that make a question a comparison or a temporal question
+_COMPARISON_WORDS = ("compare", "comparison", "difference", "different", "similarities", "similar")
+_TEMPORAL_WORDS = ("before", "after", "during", "while")
+
 class QueryParser:
     """
     Uses NLP (spaCy) to parse natural language questions into structured
     Signal objects for the reasoning core.
     """
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+        self._nlp: Optional[Language] = None
+
+    @property
+    def nlp(self) -> Language:
+        """The spaCy pipeline, loaded when the first question needs parsing."""
+        if self._nlp is None:
+            # Named entities are never used and the parser already splits
+            # sentences; the intent rules need the parser, POS tags and lemmas
+            self._nlp = spacy.load("en_core_web_sm", exclude=["ner", "senter"])
+        return self._nlp
 
     def parse_question(self, text: str) -> Optional[Signal]:
         """
@@ -27,7 +45,17 @@ class QueryParser:
         cleaned = cleaned.replace("how's", "how is").replace("hows", "how is")
         cleaned = cleaned.replace("why's", "why is").replace("whys", "why is")
         
-        doc = self.nlp(cleaned.rstrip('?'))
+        cleaned = cleaned.rstrip('?')
+
+        # Simple definition requests don't need the model. Questions that
+        # could also be comparisons or temporal questions are still parsed.
+        definition_match = _DEFINITION_RE.match(cleaned)
+        if definition_match and not any(
+            word in cleaned for word in _COMPARISON_WORDS + _TEMPORAL_WORDS
+        ):
+            return Signal(origin=definition_match.group(1), purpose="QUERY", payload={"ask": "relation.is_a"})
+
+        doc = self.nlp(cleaned)
         
         try:
             sent = next(doc.sents)
@@ -133,8 +161,7 @@ class QueryParser:
     def _parse_comparison_question(self, sent: Span) -> Optional[Signal]:
         """Parse comparison questions like 'How does X compare to Y?' or 'What's the difference between X and Y?'"""
         # Check for comparison keywords
-        comparison_words = ["compare", "comparison", "difference", "different", "similarities", "similar"]
-        has_comparison = any(word in sent.text.lower() for word in comparison_words)
+        has_comparison = any(word in sent.text.lower() for word in _COMPARISON_WORDS)
         
         if not has_comparison:
             return None
@@ -204,8 +231,7 @@ class QueryParser:
         """Parse temporal questions like 'When did X happen?' or 'What happened before X?'"""
         # Check for temporal question words
         has_when = any(t.lower_ == "when" for t in sent)
-        temporal_words = ["before", "after", "during", "while"]
-        has_temporal = any(word in sent.text.lower() for word in temporal_words)
+        has_temporal = any(word in sent.text.lower() for word in _TEMPORAL_WORDS)
         
         if not (has_when or has_temporal):
             return None
@@ -226,7 +252,7 @@ class QueryParser:
             )
             
         # For before/after questions
-        for word in temporal_words:
+        for word in _TEMPORAL_WORDS:
             if word in sent.text.lower():
                 # Try to find the temporal reference
                 pattern = rf'{word}\s+([a-z\s]+)'
@@ -1,8 +1,35 @@
 # ccai/nlp/primitives.py
 
+import functools
 import json
+import os
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_primitives(path: str, mtime_ns: int) -> Mapping[str, Tuple[str, str]]:
+    """
+    Parses a primitives file into a map from words to (category, type).
+    The modification time is part of the cache key, so the file is only
+    parsed again when it changes. The map is shared by every manager of
+    the same file, so it is returned read-only.
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    category_map: Dict[str, Tuple[str, str]] = {}
+    for category_type in ['slots', 'tags']:
+        for major_category in data.get(category_type, {}).values():
+            for sub_category, words in major_category.items():
+                for word in words:
+                    # Normalized once here, so lookups of lowercase words are plain dict hits
+                    category_map[word.lower().strip()] = (sub_category, category_type)
+
+    print(f"✅ PrimitiveManager loaded {len(category_map)} primitives.")
+    return MappingProxyType(category_map)
+
 
 class PrimitiveManager:
     """
@@ -12,22 +39,15 @@ class PrimitiveManager:
     def __init__(self, primitives_file: Path):
         self.primitives_file = primitives_file
         # This now stores: { 'red': ('color', 'slots'), 'alive': ('state', 'tags') }
-        self._category_map: Dict[str, Tuple[str, str]] = {}
+        self._category_map: Mapping[str, Tuple[str, str]] = {}
         self._load_primitives()
 
     def _load_primitives(self):
         """Loads the JSON file and builds a reverse map for quick lookups."""
         try:
-            with open(self.primitives_file, 'r') as f:
-                data = json.load(f)
-            
-            for category_type in ['slots', 'tags']:
-                for major_category in data.get(category_type, {}).values():
-                    for sub_category, words in major_category.items():
-                        for word in words:
-                            self._category_map[word] = (sub_category, category_type)
-            
-            print(f"✅ PrimitiveManager loaded {len(self._category_map)} primitives.")
+            # The resolved path makes every spelling of the same file share one cache entry
+            path = Path(self.primitives_file).resolve()
+            self._category_map = _parse_primitives(str(path), os.stat(path).st_mtime_ns)
         except FileNotFoundError:
             print(f"⚠️ Warning: {self.primitives_file} not found. Primitive categorization will be disabled.")
         except json.JSONDecodeError:
@@ -35,7 +55,8 @@ class PrimitiveManager:
 
     def get_info(self, word: str) -> Optional[Tuple[str, str]]:
         """
-        Finds the primitive category and its type (slot/tag) for a given word.
+        Finds the primitive category and its type (slot/tag) for a given
+        lowercase word.
         e.g., get_info('red') -> ('color', 'slots')
         e.g., get_info('alive') -> ('state', 'tags')
         """
@@ -0,0 +1,35 @@
+"""
+Root pytest configuration.
+
+Having a conftest.py at the project root makes pytest put the root on
+``sys.path`` once, so the ``ccai`` and ``ira`` packages import without
+per-module ``sys.path`` manipulation.
+
+Tests marked ``network`` need internet access and are skipped unless
+pytest is run with ``--run-network``.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked with 'network', which need internet access",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: the test needs internet access")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the network tests unless --run-network is given."""
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
@@ -30,8 +30,9 @@ try:
     nltk.data.find('tokenizers/punkt_tab')
 except LookupError:
     print("Downloading punkt_tab tokenizer...")
-    # The punkt_tab resource is part of the 'all' package
-    nltk.download('all')
+    # Fall back to punkt on NLTK releases whose index has no punkt_tab
+    if not nltk.download('punkt_tab', quiet=True):
+        nltk.download('punkt', quiet=True)
 
 try:
     nltk.data.find('corpora/stopwords')
@@ -6,9 +6,10 @@ of a conversation in the IRA (Ideom Resolver AI) architecture.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
 from enum import Enum, auto
+import time
 import uuid
 
 
@@ -20,24 +21,96 @@ class MessageType(Enum):
     SYSTEM = auto()
 
 
-@dataclass
 class Message:
     """
     A message in a conversation.
     
+    Messages are created and serialized for every conversation turn, so the
+    class uses ``__slots__`` instead of a per-instance ``__dict__``.
+    
     Attributes:
         id: A unique identifier for the message.
         content: The content of the message.
         type: The type of the message (user or system).
-        timestamp: The time the message was created.
+        timestamp: The time the message was created, in nanoseconds since the epoch.
         metadata: Additional metadata for the message.
     """
     
-    id: str
-    content: str
-    type: MessageType
-    timestamp: datetime
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    __slots__ = ("id", "content", "type", "timestamp", "metadata")
+    
+    def __init__(
+        self,
+        content: str,
+        type: MessageType,
+        timestamp: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        id: Optional[str] = None
+    ):
+        """
+        Initialize a message.
+        
+        Args:
+            content: The content of the message.
+            type: The type of the message (user or system).
+            timestamp: The time the message was created, in nanoseconds since the
+                epoch, or None to use the current time.
+            metadata: Additional metadata for the message.
+            id: A unique identifier for the message, or None to generate one.
+        """
+        self.id = id if id is not None else str(uuid.uuid4())
+        self.content = content
+        self.type = type
+        # time.time_ns() is much cheaper than datetime.now() and needs no
+        # conversion when the message is serialized
+        self.timestamp = timestamp if timestamp is not None else time.time_ns()
+        self.metadata = metadata if metadata is not None else {}
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return (self.id, self.content, self.type, self.timestamp, self.metadata) == \
+            (other.id, other.content, other.type, other.timestamp, other.metadata)
+    
+    def __repr__(self) -> str:
+        return (f"Message(id={self.id!r}, content={self.content!r}, type={self.type}, "
+                f"timestamp={self.timestamp!r}, metadata={self.metadata!r})")
+    
+    def to_tuple(self) -> Tuple[str, str, int, int, Dict[str, Any]]:
+        """
+        Convert to a compact tuple for serialization.
+        
+        Returns:
+            A tuple of (id, content, type value, timestamp in nanoseconds, metadata).
+        """
+        return (self.id, self.content, self.type.value, self.timestamp, self.metadata)
+    
+    @classmethod
+    def from_tuple(cls, data: Sequence[Any]) -> 'Message':
+        """
+        Create a Message instance from a tuple produced by ``to_tuple``.
+        
+        The instance is built without calling ``__init__`` since the data
+        comes from a previous serialization and needs no defaults.
+        
+        Args:
+            data: A sequence of (id, content, type value, timestamp in nanoseconds, metadata).
+            
+        Returns:
+            A new Message instance.
+        """
+        message = cls.__new__(cls)
+        message.id, message.content, type_value, message.timestamp, message.metadata = data
+        message.type = MessageType(type_value)
+        return message
+    
+    def get_datetime(self) -> datetime:
+        """
+        Get the time the message was created as a datetime.
+        
+        Returns:
+            The creation time as a naive local datetime.
+        """
+        return datetime.fromtimestamp(self.timestamp / 1e9)
     
     @classmethod
     def create_user_message(cls, content: str, metadata: Optional[Dict[str, Any]] = None) -> 'Message':
@@ -52,11 +125,9 @@ class Message:
             A new Message instance.
         """
         return cls(
-            id=str(uuid.uuid4()),
             content=content,
             type=MessageType.USER,
-            timestamp=datetime.now(),
-            metadata=metadata or {}
+            metadata=metadata
         )
     
     @classmethod
@@ -72,11 +143,9 @@ class Message:
             A new Message instance.
         """
         return cls(
-            id=str(uuid.uuid4()),
             content=content,
             type=MessageType.SYSTEM,
-            timestamp=datetime.now(),
-            metadata=metadata or {}
+            metadata=metadata
         )
 
 
@@ -258,16 +327,7 @@ class ConversationContext:
         """
         return {
             "id": self.id,
-            "messages": [
-                {
-                    "id": message.id,
-                    "content": message.content,
-                    "type": message.type.name,
-                    "timestamp": message.timestamp.isoformat(),
-                    "metadata": message.metadata
-                }
-                for message in self.messages
-            ],
+            "messages": [message.to_tuple() for message in self.messages],
             "state": self.state.name,
             "metadata": self.metadata,
             "created_at": self.created_at.isoformat(),
@@ -294,13 +354,18 @@ class ConversationContext:
         )
         
         for message_data in data["messages"]:
-            message = Message(
-                id=message_data["id"],
-                content=message_data["content"],
-                type=MessageType[message_data["type"]],
-                timestamp=datetime.fromisoformat(message_data["timestamp"]),
-                metadata=message_data["metadata"]
-            )
+            if isinstance(message_data, dict):
+                # Older memory files store each message as a dictionary
+                timestamp = datetime.fromisoformat(message_data["timestamp"])
+                message = Message(
+                    id=message_data["id"],
+                    content=message_data["content"],
+                    type=MessageType[message_data["type"]],
+                    timestamp=int(timestamp.timestamp()) * 1_000_000_000 + timestamp.microsecond * 1000,
+                    metadata=message_data["metadata"]
+                )
+            else:
+                message = Message.from_tuple(message_data)
             context.messages.append(message)
         
         return context
\ No newline at end of file
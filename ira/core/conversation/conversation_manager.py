@@ -101,7 +101,7 @@ class ConversationManager:
         context = self._get_or_create_context(context_id)
         
         # Add the user message to the context
-        context.add_message(Message.create_user_message(
+        self.memory_manager.append_message(context.id, Message.create_user_message(
             content=message
         ))
         
@@ -132,15 +132,19 @@ class ConversationManager:
                 response = response_plan.content
         
         # Add the response to the context
-        context.add_message(Message.create_system_message(
+        self.memory_manager.append_message(context.id, Message.create_system_message(
             content=response
         ))
         
         # Update the context state
         context.state = ConversationState.ACTIVE
         
-        # Save the memory
-        self.memory_manager.save_memory()
+        # Commands can change the context in ways the change log does not
+        # record, so save a full snapshot after them
+        if command_match:
+            self.memory_manager.save_memory()
+        else:
+            self.memory_manager.update_context(context.id)
         
         return response
     
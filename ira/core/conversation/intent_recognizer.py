@@ -56,6 +56,59 @@ class Intent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Regex patterns for intent types that are not recognized by phrase lookup.
+# They are compiled once at import time and tried in order.
+_INTENT_PATTERNS: Tuple[Tuple[IntentType, re.Pattern], ...] = (
+    (IntentType.QUERY, re.compile(r"^(?:what|who|where|when|why|how|is|are|can|could|would|will|do|does|did|has|have|had)\b.*\?$", re.IGNORECASE)),
+    (IntentType.QUERY, re.compile(r"^(?:tell me|show me|explain|describe|define)\b.*$", re.IGNORECASE)),
+    (IntentType.QUERY, re.compile(r".*\?$")),
+    (IntentType.COMMAND, re.compile(r"^(?:please|kindly|)?\s*(?:do|make|create|generate|find|search|look up|calculate|compute|analyze|summarize|translate|convert|transform)\b.*$", re.IGNORECASE)),
+    (IntentType.STATEMENT, re.compile(r"^(?:i|we|they|he|she|it|this|that|these|those)\b.*$", re.IGNORECASE)),
+    (IntentType.STATEMENT, re.compile(r"^(?:yes|no|maybe|perhaps|possibly|certainly|definitely|absolutely|indeed)\b.*$", re.IGNORECASE)),
+)
+
+# The built-in intent patterns joined into a single alternation with one
+# named group per pattern, so a single match call finds the first pattern
+# that matches. Custom patterns are matched one by one instead, since their
+# group names, inline flags or backreferences may not survive being joined.
+_INTENT_UNION = re.compile(
+    "|".join(f"(?P<p{i}>{pattern.pattern})" for i, (_, pattern) in enumerate(_INTENT_PATTERNS)),
+    re.IGNORECASE
+)
+_INTENT_UNION_TYPES = [intent_type for intent_type, _ in _INTENT_PATTERNS]
+
+# The built-in patterns grouped by intent type, as in intent_patterns
+_DEFAULT_INTENT_PATTERNS: Dict[IntentType, List[re.Pattern]] = {
+    intent_type: [pattern for pattern_type, pattern in _INTENT_PATTERNS if pattern_type == intent_type]
+    for intent_type in dict.fromkeys(intent_type for intent_type, _ in _INTENT_PATTERNS)
+}
+
+_GREETING_PHRASES = frozenset({
+    "hello", "hi", "hey", "greetings", "good morning", "good afternoon", "good evening",
+    "howdy", "what's up", "how are you", "how's it going", "nice to meet you", "pleasure to meet you"
+})
+
+_FAREWELL_PHRASES = frozenset({
+    "goodbye", "bye", "see you", "farewell", "take care", "have a nice day", "have a good one",
+    "until next time", "catch you later", "talk to you later", "later", "good night"
+})
+
+_AFFIRMATION_PHRASES = frozenset({
+    "yes", "yeah", "yep", "yup", "sure", "certainly", "definitely", "absolutely", "indeed",
+    "correct", "right", "true", "ok", "okay", "alright", "fine", "agreed", "roger that"
+})
+
+_NEGATION_PHRASES = frozenset({
+    "no", "nope", "nah", "not", "never", "negative", "disagree", "incorrect", "wrong", "false"
+})
+
+# Patterns used for entity extraction
+_QUERY_SUBJECT_PATTERN = re.compile(r"(?:what|who|where|when|why|how) (?:is|are|was|were) (.*?)(?:\?|$)", re.IGNORECASE)
+_QUERY_TYPE_PATTERN = re.compile(r"^(what|who|where|when|why|how)\b", re.IGNORECASE)
+_COMMAND_VERB_PATTERN = re.compile(r"^(?:please|kindly|)?\s*(do|make|create|generate|find|search|look up|calculate|compute|analyze|summarize|translate|convert|transform)\b", re.IGNORECASE)
+_COMMAND_OBJECT_PATTERN = re.compile(r"^(?:please|kindly|)?\s*(?:do|make|create|generate|find|search|look up|calculate|compute|analyze|summarize|translate|convert|transform)\s+(.*?)(?:\.|\?|$)", re.IGNORECASE)
+
+
 @dataclass
 class IntentRecognizer:
     """
@@ -65,6 +118,8 @@ class IntentRecognizer:
     
     Attributes:
         intent_patterns: A dictionary mapping intent types to lists of regex patterns.
+            The built-in patterns are matched all at once through a
+            precompiled union; custom patterns are matched one by one.
         greeting_phrases: A set of greeting phrases.
         farewell_phrases: A set of farewell phrases.
         affirmation_phrases: A set of affirmation phrases.
@@ -79,41 +134,32 @@ class IntentRecognizer:
     
     def __post_init__(self):
         """Initialize the intent patterns and phrase sets."""
-        # Initialize intent patterns
-        self.intent_patterns = {
-            IntentType.QUERY: [
-                re.compile(r"^(?:what|who|where|when|why|how|is|are|can|could|would|will|do|does|did|has|have|had)\b.*\?$", re.IGNORECASE),
-                re.compile(r"^(?:tell me|show me|explain|describe|define)\b.*$", re.IGNORECASE),
-                re.compile(r".*\?$")
-            ],
-            IntentType.COMMAND: [
-                re.compile(r"^(?:please|kindly|)?\s*(?:do|make|create|generate|find|search|look up|calculate|compute|analyze|summarize|translate|convert|transform)\b.*$", re.IGNORECASE)
-            ],
-            IntentType.STATEMENT: [
-                re.compile(r"^(?:i|we|they|he|she|it|this|that|these|those)\b.*$", re.IGNORECASE),
-                re.compile(r"^(?:yes|no|maybe|perhaps|possibly|certainly|definitely|absolutely|indeed)\b.*$", re.IGNORECASE)
-            ]
-        }
+        # Initialize intent patterns from the precompiled table, unless custom
+        # patterns were given
+        if not self.intent_patterns:
+            self.intent_patterns = {
+                intent_type: list(patterns) for intent_type, patterns in _DEFAULT_INTENT_PATTERNS.items()
+            }
         
         # Initialize phrase sets
-        self.greeting_phrases = {
-            "hello", "hi", "hey", "greetings", "good morning", "good afternoon", "good evening",
-            "howdy", "what's up", "how are you", "how's it going", "nice to meet you", "pleasure to meet you"
-        }
-        
-        self.farewell_phrases = {
-            "goodbye", "bye", "see you", "farewell", "take care", "have a nice day", "have a good one",
-            "until next time", "catch you later", "talk to you later", "later", "good night"
-        }
-        
-        self.affirmation_phrases = {
-            "yes", "yeah", "yep", "yup", "sure", "certainly", "definitely", "absolutely", "indeed",
-            "correct", "right", "true", "ok", "okay", "alright", "fine", "agreed", "roger that"
-        }
+        self.greeting_phrases = set(_GREETING_PHRASES)
+        self.farewell_phrases = set(_FAREWELL_PHRASES)
+        self.affirmation_phrases = set(_AFFIRMATION_PHRASES)
+        self.negation_phrases = set(_NEGATION_PHRASES)
+    
+    def _match_phrases(self, content: str, phrases: Set[str]) -> bool:
+        """
+        Check whether the content is, or starts with, one of the phrases.
         
-        self.negation_phrases = {
-            "no", "nope", "nah", "not", "never", "negative", "disagree", "incorrect", "wrong", "false"
-        }
+        Args:
+            content: The normalized message content.
+            phrases: The phrase set to check.
+            
+        Returns:
+            True if the content matches one of the phrases, False otherwise.
+        """
+        # str.startswith with a tuple checks all prefixes in a single call
+        return content in phrases or content.startswith(tuple(phrases))
     
     def recognize_intent(self, message, context: Optional[ConversationContext] = None) -> Intent:
         """
@@ -137,30 +183,37 @@ class IntentRecognizer:
             content = str(message).strip().lower()
         
         # Check for greeting
-        if content in self.greeting_phrases or any(content.startswith(phrase) for phrase in self.greeting_phrases):
+        if self._match_phrases(content, self.greeting_phrases):
             return Intent(type=IntentType.GREETING, confidence=0.9)
         
         # Check for farewell
-        if content in self.farewell_phrases or any(content.startswith(phrase) for phrase in self.farewell_phrases):
+        if self._match_phrases(content, self.farewell_phrases):
             return Intent(type=IntentType.FAREWELL, confidence=0.9)
         
         # Check for affirmation
-        if content in self.affirmation_phrases or any(content.startswith(phrase) for phrase in self.affirmation_phrases):
+        if self._match_phrases(content, self.affirmation_phrases):
             return Intent(type=IntentType.AFFIRMATION, confidence=0.9)
         
         # Check for negation
-        if content in self.negation_phrases or any(content.startswith(phrase) for phrase in self.negation_phrases):
+        if self._match_phrases(content, self.negation_phrases):
             return Intent(type=IntentType.NEGATION, confidence=0.9)
         
         # Check for clarification
         if "what do you mean" in content or "i don't understand" in content or "can you explain" in content:
             return Intent(type=IntentType.CLARIFICATION, confidence=0.8)
         
-        # Check for other intent types
-        for intent_type, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                if pattern.match(content):
-                    return Intent(type=intent_type, confidence=0.7)
+        # Check for other intent types. With the built-in patterns, the named
+        # group of the union that matched tells which of the patterns won.
+        if self.intent_patterns == _DEFAULT_INTENT_PATTERNS:
+            match = _INTENT_UNION.match(content)
+            if match:
+                intent_type = _INTENT_UNION_TYPES[int(match.lastgroup[1:])]
+                return Intent(type=intent_type, confidence=0.7)
+        else:
+            for intent_type, patterns in self.intent_patterns.items():
+                for pattern in patterns:
+                    if pattern.match(content):
+                        return Intent(type=intent_type, confidence=0.7)
         
         # Default to unknown intent
         return Intent(type=IntentType.UNKNOWN, confidence=0.5)
@@ -186,32 +239,23 @@ class IntentRecognizer:
         
         if intent.type == IntentType.QUERY:
             # Extract subject of the query
-            match = re.search(r"(?:what|who|where|when|why|how) (?:is|are|was|were) (.*?)(?:\?|$)", content, re.IGNORECASE)
+            match = _QUERY_SUBJECT_PATTERN.search(content)
             if match:
                 entities["subject"] = match.group(1).strip()
             
             # Extract query type
-            if re.search(r"^what\b", content, re.IGNORECASE):
-                entities["query_type"] = "what"
-            elif re.search(r"^who\b", content, re.IGNORECASE):
-                entities["query_type"] = "who"
-            elif re.search(r"^where\b", content, re.IGNORECASE):
-                entities["query_type"] = "where"
-            elif re.search(r"^when\b", content, re.IGNORECASE):
-                entities["query_type"] = "when"
-            elif re.search(r"^why\b", content, re.IGNORECASE):
-                entities["query_type"] = "why"
-            elif re.search(r"^how\b", content, re.IGNORECASE):
-                entities["query_type"] = "how"
+            match = _QUERY_TYPE_PATTERN.search(content)
+            if match:
+                entities["query_type"] = match.group(1).lower()
         
         elif intent.type == IntentType.COMMAND:
             # Extract command verb
-            match = re.search(r"^(?:please|kindly|)?\s*(do|make|create|generate|find|search|look up|calculate|compute|analyze|summarize|translate|convert|transform)\b", content, re.IGNORECASE)
+            match = _COMMAND_VERB_PATTERN.search(content)
             if match:
                 entities["command_verb"] = match.group(1).strip().lower()
             
             # Extract command object
-            match = re.search(r"^(?:please|kindly|)?\s*(?:do|make|create|generate|find|search|look up|calculate|compute|analyze|summarize|translate|convert|transform)\s+(.*?)(?:\.|\?|$)", content, re.IGNORECASE)
+            match = _COMMAND_OBJECT_PATTERN.search(content)
             if match:
                 entities["command_object"] = match.group(1).strip()
         
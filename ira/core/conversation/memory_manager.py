@@ -6,13 +6,70 @@ of the conversation system in the IRA (Ideom Resolver AI) architecture.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable, BinaryIO
+import io
 import json
-import os
+import time
 from datetime import datetime
 from .conversation_context import ConversationContext, Message, MessageType, ConversationState
 
 
+class InMemoryStorage:
+    """
+    An in-memory replacement for the files used by a MemoryManager.
+    
+    Calling the storage with a path and a binary file mode returns a file-like
+    object, like ``open(path, mode)`` would. Data written to a stream is kept
+    per path when the stream is closed and returned by the next stream opened
+    for reading. This lets several MemoryManager instances share memory
+    without touching the filesystem.
+    
+    Attributes:
+        files: A dictionary mapping paths to their stored bytes.
+    """
+    
+    def __init__(self):
+        """Initialize an empty in-memory storage."""
+        self.files: Dict[str, bytes] = {}
+    
+    def __call__(self, path: str, mode: str) -> BinaryIO:
+        """
+        Open a file in the storage.
+        
+        Args:
+            path: The path of the file.
+            mode: The file mode, one of "rb", "wb" or "ab".
+            
+        Returns:
+            A binary file-like object.
+            
+        Raises:
+            FileNotFoundError: If a file is opened for reading before anything was written to it.
+        """
+        if "w" in mode:
+            return _StorageWriter(self, path)
+        if "a" in mode:
+            return _StorageWriter(self, path, self.files.get(path, b""))
+        if path not in self.files:
+            raise FileNotFoundError(f"No such file in the in-memory storage: '{path}'")
+        return io.BytesIO(self.files[path])
+
+
+class _StorageWriter(io.BytesIO):
+    """A BytesIO that commits its contents to an InMemoryStorage when closed."""
+    
+    def __init__(self, storage: InMemoryStorage, path: str, initial_data: bytes = b""):
+        super().__init__(initial_data)
+        self.seek(0, io.SEEK_END)
+        self._storage = storage
+        self._path = path
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._storage.files[self._path] = self.getvalue()
+        super().close()
+
+
 @dataclass
 class MemoryManager:
     """
@@ -21,17 +78,32 @@ class MemoryManager:
     The MemoryManager class is responsible for storing and retrieving
     conversation contexts and other relevant information.
     
+    The memory is persisted as a snapshot in ``memory_file`` plus a change log
+    in ``log_file``. ``append_message``, ``create_context``, ``update_context``
+    and ``delete_context`` only append one line to the log; ``save_memory``
+    writes a full snapshot and empties the log, and runs automatically once
+    the log holds ``compaction_threshold`` entries.
+    
     Attributes:
         contexts: A dictionary mapping conversation IDs to ConversationContext instances.
         active_context_id: The ID of the currently active conversation context.
-        memory_file: The path to the file where memory is stored.
+        memory_file: The path to the file where the memory snapshot is stored.
         max_contexts: The maximum number of conversation contexts to keep in memory.
+        storage: A callable with the signature of ``open(path, mode)`` used to
+            open the memory files in binary mode.
+        log_file: The path to the append-only change log (NDJSON).
+        compaction_threshold: The number of logged changes after which the
+            log is compacted into a new snapshot.
     """
     
     contexts: Dict[str, ConversationContext] = field(default_factory=dict)
     active_context_id: Optional[str] = None
     memory_file: str = "conversation_memory.json"
     max_contexts: int = 100
+    storage: Callable[[str, str], BinaryIO] = open
+    log_file: str = "conversation_memory.log.ndjson"
+    compaction_threshold: int = 100
+    _log_entries: int = field(default=0, init=False, repr=False)
     
     def create_context(self) -> ConversationContext:
         """
@@ -43,6 +115,7 @@ class MemoryManager:
         context = ConversationContext()
         self.contexts[context.id] = context
         self.active_context_id = context.id
+        self._log_context(context)
         
         # If we have too many contexts, remove the oldest ones
         if len(self.contexts) > self.max_contexts:
@@ -50,6 +123,25 @@ class MemoryManager:
         
         return context
     
+    def update_context(self, context_id: str) -> bool:
+        """
+        Record the state, metadata and timestamps of a conversation context.
+        
+        Call this after changing a context outside of ``append_message`` so
+        the change survives a reload.
+        
+        Args:
+            context_id: The ID of the conversation context.
+            
+        Returns:
+            True if the context was recorded, False if it doesn't exist.
+        """
+        context = self.get_context(context_id)
+        if context is None:
+            return False
+        self._log_context(context)
+        return True
+    
     def get_context(self, context_id: str) -> Optional[ConversationContext]:
         """
         Get a conversation context by ID.
@@ -106,6 +198,8 @@ class MemoryManager:
         if self.active_context_id == context_id:
             self.active_context_id = None
         
+        self._append_log({"ts": time.time(), "context_id": context_id, "deleted": True})
+        
         return True
     
     def _prune_contexts(self) -> None:
@@ -122,21 +216,85 @@ class MemoryManager:
         contexts_to_keep = sorted_contexts[-self.max_contexts:]
         
         # Update the contexts dictionary
+        pruned_ids = [context_id for context_id, _ in sorted_contexts[:-self.max_contexts]]
         self.contexts = {context_id: context for context_id, context in contexts_to_keep}
+        for context_id in pruned_ids:
+            self._append_log({"ts": time.time(), "context_id": context_id, "deleted": True})
         
         # If the active context was pruned, set active_context_id to None
         if self.active_context_id not in self.contexts:
             self.active_context_id = None
     
+    def append_message(self, context_id: str, message: Message) -> bool:
+        """
+        Add a message to a conversation context and append it to the message log.
+        
+        Only the new message is written, so the cost does not grow with the
+        size of the memory.
+        
+        Args:
+            context_id: The ID of the conversation context.
+            message: The message to add.
+            
+        Returns:
+            True if the message was added, False if the context doesn't exist.
+        """
+        context = self.get_context(context_id)
+        if context is None:
+            return False
+        
+        context.add_message(message)
+        
+        self._append_log({
+            "ts": time.time(),
+            "context_id": context_id,
+            "message": message.to_tuple()
+        })
+        
+        return True
+    
+    def _log_context(self, context: ConversationContext) -> None:
+        """
+        Append the fields of a context, without its messages, to the change log.
+        
+        Args:
+            context: The conversation context.
+        """
+        fields = context.to_dict()
+        del fields["messages"]
+        self._append_log({"ts": time.time(), "context_id": context.id, "context": fields})
+    
+    def _append_log(self, entry: Dict[str, Any]) -> None:
+        """
+        Append one entry to the change log, compacting the log when it is full.
+        
+        Args:
+            entry: The JSON-serializable log entry.
+        """
+        try:
+            with self.storage(self.log_file, "ab") as f:
+                f.write((json.dumps(entry) + "\n").encode("utf-8"))
+        except Exception as e:
+            print(f"Error appending to the memory log: {e}")
+            return
+        
+        self._log_entries += 1
+        if self._log_entries >= self.compaction_threshold:
+            self.save_memory()
+    
     def save_memory(self) -> bool:
         """
         Save the memory to a file.
         
+        This writes a full snapshot and empties the message log, whose
+        entries are included in the snapshot.
+        
         Returns:
             True if the memory was saved successfully, False otherwise.
         """
         try:
             memory_data = {
+                "timestamp": time.time(),
                 "active_context_id": self.active_context_id,
                 "contexts": {
                     context_id: context.to_dict()
@@ -144,8 +302,13 @@ class MemoryManager:
                 }
             }
             
-            with open(self.memory_file, "w") as f:
-                json.dump(memory_data, f, indent=2)
+            with self.storage(self.memory_file, "wb") as f:
+                f.write(json.dumps(memory_data, indent=2).encode("utf-8"))
+            
+            # Every logged change is part of the snapshot now
+            with self.storage(self.log_file, "wb"):
+                pass
+            self._log_entries = 0
             
             return True
         except Exception as e:
@@ -156,15 +319,29 @@ class MemoryManager:
         """
         Load the memory from a file.
         
+        The snapshot is loaded first, then the changes logged after it are
+        replayed.
+        
         Returns:
             True if the memory was loaded successfully, False otherwise.
         """
-        if not os.path.exists(self.memory_file):
+        try:
+            with self.storage(self.memory_file, "rb") as f:
+                raw_data = f.read()
+        except FileNotFoundError:
+            raw_data = None
+        
+        try:
+            with self.storage(self.log_file, "rb") as f:
+                log_data = f.read()
+        except FileNotFoundError:
+            log_data = b""
+        
+        if raw_data is None and not log_data:
             return False
         
         try:
-            with open(self.memory_file, "r") as f:
-                memory_data = json.load(f)
+            memory_data = json.loads(raw_data.decode("utf-8")) if raw_data is not None else {}
             
             self.active_context_id = memory_data.get("active_context_id")
             
@@ -172,11 +349,65 @@ class MemoryManager:
             for context_id, context_data in memory_data.get("contexts", {}).items():
                 self.contexts[context_id] = ConversationContext.from_dict(context_data)
             
+            self._replay_log(log_data.decode("utf-8").splitlines(), memory_data.get("timestamp", 0.0))
+            
             return True
         except Exception as e:
             print(f"Error loading memory: {e}")
             return False
     
+    def _replay_log(self, lines: List[str], timestamp: float) -> None:
+        """
+        Apply the logged changes that were written after a snapshot.
+        
+        Args:
+            lines: The lines of the change log.
+            timestamp: The time the snapshot was written.
+        """
+        self._log_entries = 0
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Ignore corrupted lines, e.g. from an interrupted write
+                continue
+            
+            self._log_entries += 1
+            if entry.get("ts", 0.0) <= timestamp:
+                continue
+            
+            context_id = entry["context_id"]
+            if entry.get("deleted"):
+                self.contexts.pop(context_id, None)
+                if self.active_context_id == context_id:
+                    self.active_context_id = None
+                continue
+            
+            context = self.contexts.get(context_id)
+            if "context" in entry:
+                fields = dict(entry["context"], messages=[])
+                replayed = ConversationContext.from_dict(fields)
+                if context is None:
+                    # The context was created after the snapshot
+                    self.contexts[context_id] = replayed
+                    self.active_context_id = context_id
+                else:
+                    context.state = replayed.state
+                    context.metadata = replayed.metadata
+                    context.created_at = replayed.created_at
+                    context.updated_at = replayed.updated_at
+                continue
+            
+            if context is None:
+                # Logs written before contexts were logged have no creation entry
+                context = ConversationContext(id=context_id)
+                self.contexts[context_id] = context
+            
+            message = Message.from_tuple(entry["message"])
+            context.messages.append(message)
+            context.updated_at = message.get_datetime()
+            self.active_context_id = context_id
+    
     def get_all_contexts(self) -> List[ConversationContext]:
         """
         Get all conversation contexts.
@@ -7,6 +7,7 @@ with the Knowledge Graph, enabling knowledge-based reasoning.
 
 from typing import Dict, List, Any, Optional, Tuple, Set
 import re
+import uuid
 from datetime import datetime
 
 from ..knowledge.knowledge_graph import KnowledgeGraph
@@ -231,42 +232,39 @@ class ReasoningKnowledgeIntegration:
         # Get all concepts from the Knowledge Graph
         concepts = self.knowledge_graph.get_all_concepts()
         
-        # Create ideoms for each concept
-        ideoms_created = []
-        for concept in concepts:
-            # Check if an ideom with this name already exists
-            existing_ideoms = self.reasoning_core.ideom_network.get_ideoms_by_name(concept.name)
-            if not existing_ideoms:
-                # Create a new ideom
-                ideom = self.reasoning_core.create_ideom(concept.name)
-                ideoms_created.append(ideom.name)
+        ideom_network = self.reasoning_core.ideom_network
+        
+        # Create the ideoms for all concept names without one in a single batch
+        concept_names = list(dict.fromkeys(concept.name for concept in concepts))
+        ideoms_created = [name for name in concept_names if not ideom_network.get_ideom_ids_by_name(name)]
+        ideom_network.add_ideoms_bulk(ideoms_created)
         
         # Create connections between ideoms based on concept relations
         connections_created = []
         for concept in concepts:
-            # Get all relations for the concept
             # Get all relations for the concept
             relations = []
             for relation_type in concept.get_relation_types():
                 relations.extend(concept.get_relations(relation_type))
             
             for relation in relations:
+                target_concept = self.knowledge_graph.get_concept_by_id(relation.target_concept_id)
+                if target_concept is None:
+                    continue
+                
                 # Get the ideoms for the source and target concepts
-                source_ideoms = self.reasoning_core.ideom_network.get_ideoms_by_name(concept.name)
-                target_ideoms = self.reasoning_core.ideom_network.get_ideoms_by_name(relation.target.name)
+                source_ideom_ids = ideom_network.get_ideom_ids_by_name(concept.name)
+                target_ideom_ids = ideom_network.get_ideom_ids_by_name(target_concept.name)
                 
-                if source_ideoms and target_ideoms:
-                    source_ideom = source_ideoms[0]
-                    target_ideom = target_ideoms[0]
-                    
+                if source_ideom_ids and target_ideom_ids:
                     # Create a connection between the ideoms
                     connection_strength = 0.7  # Default connection strength
-                    self.reasoning_core.ideom_network.connect_ideoms(
-                        source_ideom.id, target_ideom.id, connection_strength
+                    ideom_network.connect_ideoms(
+                        source_ideom_ids[0], target_ideom_ids[0], connection_strength
                     )
                     connections_created.append({
-                        "source": source_ideom.name,
-                        "target": target_ideom.name,
+                        "source": concept.name,
+                        "target": target_concept.name,
                         "strength": connection_strength
                     })
         
@@ -287,8 +285,8 @@ class ReasoningKnowledgeIntegration:
         # Get all concepts from the Knowledge Graph
         concepts = self.knowledge_graph.get_all_concepts()
         
-        # Create prefabs for each concept
-        prefabs_created = []
+        # Build a prefab for each concept, then add them all at once
+        prefabs = []
         for concept in concepts:
             # Get the ideoms for the concept
             ideoms = self.reasoning_core.ideom_network.get_ideoms_by_name(concept.name)
@@ -314,9 +312,13 @@ class ReasoningKnowledgeIntegration:
                 response_template = f"{concept.name} is "
                 
                 # Add "is_a" relations to the template
-                is_a_relations = [rel for rel in relations if rel.type == "is_a"]
-                if is_a_relations:
-                    is_a_concepts = [rel.target.name for rel in is_a_relations]
+                is_a_concepts = [
+                    target.name for target in (
+                        self.knowledge_graph.get_concept_by_id(rel.target_concept_id)
+                        for rel in relations if rel.type == "is_a"
+                    ) if target is not None
+                ]
+                if is_a_concepts:
                     if len(is_a_concepts) == 1:
                         response_template += f"a {is_a_concepts[0]}"
                     else:
@@ -336,19 +338,20 @@ class ReasoningKnowledgeIntegration:
                         response_template += ", ".join(property_strings[:-1]) + f" and {property_strings[-1]}"
                 
                 # Create the prefab
-                prefab = self.reasoning_core.create_prefab(
+                prefabs.append(Prefab(
+                    id=str(uuid.uuid4()),
                     name=concept.name,
                     ideom_weights=ideom_weights,
                     response_template=response_template,
                     tags=["concept"]
-                )
-                
-                prefabs_created.append(prefab.name)
+                ))
+        
+        self.reasoning_core.prefab_manager.add_prefabs_bulk(prefabs)
         
         return {
             "success": True,
             "type": "prefab_creation",
-            "prefabs_created": prefabs_created
+            "prefabs_created": [prefab.name for prefab in prefabs]
         }
     
     def process_input_with_knowledge(self, input_text: str) -> Dict[str, Any]:
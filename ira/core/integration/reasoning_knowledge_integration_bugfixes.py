@@ -7,6 +7,7 @@ issues with multi-word concept handling, temporal context integration, and error
 
 from typing import Dict, List, Any, Optional, Tuple, Set
 import re
+import uuid
 from datetime import datetime
 
 from ..knowledge.knowledge_graph import KnowledgeGraph
@@ -52,65 +53,50 @@ class ReasoningKnowledgeIntegrationBugFixes:
             # Get all concepts from the Knowledge Graph
             concepts = integration.knowledge_graph.get_all_concepts()
             
-            # Create ideoms for each concept
-            ideoms_created = []
+            ideom_network = integration.reasoning_core.ideom_network
+            
+            # Collect the names that need a new ideom, in creation order, and
+            # the connections to make between the ideoms, in call order
+            new_names: Dict[str, None] = {}
+            links: List[Tuple[str, str, float]] = []
+            
+            def needs_ideom(name: str) -> bool:
+                return name not in new_names and not ideom_network.get_ideom_ids_by_name(name)
+            
             for concept in concepts:
-                # Check if an ideom with this name already exists
-                existing_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(concept.name)
-                if not existing_ideoms:
-                    # Create a new ideom for the full concept name
-                    ideom = integration.reasoning_core.create_ideom(concept.name)
-                    ideoms_created.append(ideom.name)
+                if needs_ideom(concept.name):
+                    new_names[concept.name] = None
                     
                     # For multi-word concepts, create ideoms for individual words
+                    # and connect them to the concept ideom
                     words = concept.name.split()
                     if len(words) > 1:
                         for word in words:
-                            # Check if an ideom with this word already exists
-                            word_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(word)
-                            if not word_ideoms:
-                                # Create a new ideom for the word
-                                word_ideom = integration.reasoning_core.create_ideom(word)
-                                ideoms_created.append(word_ideom.name)
-                                
-                                # Connect the word ideom to the concept ideom
-                                integration.reasoning_core.ideom_network.connect_ideoms(
-                                    ideom.id, word_ideom.id, 0.8
-                                )
-                                integration.reasoning_core.ideom_network.connect_ideoms(
-                                    word_ideom.id, ideom.id, 0.8
-                                )
+                            if needs_ideom(word):
+                                new_names[word] = None
+                                links.append((concept.name, word, 0.8))
+                                links.append((word, concept.name, 0.8))
                 
-                # Create ideoms for properties
-                properties = concept.get_properties()
-                for prop_name, prop_value in properties.items():
-                    # Create an ideom for the property name if it doesn't exist
-                    prop_name_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(prop_name)
-                    if not prop_name_ideoms:
-                        prop_name_ideom = integration.reasoning_core.create_ideom(prop_name)
-                        ideoms_created.append(prop_name_ideom.name)
-                    else:
-                        prop_name_ideom = prop_name_ideoms[0]
-                    
-                    # Create an ideom for the property value if it doesn't exist
+                # Create ideoms for properties, connecting the concept ideom to
+                # the property name ideom and that to the property value ideom
+                for prop_name, prop_value in concept.get_properties().items():
                     prop_value_str = str(prop_value.value)
-                    prop_value_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(prop_value_str)
-                    if not prop_value_ideoms:
-                        prop_value_ideom = integration.reasoning_core.create_ideom(prop_value_str)
-                        ideoms_created.append(prop_value_ideom.name)
-                    else:
-                        prop_value_ideom = prop_value_ideoms[0]
-                    
-                    # Connect the concept ideom to the property ideoms
-                    concept_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(concept.name)
-                    if concept_ideoms:
-                        concept_ideom = concept_ideoms[0]
-                        integration.reasoning_core.ideom_network.connect_ideoms(
-                            concept_ideom.id, prop_name_ideom.id, 0.7
-                        )
-                        integration.reasoning_core.ideom_network.connect_ideoms(
-                            prop_name_ideom.id, prop_value_ideom.id, 0.9
-                        )
+                    for name in (prop_name, prop_value_str):
+                        if needs_ideom(name):
+                            new_names[name] = None
+                    links.append((concept.name, prop_name, 0.7))
+                    links.append((prop_name, prop_value_str, 0.9))
+            
+            # Create all new ideoms in a single batch
+            ideoms_created = list(new_names)
+            ideom_network.add_ideoms_bulk(ideoms_created)
+            
+            for source_name, target_name, strength in links:
+                ideom_network.connect_ideoms(
+                    ideom_network.get_ideom_ids_by_name(source_name)[0],
+                    ideom_network.get_ideom_ids_by_name(target_name)[0],
+                    strength
+                )
             
             # Create connections between ideoms based on concept relations
             connections_created = []
@@ -121,9 +107,13 @@ class ReasoningKnowledgeIntegrationBugFixes:
                     relations.extend(concept.get_relations(relation_type))
                 
                 for relation in relations:
+                    target_concept = integration.knowledge_graph.get_concept_by_id(relation.target_concept_id)
+                    if target_concept is None:
+                        continue
+                    
                     # Get the ideoms for the source and target concepts
                     source_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(concept.name)
-                    target_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(relation.target.name)
+                    target_ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(target_concept.name)
                     
                     if source_ideoms and target_ideoms:
                         source_ideom = source_ideoms[0]
@@ -189,8 +179,8 @@ class ReasoningKnowledgeIntegrationBugFixes:
             # Get all concepts from the Knowledge Graph
             concepts = integration.knowledge_graph.get_all_concepts()
             
-            # Create prefabs for each concept
-            prefabs_created = []
+            # Build the prefabs for each concept, then add them all at once
+            prefabs = []
             for concept in concepts:
                 # Get the ideoms for the concept
                 ideoms = integration.reasoning_core.ideom_network.get_ideoms_by_name(concept.name)
@@ -217,9 +207,14 @@ class ReasoningKnowledgeIntegrationBugFixes:
                     response_template = f"{concept.name} is "
                     
                     # Add "is_a" relations to the template
-                    is_a_relations = [rel for rel in relations if rel.type == "is_a"]
+                    is_a_concepts = [
+                        target.name for target in (
+                            integration.knowledge_graph.get_concept_by_id(rel.target_concept_id)
+                            for rel in relations if rel.type == "is_a"
+                        ) if target is not None
+                    ]
+                    is_a_relations = bool(is_a_concepts)
                     if is_a_relations:
-                        is_a_concepts = [rel.target.name for rel in is_a_relations]
                         if len(is_a_concepts) == 1:
                             response_template += f"a {is_a_concepts[0]}"
                         else:
@@ -267,14 +262,13 @@ class ReasoningKnowledgeIntegrationBugFixes:
                         response_template += "."
                     
                     # Create the prefab
-                    prefab = integration.reasoning_core.create_prefab(
+                    prefabs.append(Prefab(
+                        id=str(uuid.uuid4()),
                         name=concept.name,
                         ideom_weights=ideom_weights,
                         response_template=response_template,
                         tags=["concept"]
-                    )
-                    
-                    prefabs_created.append(prefab.name)
+                    ))
                     
                     # Create additional prefabs for common question patterns
                     # "What is a [concept]?" prefab
@@ -288,19 +282,20 @@ class ReasoningKnowledgeIntegrationBugFixes:
                         what_is_weights[what_ideom.id] = 0.8
                         what_is_weights[is_ideom.id] = 0.8
                         
-                        what_is_prefab = integration.reasoning_core.create_prefab(
+                        prefabs.append(Prefab(
+                            id=str(uuid.uuid4()),
                             name=f"what_is_{concept.name}",
                             ideom_weights=what_is_weights,
                             response_template=response_template,
                             tags=["question", "what_is", "concept"]
-                        )
-                        
-                        prefabs_created.append(what_is_prefab.name)
+                        ))
+            
+            integration.reasoning_core.prefab_manager.add_prefabs_bulk(prefabs)
             
             return {
                 "success": True,
                 "type": "prefab_creation",
-                "prefabs_created": prefabs_created
+                "prefabs_created": [prefab.name for prefab in prefabs]
             }
         
         # Replace the original method with the fixed one
@@ -13,7 +13,7 @@ import time
 from datetime import datetime
 
 from .knowledge.knowledge_graph import KnowledgeGraph
-from .conversation.conversation_context import ConversationContext, Message, MessageType
+from .conversation.conversation_context import ConversationState, Message, MessageType
 from .conversation.intent_recognizer import IntentRecognizer, Intent, IntentType
 from .conversation.response_planner import ResponsePlanner
 from .conversation.memory_manager import MemoryManager
@@ -127,7 +127,7 @@ class IRASystem:
             context = self.conversation_manager._get_or_create_context(context_id)
             
             # Add the user message to the context
-            context.add_message(Message.create_user_message(
+            self.conversation_manager.memory_manager.append_message(context.id, Message.create_user_message(
                 content=message
             ))
             
@@ -165,16 +165,14 @@ class IRASystem:
                 # Use the original process_message method for other intents
                 return original_process_message(message, context.id)
             
-            # Add the response to the context
-            context.add_message(Message.create_system_message(
+            # Add the response to the context; this also appends it to the memory log
+            self.conversation_manager.memory_manager.append_message(context.id, Message.create_system_message(
                 content=response
             ))
             
             # Update the context state
-            context.state = ConversationContext.ConversationState.ACTIVE
-            
-            # Save the memory
-            self.conversation_manager.memory_manager.save_memory()
+            context.state = ConversationState.ACTIVE
+            self.conversation_manager.memory_manager.update_context(context.id)
             
             return response
         
@@ -8,6 +8,7 @@ in the knowledge graph of the IRA (Ideom Resolver AI) architecture.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Any
 from copy import deepcopy
+import sys
 from .property_value import PropertyValue
 from .relation import Relation
 
@@ -36,6 +37,17 @@ class ConceptNode:
     aliases: List[str] = field(default_factory=list)
     categories: List[str] = field(default_factory=list)
     
+    def __post_init__(self):
+        """Intern the name, property names, aliases and categories."""
+        # The same names recur across many concepts, so interning them keeps
+        # one copy of each string and makes dictionary lookups compare pointers
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "properties", {
+            sys.intern(name): value for name, value in self.properties.items()
+        })
+        object.__setattr__(self, "aliases", [sys.intern(alias) for alias in self.aliases])
+        object.__setattr__(self, "categories", [sys.intern(category) for category in self.categories])
+    
     def get_id(self) -> str:
         """
         Get the ID.
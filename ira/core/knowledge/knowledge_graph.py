@@ -5,7 +5,8 @@ This module defines the KnowledgeGraph class, which is the main class for the
 knowledge graph component of the IRA (Ideom Resolver AI) architecture.
 """
 
-from typing import List, Dict, Tuple, Optional, Any, Set, Callable, Union
+from typing import List, Dict, Tuple, Optional, Any, Set, Callable, Union, Iterable
+from collections import OrderedDict, deque
 import uuid
 import json
 import os
@@ -36,6 +37,14 @@ class KnowledgeGraph:
         category_to_ids: A dictionary mapping categories to sets of concept IDs.
         relation_type_to_ids: A dictionary mapping relation types to sets of relation IDs.
         relation_ids: A set of all relation IDs.
+        generation: A counter that is incremented whenever the concepts or
+            relations change, so that cached query results can be invalidated.
+        similar_concepts_cache: An LRU cache of find_similar_concepts results
+            for the current generation.
+        similar_concepts_cache_size: The maximum number of cached results.
+        path_cache: An LRU cache of find_path_between_concepts results for the
+            current generation.
+        path_cache_size: The maximum number of cached path results.
     """
     
     uncertainty_handler: UncertaintyHandler = field(default_factory=UncertaintyHandler)
@@ -46,11 +55,27 @@ class KnowledgeGraph:
     category_to_ids: Dict[str, Set[str]] = field(default_factory=dict)
     relation_type_to_ids: Dict[str, Set[str]] = field(default_factory=dict)
     relation_ids: Set[str] = field(default_factory=set)
+    generation: int = 0
+    similar_concepts_cache: 'OrderedDict[tuple, List[Tuple[ConceptNode, float]]]' = field(default_factory=OrderedDict)
+    similar_concepts_cache_size: int = 256
+    path_cache: 'OrderedDict[Tuple[str, str, int], List[List[Tuple[str, Relation]]]]' = field(default_factory=OrderedDict)
+    path_cache_size: int = 4096
     
     def __post_init__(self):
         """Initialize the self-organizing structure after other attributes are set."""
         self.self_organizing_structure = SelfOrganizingStructure(semantic_similarity=self.semantic_similarity)
     
+    def _bump_generation(self) -> None:
+        """
+        Record that the concepts or relations have changed.
+        
+        This invalidates the cached find_similar_concepts and
+        find_path_between_concepts results.
+        """
+        self.generation += 1
+        self.similar_concepts_cache.clear()
+        self.path_cache.clear()
+    
     def get_concept_by_id(self, concept_id: str) -> Optional[ConceptNode]:
         """
         Get a concept by its ID.
@@ -99,8 +124,39 @@ class KnowledgeGraph:
         Returns:
             A list of ConceptNode instances for the concepts in the category.
         """
-        concept_ids = self.category_to_ids.get(category.lower(), set())
-        return [self.concepts[concept_id] for concept_id in concept_ids if concept_id in self.concepts]
+        concept_ids = self.category_to_ids.get(category.lower(), ())
+        return [self.concepts[concept_id] for concept_id in concept_ids]
+    
+    def _index_categories(self, concept_id: str, categories: Iterable[str]) -> None:
+        """
+        Add a concept to the category index.
+        
+        Args:
+            concept_id: The ID of the concept.
+            categories: The categories to add the concept to.
+        """
+        for category in categories:
+            self.category_to_ids.setdefault(category.lower(), set()).add(concept_id)
+    
+    def _unindex_categories(self, concept_id: str, categories: Iterable[str]) -> None:
+        """
+        Remove a concept from the category index.
+        
+        Categories that no longer contain any concept are removed, so the
+        index only holds categories that are in use.
+        
+        Args:
+            concept_id: The ID of the concept.
+            categories: The categories to remove the concept from.
+        """
+        for category in categories:
+            category_lower = category.lower()
+            concept_ids = self.category_to_ids.get(category_lower)
+            if concept_ids is None:
+                continue
+            concept_ids.discard(concept_id)
+            if not concept_ids:
+                del self.category_to_ids[category_lower]
     
     def get_relations_by_type(self, relation_type: str) -> List[Relation]:
         """
@@ -144,6 +200,8 @@ class KnowledgeGraph:
         """
         Find paths between two concepts.
         
+        Results are cached until the concepts or relations change.
+        
         Args:
             source_id: The ID of the source concept.
             target_id: The ID of the target concept.
@@ -158,17 +216,22 @@ class KnowledgeGraph:
         if max_depth <= 0:
             return []
         
+        cache_key = (source_id, target_id, max_depth)
+        if cache_key in self.path_cache:
+            self.path_cache.move_to_end(cache_key)
+            return [list(path) for path in self.path_cache[cache_key]]
+        
         source = self.get_concept_by_id(source_id)
         if not source:
             return []
         
         # Perform a breadth-first search
         visited = {source_id}
-        queue = [(source_id, [])]
+        queue = deque([(source_id, [])])
         paths = []
         
         while queue:
-            current_id, path = queue.pop(0)
+            current_id, path = queue.popleft()
             current = self.get_concept_by_id(current_id)
             
             if not current:
@@ -187,7 +250,11 @@ class KnowledgeGraph:
                         visited.add(next_id)
                         queue.append((next_id, path + [(relation_type, relation)]))
         
-        return paths
+        self.path_cache[cache_key] = paths
+        if len(self.path_cache) > self.path_cache_size:
+            self.path_cache.popitem(last=False)
+        
+        return [list(path) for path in paths]
     
     def add_concept(self, name: str, properties: Dict[str, Union[str, PropertyValue]] = None,
                    aliases: List[str] = None, categories: List[str] = None) -> ConceptNode:
@@ -203,53 +270,89 @@ class KnowledgeGraph:
         Returns:
             The ConceptNode instance for the new concept.
         """
-        # Check if a concept with the same name already exists
-        existing = self.get_concept_by_name(name)
-        if existing:
-            return existing
+        return self.add_concepts_bulk([{
+            "name": name,
+            "properties": properties,
+            "aliases": aliases,
+            "categories": categories
+        }])[0]
+    
+    def add_concepts_bulk(self, items: Iterable[Dict[str, Any]]) -> List[ConceptNode]:
+        """
+        Add several new concepts to the knowledge graph at once.
         
-        # Generate a unique ID for the concept
-        concept_id = str(uuid.uuid4())
+        All concept nodes are built first and then added to each index in a
+        single pass, and the cached query results are invalidated only once.
         
-        # Convert property values to PropertyValue instances
-        property_values = {}
-        if properties:
-            for prop_name, prop_value in properties.items():
-                if isinstance(prop_value, PropertyValue):
-                    property_values[prop_name] = prop_value
-                else:
-                    property_values[prop_name] = PropertyValue(value=str(prop_value))
+        Args:
+            items: Dictionaries with the keyword arguments of add_concept:
+                a "name" and optionally "properties", "aliases" and "categories".
+            
+        Returns:
+            The ConceptNode instance for each item. If a concept with the same
+            name already exists, or an earlier item has the same name, that
+            concept is returned instead.
+        """
+        concepts = []
+        new_concepts = []
+        new_concepts_by_name: Dict[str, ConceptNode] = {}
         
-        # Create the concept
-        concept = ConceptNode(
-            id=concept_id,
-            name=name,
-            properties=property_values,
-            aliases=aliases or [],
-            categories=categories or []
-        )
+        for item in items:
+            name = item["name"]
+            
+            # Check if a concept with the same name already exists
+            existing = self.get_concept_by_name(name) or new_concepts_by_name.get(name.lower())
+            if existing:
+                concepts.append(existing)
+                continue
+            
+            # Convert property values to PropertyValue instances
+            property_values = {}
+            properties = item.get("properties")
+            if properties:
+                for prop_name, prop_value in properties.items():
+                    if isinstance(prop_value, PropertyValue):
+                        property_values[prop_name] = prop_value
+                    else:
+                        property_values[prop_name] = PropertyValue(value=str(prop_value))
+            
+            # Create the concept with a unique ID
+            concept = ConceptNode(
+                id=str(uuid.uuid4()),
+                name=name,
+                properties=property_values,
+                aliases=item.get("aliases") or [],
+                categories=item.get("categories") or []
+            )
+            
+            concepts.append(concept)
+            new_concepts.append(concept)
+            new_concepts_by_name[name.lower()] = concept
         
-        # Add the concept to the knowledge graph
-        self.concepts[concept_id] = concept
-        self.concept_name_to_id[name.lower()] = concept_id
+        if not new_concepts:
+            return concepts
+        
+        # Add the concepts to the knowledge graph
+        for concept in new_concepts:
+            self.concepts[concept.id] = concept
+            self.concept_name_to_id[concept.name.lower()] = concept.id
         
         # Add aliases
-        if aliases:
-            for alias in aliases:
-                self.alias_to_id[alias.lower()] = concept_id
+        for concept in new_concepts:
+            for alias in concept.aliases:
+                self.alias_to_id[alias.lower()] = concept.id
         
         # Add categories
-        if categories:
-            for category in categories:
-                category_lower = category.lower()
-                if category_lower not in self.category_to_ids:
-                    self.category_to_ids[category_lower] = set()
-                self.category_to_ids[category_lower].add(concept_id)
+        for concept in new_concepts:
+            self._index_categories(concept.id, concept.categories)
         
-        # Add the concept to the self-organizing structure
-        self.self_organizing_structure.add_concept(concept, self.concepts)
+        # Add the concepts to the self-organizing structure
+        for concept in new_concepts:
+            self.self_organizing_structure.add_concept(concept, self.concepts)
         
-        return concept
+        self._bump_generation()
+        
+        return concepts
     
     def update_concept(self, concept_id: str, name: Optional[str] = None,
                       properties: Dict[str, Union[str, PropertyValue]] = None,
@@ -321,18 +424,11 @@ class KnowledgeGraph:
         
         # Update categories
         if categories is not None:
-            # Remove old categories
-            for category in concept.categories:
-                category_lower = category.lower()
-                if category_lower in self.category_to_ids and concept_id in self.category_to_ids[category_lower]:
-                    self.category_to_ids[category_lower].remove(concept_id)
-            
-            # Add new categories
-            for category in categories:
-                category_lower = category.lower()
-                if category_lower not in self.category_to_ids:
-                    self.category_to_ids[category_lower] = set()
-                self.category_to_ids[category_lower].add(concept_id)
+            # Only the categories that were removed or added change the index
+            old_categories = {category.lower() for category in concept.categories}
+            new_categories = {category.lower() for category in categories}
+            self._unindex_categories(concept_id, old_categories - new_categories)
+            self._index_categories(concept_id, new_categories - old_categories)
             
             # Create a new concept with the updated categories
             concept = ConceptNode(
@@ -350,6 +446,8 @@ class KnowledgeGraph:
         # Update the concept in the self-organizing structure
         self.self_organizing_structure.update_concept(concept, self.concepts)
         
+        self._bump_generation()
+        
         return concept
     
     def remove_concept(self, concept_id: str) -> bool:
@@ -376,10 +474,7 @@ class KnowledgeGraph:
                 del self.alias_to_id[alias.lower()]
         
         # Remove categories
-        for category in concept.categories:
-            category_lower = category.lower()
-            if category_lower in self.category_to_ids and concept_id in self.category_to_ids[category_lower]:
-                self.category_to_ids[category_lower].remove(concept_id)
+        self._unindex_categories(concept_id, concept.categories)
         
         # Remove relations
         for relation in concept.get_all_relations():
@@ -391,11 +486,14 @@ class KnowledgeGraph:
         # Remove the concept from the knowledge graph
         del self.concepts[concept_id]
         
+        self._bump_generation()
+        
         return True
     
     def add_relation(self, source_id: str, target_id: str, relation_type: str,
                     properties: Dict[str, Union[str, PropertyValue]] = None,
-                    bidirectional: bool = False) -> Optional[Relation]:
+                    bidirectional: bool = False,
+                    relation_id: Optional[str] = None) -> Optional[Relation]:
         """
         Add a relation between two concepts.
         
@@ -405,6 +503,7 @@ class KnowledgeGraph:
             relation_type: The type of the relation.
             properties: A dictionary mapping property names to values or PropertyValue instances.
             bidirectional: Whether the relation is bidirectional.
+            relation_id: The ID of the relation. If None, a new ID is generated.
             
         Returns:
             The Relation instance for the new relation, or None if either concept doesn't exist.
@@ -416,7 +515,8 @@ class KnowledgeGraph:
             return None
         
         # Generate a unique ID for the relation
-        relation_id = str(uuid.uuid4())
+        if relation_id is None:
+            relation_id = Relation.generate_id()
         
         # Convert property values to PropertyValue instances
         property_values = {}
@@ -453,6 +553,8 @@ class KnowledgeGraph:
         # Add the relation to the set of all relation IDs
         self.relation_ids.add(relation_id)
         
+        self._bump_generation()
+        
         return relation
     
     def update_relation(self, relation_id: str, relation_type: Optional[str] = None,
@@ -557,6 +659,8 @@ class KnowledgeGraph:
         # Update the source concept
         self.concepts[source_concept.id] = source_concept.add_relation(relation)
         
+        self._bump_generation()
+        
         return relation
     
     def remove_relation(self, relation_id: str) -> bool:
@@ -606,6 +710,8 @@ class KnowledgeGraph:
         if relation_id in self.relation_ids:
             self.relation_ids.remove(relation_id)
         
+        self._bump_generation()
+        
         return True
     
     def find_similar_concepts(self, concept_or_name: Union[ConceptNode, str],
@@ -613,6 +719,8 @@ class KnowledgeGraph:
         """
         Find concepts similar to a given concept or name.
         
+        Results are cached until the concepts or relations change.
+        
         Args:
             concept_or_name: The concept or name to find similar concepts for.
             threshold: The minimum similarity score required.
@@ -621,19 +729,39 @@ class KnowledgeGraph:
         Returns:
             A list of tuples, where each tuple contains a similar concept and its similarity score.
         """
+        if isinstance(concept_or_name, str):
+            cache_key = ("name", concept_or_name, threshold, limit)
+        elif self.concepts.get(concept_or_name.id) is concept_or_name:
+            cache_key = ("concept", concept_or_name.id, threshold, limit)
+        else:
+            # The concept is not the one stored in the graph, so it may differ
+            cache_key = None
+        
+        if cache_key in self.similar_concepts_cache:
+            self.similar_concepts_cache.move_to_end(cache_key)
+            return list(self.similar_concepts_cache[cache_key])
+        
         if isinstance(concept_or_name, str):
             concept = self.get_concept_by_name(concept_or_name)
-            if not concept:
-                # If the concept doesn't exist, find similar concepts by name
-                return self.semantic_similarity.find_similar_by_text(
-                    concept_or_name, list(self.concepts.values()), threshold, limit
-                )
         else:
             concept = concept_or_name
         
-        return self.semantic_similarity.find_similar_concepts(
-            concept, list(self.concepts.values()), threshold, limit
-        )
+        if concept:
+            similar_concepts = self.semantic_similarity.find_similar_concepts(
+                concept, list(self.concepts.values()), threshold, limit
+            )
+        else:
+            # If the concept doesn't exist, find similar concepts by name
+            similar_concepts = self.semantic_similarity.find_similar_by_text(
+                concept_or_name, list(self.concepts.values()), threshold, limit
+            )
+        
+        if cache_key is not None:
+            self.similar_concepts_cache[cache_key] = similar_concepts
+            if len(self.similar_concepts_cache) > self.similar_concepts_cache_size:
+                self.similar_concepts_cache.popitem(last=False)
+        
+        return list(similar_concepts)
     
     def reorganize(self) -> int:
         """
@@ -713,6 +841,7 @@ class KnowledgeGraph:
         self.category_to_ids.clear()
         self.relation_type_to_ids.clear()
         self.relation_ids.clear()
+        self._bump_generation()
         
         # Reinitialize the self-organizing structure
         self.self_organizing_structure = SelfOrganizingStructure(semantic_similarity=self.semantic_similarity)
@@ -734,9 +863,10 @@ class KnowledgeGraph:
             # Convert the knowledge graph to a dictionary
             data = self.to_dict()
             
-            # Save the dictionary to a JSON file
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Save the dictionary to a compact JSON file, serialized in one
+            # call and written through a large buffer
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(json.dumps(data, separators=(',', ':'), ensure_ascii=False))
             
             return True
         except Exception as e:
@@ -756,7 +886,7 @@ class KnowledgeGraph:
         """
         try:
             # Load the dictionary from a JSON file
-            with open(file_path, 'r') as f:
+            with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
             # Create a new knowledge graph from the dictionary
@@ -819,7 +949,11 @@ class KnowledgeGraph:
         # Load the category mapping
         category_to_ids_data = data.get("category_to_ids", {})
         for category, concept_ids in category_to_ids_data.items():
-            kg.category_to_ids[category] = set(concept_ids)
+            # Skip IDs of missing concepts and empty categories, which older
+            # files may contain
+            concept_ids = {concept_id for concept_id in concept_ids if concept_id in kg.concepts}
+            if concept_ids:
+                kg.category_to_ids[category] = concept_ids
         
         # Load the relation type mapping
         relation_type_to_ids_data = data.get("relation_type_to_ids", {})
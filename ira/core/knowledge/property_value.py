@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 from copy import deepcopy
+import sys
 
 
 @dataclass(frozen=True)
@@ -31,6 +32,11 @@ class PropertyValue:
     sources: List[str] = field(default_factory=list)
     last_updated: datetime = field(default_factory=datetime.now)
     
+    def __post_init__(self):
+        """Intern the value, which often recurs across concepts."""
+        if type(self.value) is str:
+            object.__setattr__(self, "value", sys.intern(self.value))
+    
     def update(self, value: str, confidence: float, source: str) -> 'PropertyValue':
         """
         Update the property value.
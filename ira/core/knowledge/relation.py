@@ -9,6 +9,14 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from copy import deepcopy
+import itertools
+import secrets
+import sys
+
+# Relation IDs are a random per-process prefix followed by a counter, which
+# keeps them unique across saved graphs without drawing a UUID per relation
+_ID_PREFIX = secrets.token_hex(8)
+_id_counter = itertools.count()
 
 
 @dataclass(frozen=True)
@@ -41,6 +49,20 @@ class Relation:
     last_updated: datetime = field(default_factory=datetime.now)
     bidirectional: bool = False
     
+    def __post_init__(self):
+        """Intern the relation type, which is used as a key by every concept."""
+        object.__setattr__(self, "type", sys.intern(self.type))
+    
+    @staticmethod
+    def generate_id() -> str:
+        """
+        Generate a unique ID for a new relation.
+        
+        Returns:
+            A new relation ID.
+        """
+        return f"{_ID_PREFIX}-{next(_id_counter):x}"
+    
     def update(self, confidence: float, source: str) -> 'Relation':
         """
         Update the relation.
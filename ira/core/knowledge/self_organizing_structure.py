@@ -9,6 +9,7 @@ from typing import List, Dict, Tuple, Optional, Any, Set, Callable
 import math
 import random
 from dataclasses import dataclass, field
+import numpy as np
 from .concept_node import ConceptNode
 from .semantic_similarity import SemanticSimilarity
 
@@ -89,19 +90,17 @@ class SelfOrganizingStructure:
             return
         
         # Get the embeddings for all concept names
-        embeddings = [self.semantic_similarity.get_embedding(concept.get_name()) for concept in concepts]
+        embeddings = np.array([self.semantic_similarity.get_embedding(concept.get_name()) for concept in concepts])
         
         # Calculate the centroid
-        centroid = []
-        for i in range(len(embeddings[0])):
-            centroid.append(sum(embedding[i] for embedding in embeddings) / len(embeddings))
+        centroid = embeddings.mean(axis=0)
         
         # Normalize the centroid
-        magnitude = math.sqrt(sum(x**2 for x in centroid))
+        magnitude = np.linalg.norm(centroid)
         if magnitude > 0:
-            centroid = [x / magnitude for x in centroid]
+            centroid = centroid / magnitude
         
-        self._cluster_centroids[cluster_index] = centroid
+        self._cluster_centroids[cluster_index] = centroid.tolist()
     
     def get_cluster_for_concept(self, concept_id: str) -> Optional[int]:
         """
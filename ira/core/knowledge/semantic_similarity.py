@@ -8,8 +8,116 @@ between concepts, properties, and values in the knowledge graph of the IRA (Ideo
 from typing import List, Dict, Tuple, Optional, Any, Set, Callable
 import math
 from dataclasses import dataclass, field
+import numpy as np
 from .concept_node import ConceptNode
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _cosine_numpy(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Calculate the cosine similarity between two float64 vectors with NumPy.
+    
+    Args:
+        a: The first vector.
+        b: The second vector.
+        
+    Returns:
+        The cosine similarity, or 0.0 if either vector is zero.
+    """
+    magnitude1 = np.linalg.norm(a)
+    magnitude2 = np.linalg.norm(b)
+    if magnitude1 == 0 or magnitude2 == 0:
+        return 0.0
+    return float(np.dot(a, b) / (magnitude1 * magnitude2))
+
+
+def _cosine_loop(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Calculate the cosine similarity between two float64 vectors in one loop.
+    
+    This is the kernel compiled by activate_numba_scorer().
+    
+    Args:
+        a: The first vector.
+        b: The second vector.
+        
+    Returns:
+        The cosine similarity, or 0.0 if either vector is zero.
+    """
+    dot_product = 0.0
+    squared_magnitude1 = 0.0
+    squared_magnitude2 = 0.0
+    for i in range(a.shape[0]):
+        dot_product += a[i] * b[i]
+        squared_magnitude1 += a[i] * a[i]
+        squared_magnitude2 += b[i] * b[i]
+    
+    if squared_magnitude1 == 0.0 or squared_magnitude2 == 0.0:
+        return 0.0
+    return dot_product / math.sqrt(squared_magnitude1 * squared_magnitude2)
+
+
+# The cosine kernel used by SemanticSimilarity.cosine_similarity
+_cosine = _cosine_numpy
+
+
+def activate_numba_scorer() -> bool:
+    """
+    Use a Numba-compiled kernel for SemanticSimilarity.cosine_similarity.
+    
+    The kernel is compiled on its first call and cached on disk. It sums in
+    a different order than NumPy, so scores may differ in the last bits
+    (by about 1e-16). Without Numba installed, the NumPy implementation
+    stays in use.
+    
+    Returns:
+        True if the Numba kernel is now in use, False if Numba is not available.
+    """
+    global _cosine
+    if numba is None:
+        return False
+    _cosine = numba.njit(nogil=True, cache=True)(_cosine_loop)
+    return True
+
+
+# The weights of the name, property, category and relation similarities in the
+# similarity between two concepts
+_CONCEPT_SIMILARITY_WEIGHTS = (0.3, 0.3, 0.2, 0.2)
+
+
+def _jaccard_matrix(item_sets: List[Set[str]]) -> np.ndarray:
+    """
+    Calculate the pairwise Jaccard similarity between sets of items.
+    
+    The sets are encoded as the rows of a binary membership matrix, so the
+    sizes of all intersections come from a single matrix product.
+    
+    Args:
+        item_sets: The sets of items to compare.
+        
+    Returns:
+        A square array with the Jaccard similarity between each pair of sets,
+        which is 0.0 for a pair of empty sets.
+    """
+    vocabulary: Dict[str, int] = {}
+    for items in item_sets:
+        for item in items:
+            vocabulary.setdefault(item, len(vocabulary))
+    
+    membership = np.zeros((len(item_sets), len(vocabulary)))
+    for i, items in enumerate(item_sets):
+        membership[i, [vocabulary[item] for item in items]] = 1.0
+    
+    intersection = membership @ membership.T
+    sizes = membership.sum(axis=1)
+    union = sizes[:, None] + sizes[None, :] - intersection
+    
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
 
 @dataclass
 class SemanticSimilarity:
@@ -24,12 +132,15 @@ class SemanticSimilarity:
         embedding_cache: A cache of embedding vectors for concept names and property values.
         similarity_cache: A cache of similarity scores between concepts.
         embedding_function: A function that generates embedding vectors for text.
+        unit_vector_cache: A cache of unit-length NumPy embedding vectors, used
+            to compare one text with many texts in a single matrix product.
     """
     
     embedding_dimension: int = 256
     embedding_cache: Dict[str, List[float]] = field(default_factory=dict)
     similarity_cache: Dict[Tuple[str, str], float] = field(default_factory=dict)
     embedding_function: Optional[Callable[[str], List[float]]] = None
+    unit_vector_cache: Dict[str, np.ndarray] = field(default_factory=dict)
     
     def set_embedding_function(self, func: Callable[[str], List[float]]) -> None:
         """
@@ -42,6 +153,7 @@ class SemanticSimilarity:
         # Clear the caches when the embedding function changes
         self.embedding_cache.clear()
         self.similarity_cache.clear()
+        self.unit_vector_cache.clear()
     
     def get_embedding(self, text: str) -> List[float]:
         """
@@ -114,14 +226,51 @@ class SemanticSimilarity:
         if len(vec1) != len(vec2):
             raise ValueError("Vectors must have the same dimension")
         
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = math.sqrt(sum(x**2 for x in vec1))
-        magnitude2 = math.sqrt(sum(x**2 for x in vec2))
+        return _cosine(
+            np.ascontiguousarray(vec1, dtype=np.float64),
+            np.ascontiguousarray(vec2, dtype=np.float64)
+        )
+    
+    def get_unit_vector(self, text: str) -> np.ndarray:
+        """
+        Get the embedding vector for a text, scaled to unit length.
         
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
+        Args:
+            text: The text to get the vector for.
+            
+        Returns:
+            The unit-length embedding vector, or a zero vector if the embedding is zero.
+        """
+        if text in self.unit_vector_cache:
+            return self.unit_vector_cache[text]
+        
+        vector = np.asarray(self.get_embedding(text), dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
         
-        return dot_product / (magnitude1 * magnitude2)
+        self.unit_vector_cache[text] = vector
+        return vector
+    
+    def text_similarities(self, text: str, texts: List[str]) -> np.ndarray:
+        """
+        Calculate the semantic similarity between a text and many other texts.
+        
+        The cosine similarities are computed with a single matrix-vector
+        product over the stacked unit embedding vectors.
+        
+        Args:
+            text: The text to compare.
+            texts: The texts to compare it with.
+            
+        Returns:
+            An array with the similarity between the text and each of the texts.
+        """
+        if not texts:
+            return np.zeros(0)
+        
+        matrix = np.stack([self.get_unit_vector(other) for other in texts])
+        return matrix @ self.get_unit_vector(text)
     
     def euclidean_distance(self, vec1: List[float], vec2: List[float]) -> float:
         """
@@ -177,17 +326,46 @@ class SemanticSimilarity:
             The semantic similarity between the concepts.
         """
         # Check the cache first
+        cached_similarity = self._get_cached_concept_similarity(concept1, concept2)
+        if cached_similarity is not None:
+            return cached_similarity
+        
+        # Calculate the similarity based on the concept names
+        name_similarity = self.text_similarity(concept1.get_name(), concept2.get_name())
+        
+        return self._combine_concept_similarity(concept1, concept2, name_similarity)
+    
+    def _get_cached_concept_similarity(self, concept1: ConceptNode, concept2: ConceptNode) -> Optional[float]:
+        """
+        Get the cached similarity between two concepts.
+        
+        Args:
+            concept1: The first concept.
+            concept2: The second concept.
+            
+        Returns:
+            The cached similarity, or None if it hasn't been calculated yet.
+        """
         cache_key = (concept1.get_id(), concept2.get_id())
         reverse_cache_key = (concept2.get_id(), concept1.get_id())
         
         if cache_key in self.similarity_cache:
             return self.similarity_cache[cache_key]
-        if reverse_cache_key in self.similarity_cache:
-            return self.similarity_cache[reverse_cache_key]
-        
-        # Calculate the similarity based on the concept names
-        name_similarity = self.text_similarity(concept1.get_name(), concept2.get_name())
+        return self.similarity_cache.get(reverse_cache_key)
+    
+    def _combine_concept_similarity(self, concept1: ConceptNode, concept2: ConceptNode,
+                                    name_similarity: float) -> float:
+        """
+        Combine the name similarity of two concepts with their other similarities.
         
+        Args:
+            concept1: The first concept.
+            concept2: The second concept.
+            name_similarity: The semantic similarity between the concept names.
+            
+        Returns:
+            The semantic similarity between the concepts.
+        """
         # Calculate the similarity based on the concept properties
         property_similarity = self._calculate_property_similarity(concept1, concept2)
         
@@ -198,7 +376,7 @@ class SemanticSimilarity:
         relation_similarity = self._calculate_relation_similarity(concept1, concept2)
         
         # Combine the similarities with weights
-        weights = [0.3, 0.3, 0.2, 0.2]  # Adjust these weights as needed
+        weights = _CONCEPT_SIMILARITY_WEIGHTS
         similarity = (
             weights[0] * name_similarity +
             weights[1] * property_similarity +
@@ -207,7 +385,7 @@ class SemanticSimilarity:
         )
         
         # Cache the result
-        self.similarity_cache[cache_key] = similarity
+        self.similarity_cache[(concept1.get_id(), concept2.get_id())] = similarity
         
         return similarity
     
@@ -291,6 +469,79 @@ class SemanticSimilarity:
         
         return intersection / union if union > 0 else 0.0
     
+    def concept_similarity_matrix(self, concepts: List[ConceptNode]) -> np.ndarray:
+        """
+        Calculate the semantic similarity between each pair of concepts.
+        
+        This gives the same scores as ``concept_similarity``, but each kind of
+        similarity is computed for all pairs at once with matrix products
+        instead of one pair at a time.
+        
+        Args:
+            concepts: The concepts to compare.
+            
+        Returns:
+            A square array with the similarity between each pair of concepts.
+        """
+        count = len(concepts)
+        if count == 0:
+            return np.zeros((0, 0))
+        
+        name_similarity = self._text_similarity_matrix([concept.get_name() for concept in concepts])
+        
+        # Property similarities, averaged over the properties two concepts share
+        values_by_property: Dict[str, Tuple[List[int], List[str]]] = {}
+        for i, concept in enumerate(concepts):
+            for name, value in concept.get_properties().items():
+                indices, values = values_by_property.setdefault(name, ([], []))
+                indices.append(i)
+                values.append(value.get_value())
+        
+        property_totals = np.zeros((count, count))
+        property_counts = np.zeros((count, count))
+        for indices, values in values_by_property.values():
+            pairs = np.ix_(indices, indices)
+            property_totals[pairs] += self._text_similarity_matrix(values)
+            property_counts[pairs] += 1.0
+        property_similarity = np.divide(
+            property_totals, property_counts,
+            out=np.zeros_like(property_totals), where=property_counts > 0
+        )
+        
+        # Category and relation type similarities
+        category_similarity = _jaccard_matrix([set(concept.get_categories()) for concept in concepts])
+        relation_similarity = _jaccard_matrix([set(concept.get_relation_types()) for concept in concepts])
+        
+        weights = _CONCEPT_SIMILARITY_WEIGHTS
+        return (
+            weights[0] * name_similarity +
+            weights[1] * property_similarity +
+            weights[2] * category_similarity +
+            weights[3] * relation_similarity
+        )
+    
+    def _text_similarity_matrix(self, texts: List[str]) -> np.ndarray:
+        """
+        Calculate the semantic similarity between each pair of texts.
+        
+        Args:
+            texts: The texts to compare.
+            
+        Returns:
+            A square array with the similarity between each pair of texts.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        vectors = np.stack([self.get_unit_vector(text) for text in unique_texts])
+        similarities = vectors @ vectors.T
+        
+        # Identical texts get exactly the score of text_similarity, so that a
+        # score right at a threshold isn't pushed below it by rounding
+        np.fill_diagonal(similarities, [self.text_similarity(text, text) for text in unique_texts])
+        
+        positions = {text: i for i, text in enumerate(unique_texts)}
+        index = [positions[text] for text in texts]
+        return similarities[np.ix_(index, index)]
+    
     def find_similar_concepts(self, concept: ConceptNode, candidates: List[ConceptNode],
                              threshold: float = 0.7, limit: int = 10) -> List[Tuple[ConceptNode, float]]:
         """
@@ -305,22 +556,23 @@ class SemanticSimilarity:
         Returns:
             A list of tuples, where each tuple contains a similar concept and its similarity score.
         """
-        similarities = []
+        candidates = [candidate for candidate in candidates if candidate.get_id() != concept.get_id()]
         
-        for candidate in candidates:
-            if candidate.get_id() == concept.get_id():
-                continue
-            
-            similarity = self.concept_similarity(concept, candidate)
-            
-            if similarity >= threshold:
-                similarities.append((candidate, similarity))
+        # Compare the concept name with all candidate names at once
+        name_similarities = self.text_similarities(
+            concept.get_name(), [candidate.get_name() for candidate in candidates]
+        )
         
-        # Sort by similarity score in descending order
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        scores = np.empty(len(candidates))
+        for i, candidate in enumerate(candidates):
+            similarity = self._get_cached_concept_similarity(concept, candidate)
+            if similarity is None:
+                similarity = self._combine_concept_similarity(
+                    concept, candidate, float(name_similarities[i])
+                )
+            scores[i] = similarity
         
-        # Return the top 'limit' similar concepts
-        return similarities[:limit]
+        return self._top_matches(candidates, scores, threshold, limit)
     
     def find_similar_by_text(self, text: str, candidates: List[ConceptNode],
                             threshold: float = 0.7, limit: int = 10) -> List[Tuple[ConceptNode, float]]:
@@ -336,19 +588,32 @@ class SemanticSimilarity:
         Returns:
             A list of tuples, where each tuple contains a similar concept and its similarity score.
         """
-        similarities = []
+        scores = self.text_similarities(text, [candidate.get_name() for candidate in candidates])
+        
+        return self._top_matches(candidates, scores, threshold, limit)
+    
+    def _top_matches(self, candidates: List[ConceptNode], scores: np.ndarray,
+                     threshold: float, limit: int) -> List[Tuple[ConceptNode, float]]:
+        """
+        Select the best scoring candidates.
         
-        for candidate in candidates:
-            similarity = self.text_similarity(text, candidate.get_name())
+        Args:
+            candidates: The candidate concepts.
+            scores: The similarity score of each candidate.
+            threshold: The minimum similarity score required.
+            limit: The maximum number of candidates to return.
             
-            if similarity >= threshold:
-                similarities.append((candidate, similarity))
+        Returns:
+            A list of (concept, similarity score) tuples for the candidates
+            scoring at least the threshold, sorted by score in descending order.
+            Candidates with equal scores keep their original order.
+        """
+        matches = np.flatnonzero(scores >= threshold)
         
         # Sort by similarity score in descending order
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        order = matches[np.argsort(-scores[matches], kind="stable")][:limit]
         
-        # Return the top 'limit' similar concepts
-        return similarities[:limit]
+        return [(candidates[i], float(scores[i])) for i in order]
     
     def cluster_concepts(self, concepts: List[ConceptNode], threshold: float = 0.7) -> List[List[ConceptNode]]:
         """
@@ -364,30 +629,32 @@ class SemanticSimilarity:
         if not concepts:
             return []
         
+        # Calculate all pairwise similarities up front
+        similarities = self.concept_similarity_matrix(concepts)
+        
         # Initialize clusters with the first concept
         clusters = [[concepts[0]]]
+        labels = np.zeros(len(concepts), dtype=np.intp)
         
         # Assign each remaining concept to a cluster or create a new one
-        for concept in concepts[1:]:
-            best_cluster = None
-            best_similarity = 0.0
+        for i in range(1, len(concepts)):
+            # Calculate the average similarity to the concepts in each cluster
+            totals = np.bincount(labels[:i], weights=similarities[i, :i], minlength=len(clusters))
+            sizes = np.bincount(labels[:i], minlength=len(clusters))
+            averages = totals / sizes
             
             # Find the best cluster for the concept
-            for i, cluster in enumerate(clusters):
-                # Calculate the average similarity to the concepts in the cluster
-                similarities = [self.concept_similarity(concept, c) for c in cluster]
-                avg_similarity = sum(similarities) / len(similarities)
-                
-                if avg_similarity > best_similarity and avg_similarity >= threshold:
-                    best_cluster = i
-                    best_similarity = avg_similarity
+            best_cluster = int(np.argmax(averages))
+            best_similarity = averages[best_cluster]
             
-            if best_cluster is not None:
+            if best_similarity > 0.0 and best_similarity >= threshold:
                 # Add the concept to the best cluster
-                clusters[best_cluster].append(concept)
+                labels[i] = best_cluster
+                clusters[best_cluster].append(concepts[i])
             else:
                 # Create a new cluster for the concept
-                clusters.append([concept])
+                labels[i] = len(clusters)
+                clusters.append([concepts[i]])
         
         return clusters
     
@@ -10,6 +10,7 @@ from typing import List, Dict, Any, Optional
 from ..knowledge.knowledge_graph import KnowledgeGraph
 from ..reasoning.unified_reasoning_core import UnifiedReasoningCore
 from ..integration.reasoning_knowledge_integration import ReasoningKnowledgeIntegration
+from .text_chunker import split_into_chunks
 
 class FileKnowledgeLoader:
     """
@@ -64,36 +65,10 @@ class FileKnowledgeLoader:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Process the content in chunks to avoid overwhelming the system
-            chunk_size = 1000  # characters
-            chunks = [content[i:i+chunk_size] for i in range(0, len(content), chunk_size)]
-            
-            results = []
-            for chunk in chunks:
-                # Process the chunk using the integration
-                result = self.integration.process_input_with_knowledge(chunk)
-                results.append(result)
-            
-            # Extract statistics
-            concepts_created = set()
-            relations_created = set()
-            knowledge_extracted = []
-            
-            for result in results:
-                update_result = result.get("knowledge_update_result", {})
-                extraction_result = result.get("knowledge_extraction_result", {})
-                
-                concepts_created.update(update_result.get("concepts_created", []))
-                relations_created.update(update_result.get("relations_created", []))
-                knowledge_extracted.extend(extraction_result.get("extracted_knowledge", []))
-            
             return {
                 "success": True,
                 "file_path": file_path,
-                "chunks_processed": len(chunks),
-                "concepts_created": list(concepts_created),
-                "relations_created": list(relations_created),
-                "knowledge_extracted": knowledge_extracted
+                **self._process_content(content)
             }
             
         except Exception as e:
@@ -102,6 +77,71 @@ class FileKnowledgeLoader:
                 "error": f"Error loading knowledge from file: {str(e)}"
             }
     
+    def load_from_text(self, text: str, source_name: str = "text_input") -> Dict[str, Any]:
+        """
+        Load knowledge from a text string.
+        
+        Args:
+            text: The text to load knowledge from.
+            source_name: A name for the source of the text.
+            
+        Returns:
+            A dictionary containing the results of the knowledge loading process.
+        """
+        try:
+            return {
+                "success": True,
+                "source_name": source_name,
+                **self._process_content(text)
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Error loading knowledge from text: {str(e)}"
+            }
+    
+    def _process_content(self, content: str) -> Dict[str, Any]:
+        """
+        Process text content and collect the knowledge extracted from it.
+        
+        Args:
+            content: The text content to process.
+            
+        Returns:
+            A dictionary with the number of chunks processed and the concepts,
+            relations and knowledge extracted from the content.
+        """
+        # Process the content in chunks of whole sentences to avoid
+        # overwhelming the system
+        chunks = split_into_chunks(content, chunk_size=1000)
+        
+        results = []
+        for chunk in chunks:
+            # Process the chunk using the integration
+            result = self.integration.process_input_with_knowledge(chunk)
+            results.append(result)
+        
+        # Extract statistics
+        concepts_created = set()
+        relations_created = set()
+        knowledge_extracted = []
+        
+        for result in results:
+            update_result = result.get("knowledge_update_result", {})
+            extraction_result = result.get("knowledge_extraction_result", {})
+            
+            concepts_created.update(update_result.get("concepts_created", []))
+            relations_created.update(update_result.get("relations_created", []))
+            knowledge_extracted.extend(extraction_result.get("extracted_knowledge", []))
+        
+        return {
+            "chunks_processed": len(chunks),
+            "concepts_created": list(concepts_created),
+            "relations_created": list(relations_created),
+            "knowledge_extracted": knowledge_extracted
+        }
+    
     def load_from_directory(self, directory_path: str, file_extension: str = ".txt") -> Dict[str, Any]:
         """
         Load knowledge from all text files in a directory.
@@ -0,0 +1,53 @@
+"""
+Text chunking for the knowledge loaders of the IRA architecture.
+
+This module splits loaded text into chunks of whole sentences that are
+small enough to be processed by the reasoning knowledge integration.
+"""
+
+from typing import List
+import spacy
+
+# A blank English pipeline with only a rule-based sentencizer. It needs no
+# trained model and is loaded once for all loaders.
+_nlp = spacy.blank("en")
+_nlp.add_pipe("sentencizer")
+
+
+def split_into_chunks(text: str, chunk_size: int = 1000) -> List[str]:
+    """
+    Split text into chunks of whole sentences.
+
+    Sentences are added to a chunk until the next one would make it longer
+    than ``chunk_size`` characters. A sentence longer than ``chunk_size`` is
+    kept whole in a chunk of its own.
+
+    Args:
+        text: The text to split.
+        chunk_size: The maximum length of a chunk in characters.
+
+    Returns:
+        A list of text chunks.
+    """
+    # Paragraphs are segmented as a batch, which also keeps each spaCy
+    # document well below the pipeline's maximum length
+    paragraphs = [paragraph for paragraph in text.split("\n\n") if paragraph.strip()]
+
+    chunks = []
+    current = ""
+    for doc in _nlp.pipe(paragraphs, batch_size=64):
+        for sentence in doc.sents:
+            sentence_text = sentence.text.strip()
+            if not sentence_text:
+                continue
+
+            if current and len(current) + 1 + len(sentence_text) > chunk_size:
+                chunks.append(current)
+                current = sentence_text
+            else:
+                current = f"{current} {sentence_text}" if current else sentence_text
+
+    if current:
+        chunks.append(current)
+
+    return chunks
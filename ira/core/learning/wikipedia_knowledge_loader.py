@@ -5,11 +5,20 @@ This module provides functionality to load knowledge from Wikipedia articles
 and integrate it into the IRA system's knowledge graph.
 """
 
+import hashlib
+import json
+import os
 import requests
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from ..knowledge.knowledge_graph import KnowledgeGraph
 from ..reasoning.unified_reasoning_core import UnifiedReasoningCore
 from ..integration.reasoning_knowledge_integration import ReasoningKnowledgeIntegration
+from .text_chunker import split_into_chunks
+
+# A directory for the on-disk article cache. The disk cache is opt-in, as
+# cached articles are never revalidated.
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ira", "wiki")
 
 class WikipediaKnowledgeLoader:
     """
@@ -23,6 +32,11 @@ class WikipediaKnowledgeLoader:
         reasoning_core: The UnifiedReasoningCore instance for processing text.
         integration: The ReasoningKnowledgeIntegration instance for knowledge extraction.
         api_url: The URL of the Wikipedia API.
+        cache_dir: The directory where fetched articles are cached, or None to
+            only cache them in memory.
+        cache_size: The maximum number of articles and of searches cached in memory.
+        article_cache: An LRU cache mapping article titles to fetched articles.
+        search_cache: An LRU cache mapping (query, limit) to search results.
     """
     
     def __init__(
@@ -30,7 +44,9 @@ class WikipediaKnowledgeLoader:
         knowledge_graph: KnowledgeGraph,
         reasoning_core: UnifiedReasoningCore,
         integration: Optional[ReasoningKnowledgeIntegration] = None,
-        api_url: str = "https://en.wikipedia.org/w/api.php"
+        api_url: str = "https://en.wikipedia.org/w/api.php",
+        cache_dir: Optional[str] = None,
+        cache_size: int = 1024
     ):
         """
         Initialize a Wikipedia knowledge loader.
@@ -40,6 +56,10 @@ class WikipediaKnowledgeLoader:
             reasoning_core: The UnifiedReasoningCore instance for processing text.
             integration: The ReasoningKnowledgeIntegration instance, or None to create a new one.
             api_url: The URL of the Wikipedia API.
+            cache_dir: The directory where fetched articles are cached, e.g.
+                DEFAULT_CACHE_DIR, or None to only cache them in memory. Articles
+                on disk are never refetched, so they don't pick up later edits.
+            cache_size: The maximum number of articles and of searches cached in memory.
         """
         self.knowledge_graph = knowledge_graph
         self.reasoning_core = reasoning_core
@@ -47,24 +67,111 @@ class WikipediaKnowledgeLoader:
             knowledge_graph, reasoning_core
         )
         self.api_url = api_url
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+        
+        # LRU caches for fetched articles and search results
+        self.article_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.search_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+    
+    def _set_cached(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """
+        Store a value in an LRU cache, evicting the least recently used entry if full.
+        
+        Args:
+            cache: The cache to store the value in.
+            key: The cache key.
+            value: The value to cache.
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+    
+    def _get_cache_path(self, title: str) -> str:
+        """
+        Get the path of the on-disk cache file for an article.
+        
+        Args:
+            title: The title of the article.
+            
+        Returns:
+            The path of the cache file.
+        """
+        key = hashlib.sha1(title.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _load_cached_article(self, title: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an article from the memory or disk cache.
+        
+        Args:
+            title: The title of the article.
+            
+        Returns:
+            The cached article, or None if it is not cached.
+        """
+        if title in self.article_cache:
+            self.article_cache.move_to_end(title)
+            return self.article_cache[title]
+        
+        if self.cache_dir is None:
+            return None
+        
+        try:
+            with open(self._get_cache_path(title), "r", encoding="utf-8") as f:
+                article = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        self._set_cached(self.article_cache, title, article)
+        return article
+    
+    def _store_cached_article(self, title: str, article: Dict[str, Any]) -> None:
+        """
+        Store a fetched article in the memory and disk cache.
+        
+        Args:
+            title: The title the article was fetched by.
+            article: The fetched article.
+        """
+        self._set_cached(self.article_cache, title, article)
+        
+        if self.cache_dir is None:
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._get_cache_path(title), "w", encoding="utf-8") as f:
+                json.dump(article, f)
+        except OSError as e:
+            print(f"Error caching Wikipedia article: {e}")
     
     def fetch_article(self, title: str) -> Dict[str, Any]:
         """
         Fetch a Wikipedia article by title.
         
+        Successfully fetched articles are cached in memory and, if a cache
+        directory is set, on disk, so each article is only requested once.
+        
         Args:
             title: The title of the Wikipedia article to fetch.
             
         Returns:
             A dictionary containing the article content or an error message.
         """
+        cached_article = self._load_cached_article(title)
+        if cached_article is not None:
+            return dict(cached_article)
+        
         try:
             # Set up the API request parameters
             params = {
                 "action": "query",
                 "format": "json",
                 "titles": title,
-                "prop": "extracts",
+                "prop": "extracts|revisions",
+                "rvprop": "ids",  # Get the revision ID of the article
                 "exintro": 1,  # Get only the introduction
                 "explaintext": 1,  # Get plain text content
                 "redirects": 1  # Follow redirects
@@ -93,11 +200,16 @@ class WikipediaKnowledgeLoader:
                     "error": f"No content found for article: {title}"
                 }
             
-            return {
+            revisions = page.get("revisions") or [{}]
+            article = {
                 "success": True,
                 "title": page.get("title", title),
-                "content": content
+                "content": content,
+                "revid": revisions[0].get("revid")
             }
+            self._store_cached_article(title, article)
+            
+            return dict(article)
             
         except Exception as e:
             return {
@@ -124,9 +236,9 @@ class WikipediaKnowledgeLoader:
         try:
             content = article["content"]
             
-            # Process the content in chunks to avoid overwhelming the system
-            chunk_size = 1000  # characters
-            chunks = [content[i:i+chunk_size] for i in range(0, len(content), chunk_size)]
+            # Process the content in chunks of whole sentences to avoid
+            # overwhelming the system
+            chunks = split_into_chunks(content, chunk_size=1000)
             
             results = []
             for chunk in chunks:
@@ -180,6 +292,8 @@ class WikipediaKnowledgeLoader:
         """
         Search for Wikipedia articles matching a query.
         
+        Successful searches are cached in memory.
+        
         Args:
             query: The search query.
             limit: The maximum number of results to return.
@@ -187,6 +301,12 @@ class WikipediaKnowledgeLoader:
         Returns:
             A dictionary containing the search results.
         """
+        cache_key = (query, limit)
+        if cache_key in self.search_cache:
+            self.search_cache.move_to_end(cache_key)
+            cached_result = self.search_cache[cache_key]
+            return {**cached_result, "results": list(cached_result["results"])}
+        
         try:
             # Set up the API request parameters
             params = {
@@ -217,11 +337,14 @@ class WikipediaKnowledgeLoader:
                     "snippet": result.get("snippet", "").replace("<span class=\"searchmatch\">", "").replace("</span>", "")
                 })
             
-            return {
+            search_result = {
                 "success": True,
                 "query": query,
                 "results": results
             }
+            self._set_cached(self.search_cache, cache_key, search_result)
+            
+            return {**search_result, "results": list(results)}
             
         except Exception as e:
             return {
@@ -5,7 +5,10 @@ This module defines the ActivationPattern class, which represents the current st
 of activation in the ideom network in the IRA (Ideom Resolver AI) architecture.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ideom_network import IdeomNetwork
 
 
 class ActivationPattern:
@@ -111,6 +114,22 @@ class ActivationPattern:
         """
         return self.ideom_activations.get(ideom_id, 0.0)
     
+    def activations_for(self, name: str, ideom_network: 'IdeomNetwork') -> List[Tuple[str, float]]:
+        """
+        Get the activations of the ideoms with the given name.
+        
+        Args:
+            name: The name of the ideoms.
+            ideom_network: The ideom network used to look up ideoms by name.
+            
+        Returns:
+            A list of (ideom ID, activation level) tuples for the ideoms with the
+            given name that are in the pattern.
+        """
+        return [(ideom_id, self.ideom_activations[ideom_id])
+                for ideom_id in ideom_network.get_ideom_ids_by_name(name)
+                if ideom_id in self.ideom_activations]
+    
     def is_ideom_active(self, ideom_id: str, threshold: float = 0.5) -> bool:
         """
         Check if an ideom is active.
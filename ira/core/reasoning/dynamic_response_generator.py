@@ -6,6 +6,7 @@ generating responses without templates in the IRA (Ideom Resolver AI) architectu
 """
 
 from typing import Dict, List, Optional, Set, Tuple, Any
+from collections import OrderedDict
 import random
 from .ideom_network import IdeomNetwork
 from .activation_pattern import ActivationPattern
@@ -25,6 +26,10 @@ class DynamicResponseGenerator:
         max_response_length: The maximum length of generated responses.
         min_response_length: The minimum length of generated responses.
         coherence_threshold: The threshold for ensuring response coherence.
+        cache_size: The maximum number of cached generation results.
+        response_cache: An LRU cache of generated responses, keyed by the
+            fingerprint of the activation pattern they were generated from.
+            It is cleared whenever the generation of the ideom network changes.
     """
     
     def __init__(
@@ -32,7 +37,8 @@ class DynamicResponseGenerator:
         ideom_network: IdeomNetwork,
         max_response_length: int = 50,
         min_response_length: int = 5,
-        coherence_threshold: float = 0.3
+        coherence_threshold: float = 0.3,
+        cache_size: int = 256
     ):
         """
         Initialize a dynamic response generator.
@@ -42,11 +48,68 @@ class DynamicResponseGenerator:
             max_response_length: The maximum length of generated responses.
             min_response_length: The minimum length of generated responses.
             coherence_threshold: The threshold for ensuring response coherence.
+            cache_size: The maximum number of cached generation results.
         """
         self.ideom_network = ideom_network
         self.max_response_length = max_response_length
         self.min_response_length = min_response_length
         self.coherence_threshold = coherence_threshold
+        self.cache_size = cache_size
+        self.response_cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._cache_generation = ideom_network.generation
+    
+    def clear_cache(self) -> None:
+        """Clear the response cache. This happens automatically when the ideom network changes."""
+        self.response_cache.clear()
+    
+    def _pattern_fingerprint(self, activation_pattern: ActivationPattern) -> Tuple[Tuple[str, float], ...]:
+        """
+        Compute a hashable fingerprint of an activation pattern.
+        
+        Generation reads the activation level of any connected ideom, not
+        only the most active ones, so the fingerprint holds every activation.
+        
+        Args:
+            activation_pattern: The activation pattern to fingerprint.
+            
+        Returns:
+            A sorted tuple of (ideom ID, activation) pairs.
+        """
+        return tuple(sorted(activation_pattern.get_ideom_activations().items()))
+    
+    def _get_cached(self, key: Tuple) -> Any:
+        """
+        Look up a cached result and mark it as recently used.
+        
+        The cache is cleared first if the ideom network has changed since the
+        cached results were generated.
+        
+        Args:
+            key: The cache key.
+            
+        Returns:
+            The cached result, or None if the key is not cached.
+        """
+        if self.ideom_network.generation != self._cache_generation:
+            self.clear_cache()
+            self._cache_generation = self.ideom_network.generation
+        if key not in self.response_cache:
+            return None
+        self.response_cache.move_to_end(key)
+        return self.response_cache[key]
+    
+    def _set_cached(self, key: Tuple, value: Any) -> None:
+        """
+        Store a result in the cache, evicting the least recently used entry if full.
+        
+        Args:
+            key: The cache key.
+            value: The result to cache.
+        """
+        self.response_cache[key] = value
+        self.response_cache.move_to_end(key)
+        while len(self.response_cache) > self.cache_size:
+            self.response_cache.popitem(last=False)
     
     def generate_response(
         self,
@@ -64,6 +127,32 @@ class DynamicResponseGenerator:
             activation_pattern: The activation pattern to generate a response from.
             seed_words: Optional seed words to start the response with.
             
+        Returns:
+            The generated response.
+        """
+        key = ("response", self._pattern_fingerprint(activation_pattern), tuple(seed_words or ()))
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+        
+        response = self._generate_response(activation_pattern, seed_words, random)
+        self._set_cached(key, response)
+        return response
+    
+    def _generate_response(
+        self,
+        activation_pattern: ActivationPattern,
+        seed_words: Optional[List[str]],
+        rng: Any
+    ) -> str:
+        """
+        Generate a response without consulting the cache.
+        
+        Args:
+            activation_pattern: The activation pattern to generate a response from.
+            seed_words: Optional seed words to start the response with.
+            rng: The random number generator used for random choices.
+            
         Returns:
             The generated response.
         """
@@ -88,13 +177,14 @@ class DynamicResponseGenerator:
                     response_words.append(ideom_names[ideom_id])
         
         # Expand the response
-        return self._expand_response(response_words, activation_pattern, ideom_names)
+        return self._expand_response(response_words, activation_pattern, ideom_names, rng)
     
     def _expand_response(
         self,
         seed_words: List[str],
         activation_pattern: ActivationPattern,
-        ideom_names: Dict[str, str]
+        ideom_names: Dict[str, str],
+        rng: Any = random
     ) -> str:
         """
         Expand a response from seed words.
@@ -103,6 +193,7 @@ class DynamicResponseGenerator:
             seed_words: The seed words to start with.
             activation_pattern: The activation pattern to use for expansion.
             ideom_names: A dictionary mapping ideom IDs to their names.
+            rng: The random number generator used for random choices.
             
         Returns:
             The expanded response.
@@ -110,16 +201,19 @@ class DynamicResponseGenerator:
         # Start with seed words
         response_words = seed_words.copy()
         
-        # Get all active ideoms
-        active_ideoms = activation_pattern.get_active_ideoms()
+        # Get all active ideoms (sorted so that seeded choices are reproducible)
+        active_ideoms = sorted(activation_pattern.get_active_ideoms())
+        
+        # Index the ideom names so words can be looked up without a scan
+        ideom_ids_by_name: Dict[str, List[str]] = {}
+        for ideom_id, name in ideom_names.items():
+            ideom_ids_by_name.setdefault(name.lower(), []).append(ideom_id)
         
         # Keep track of used ideoms to avoid repetition
         used_ideoms = set()
         for word in seed_words:
             # Find ideoms with this name
-            for ideom_id, name in ideom_names.items():
-                if name.lower() == word.lower():
-                    used_ideoms.add(ideom_id)
+            used_ideoms.update(ideom_ids_by_name.get(word.lower(), ()))
         
         # Expand the response until we reach the maximum length
         while len(response_words) < self.max_response_length:
@@ -130,10 +224,7 @@ class DynamicResponseGenerator:
             last_word = response_words[-1]
             
             # Find ideoms with this name
-            last_ideom_ids = []
-            for ideom_id, name in ideom_names.items():
-                if name.lower() == last_word.lower():
-                    last_ideom_ids.append(ideom_id)
+            last_ideom_ids = list(ideom_ids_by_name.get(last_word.lower(), ()))
             
             # If no matching ideoms, try to find semantically similar ones
             if not last_ideom_ids:
@@ -143,7 +234,7 @@ class DynamicResponseGenerator:
             if not last_ideom_ids and active_ideoms:
                 unused_active_ideoms = [ideom_id for ideom_id in active_ideoms if ideom_id not in used_ideoms]
                 if unused_active_ideoms:
-                    last_ideom_ids = [random.choice(unused_active_ideoms)]
+                    last_ideom_ids = [rng.choice(unused_active_ideoms)]
                 else:
                     # If all active ideoms are used, break
                     break
@@ -192,7 +283,7 @@ class DynamicResponseGenerator:
             unused_active_ideoms = [ideom_id for ideom_id in active_ideoms if ideom_id not in used_ideoms]
             while len(response_words) < self.min_response_length and unused_active_ideoms:
                 # Select a random unused active ideom
-                next_ideom_id = random.choice(unused_active_ideoms)
+                next_ideom_id = rng.choice(unused_active_ideoms)
                 unused_active_ideoms.remove(next_ideom_id)
                 
                 next_ideom = self.ideom_network.get_ideom(next_ideom_id)
@@ -312,6 +403,15 @@ class DynamicResponseGenerator:
         Returns:
             A list of generated responses.
         """
+        fingerprint = self._pattern_fingerprint(activation_pattern)
+        key = ("responses", fingerprint, count)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return list(cached)
+        
+        # Seed the random choices from the fingerprint so that the cached
+        # list is the same one a fresh generation would produce
+        rng = random.Random(repr(fingerprint))
         responses = []
         
         # Get the most active ideoms
@@ -332,9 +432,9 @@ class DynamicResponseGenerator:
                 seed_words = [ideom_names[ideom_id] for ideom_id in most_active_ideoms[:2] if ideom_id in ideom_names]
             elif i == 1:
                 # Second response: use a random selection of active ideoms
-                active_ideoms = list(activation_pattern.get_active_ideoms())
+                active_ideoms = sorted(activation_pattern.get_active_ideoms())
                 if active_ideoms:
-                    random_ideoms = random.sample(active_ideoms, min(2, len(active_ideoms)))
+                    random_ideoms = rng.sample(active_ideoms, min(2, len(active_ideoms)))
                     seed_words = [ideom_names[ideom_id] for ideom_id in random_ideoms if ideom_id in ideom_names]
                 else:
                     seed_words = []
@@ -349,13 +449,14 @@ class DynamicResponseGenerator:
                     
                     # Select random words from previous responses
                     if prev_words:
-                        seed_words = random.sample(prev_words, min(2, len(prev_words)))
+                        seed_words = rng.sample(prev_words, min(2, len(prev_words)))
             
             # Generate a response with these seed words
-            response = self.generate_response(activation_pattern, seed_words)
+            response = self._generate_response(activation_pattern, seed_words, rng)
             
             # Add to the list if it's not empty and not a duplicate
             if response and response not in responses:
                 responses.append(response)
         
-        return responses
\ No newline at end of file
+        self._set_cached(key, responses)
+        return list(responses)
\ No newline at end of file
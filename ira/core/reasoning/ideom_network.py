@@ -5,6 +5,7 @@ This module defines the IdeomNetwork class, which manages a collection of ideoms
 and their connections in the IRA (Ideom Resolver AI) architecture.
 """
 
+import uuid
 from typing import Dict, List, Optional, Set
 from .ideom import Ideom
 
@@ -18,11 +19,17 @@ class IdeomNetwork:
     
     Attributes:
         ideoms: A dictionary mapping ideom IDs to Ideom instances.
+        ideom_ids_by_name: A dictionary mapping ideom names to the IDs of the
+            ideoms with that name, for constant-time lookup by name.
+        generation: A counter that is incremented whenever ideoms or their
+            connections change, so that cached results can be invalidated.
     """
     
     def __init__(self):
         """Initialize an empty ideom network."""
         self.ideoms: Dict[str, Ideom] = {}
+        self.ideom_ids_by_name: Dict[str, List[str]] = {}
+        self.generation = 0
     
     def get_ideom(self, ideom_id: str) -> Optional[Ideom]:
         """
@@ -43,7 +50,47 @@ class IdeomNetwork:
         Args:
             ideom: The Ideom instance to add.
         """
+        existing = self.ideoms.get(ideom.id)
+        if existing is not None and existing.name != ideom.name:
+            self._unindex_name(existing)
+        if existing is None or existing.name != ideom.name:
+            self.ideom_ids_by_name.setdefault(ideom.name, []).append(ideom.id)
+        
         self.ideoms[ideom.id] = ideom
+        self.generation += 1
+    
+    def add_ideoms_bulk(self, names: List[str]) -> List[str]:
+        """
+        Create and add a new ideom for each of the given names.
+        
+        This does not check for existing ideoms with the same names, so
+        callers should pass only the names that still need an ideom.
+        
+        Args:
+            names: The names of the ideoms to create.
+            
+        Returns:
+            The IDs of the new ideoms, in the order of the names.
+        """
+        ideom_ids = [str(uuid.uuid4()) for _ in names]
+        for ideom_id, name in zip(ideom_ids, names):
+            self.ideoms[ideom_id] = Ideom(id=ideom_id, name=name)
+            self.ideom_ids_by_name.setdefault(name, []).append(ideom_id)
+        self.generation += 1
+        return ideom_ids
+    
+    def _unindex_name(self, ideom: Ideom) -> None:
+        """
+        Remove an ideom from the name index.
+        
+        Args:
+            ideom: The Ideom instance to remove.
+        """
+        ideom_ids = self.ideom_ids_by_name.get(ideom.name)
+        if ideom_ids and ideom.id in ideom_ids:
+            ideom_ids.remove(ideom.id)
+            if not ideom_ids:
+                del self.ideom_ids_by_name[ideom.name]
     
     def remove_ideom(self, ideom_id: str) -> None:
         """
@@ -59,7 +106,9 @@ class IdeomNetwork:
                     self.ideoms[other_ideom_id] = other_ideom.remove_connection(ideom_id)
             
             # Remove the ideom itself
+            self._unindex_name(self.ideoms[ideom_id])
             del self.ideoms[ideom_id]
+            self.generation += 1
     
     def connect_ideoms(self, ideom1_id: str, ideom2_id: str, strength: float) -> None:
         """
@@ -81,6 +130,7 @@ class IdeomNetwork:
         
         self.ideoms[ideom1_id] = ideom1.update_connection(ideom2_id, strength)
         self.ideoms[ideom2_id] = ideom2.update_connection(ideom1_id, strength)
+        self.generation += 1
     
     def get_connected_ideoms(self, ideom_id: str) -> List[Ideom]:
         """
@@ -149,7 +199,19 @@ class IdeomNetwork:
         Returns:
             A list of Ideom instances with the given name.
         """
-        return [ideom for ideom in self.ideoms.values() if ideom.name == name]
+        return [self.ideoms[ideom_id] for ideom_id in self.ideom_ids_by_name.get(name, ())]
+    
+    def get_ideom_ids_by_name(self, name: str) -> List[str]:
+        """
+        Get the IDs of all ideoms with the given name.
+        
+        Args:
+            name: The name to search for.
+            
+        Returns:
+            A list of IDs of ideoms with the given name.
+        """
+        return list(self.ideom_ids_by_name.get(name, ()))
     
     def get_strongly_connected_ideoms(self, ideom_id: str, threshold: float = 0.5) -> List[Ideom]:
         """
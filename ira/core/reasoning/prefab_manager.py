@@ -6,7 +6,7 @@ and provides methods for finding matching prefabs based on activation patterns.
 """
 
 import uuid
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 from .prefab import Prefab
 from .activation_pattern import ActivationPattern
 
@@ -42,6 +42,15 @@ class PrefabManager:
         """
         self.prefabs[prefab.id] = prefab
     
+    def add_prefabs_bulk(self, prefabs: Iterable[Prefab]) -> None:
+        """
+        Add several prefabs to the manager at once.
+        
+        Args:
+            prefabs: The Prefab instances to add.
+        """
+        self.prefabs.update((prefab.id, prefab) for prefab in prefabs)
+    
     def remove_prefab(self, prefab_id: str) -> None:
         """
         Remove a prefab from the manager.
@@ -5,45 +5,74 @@ This module defines the TextProcessor class, which is responsible for converting
 text to ideom activations in the IRA (Ideom Resolver AI) architecture.
 """
 
+import functools
 import re
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional
 import nltk
-from nltk.tokenize import word_tokenize
+import spacy
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 from .ideom_network import IdeomNetwork
 from .ideom import Ideom
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    print("Downloading punkt tokenizer...")
-    nltk.download('punkt')
 
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    print("Downloading punkt_tab tokenizer...")
-    # The punkt_tab resource is part of the 'all' package
-    nltk.download('all')
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    print("Downloading stopwords...")
-    nltk.download('stopwords')
+def _ensure_nltk_resource(resource: str, package: str) -> None:
+    """
+    Download an NLTK data package if it is not installed yet.
+    
+    Args:
+        resource: The NLTK resource path, e.g. 'corpora/stopwords'.
+        package: The name of the package providing the resource.
+    """
+    try:
+        nltk.data.find(resource)
+    except LookupError:
+        print(f"Downloading {package}...")
+        nltk.download(package, quiet=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _stop_words() -> FrozenSet[str]:
+    """
+    Get the English stop words, loading them on first use.
+    
+    Returns:
+        A frozenset of English stop words shared by all text processors.
+    """
+    _ensure_nltk_resource('corpora/stopwords', 'stopwords')
+    return frozenset(stopwords.words('english'))
+
+
+@functools.lru_cache(maxsize=None)
+def _lemmatizer() -> WordNetLemmatizer:
+    """
+    Get the WordNet lemmatizer, creating it on first use.
+    
+    Returns:
+        A WordNetLemmatizer shared by all text processors.
+    """
+    _ensure_nltk_resource('corpora/wordnet', 'wordnet')
+    return WordNetLemmatizer()
 
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    print("Downloading wordnet...")
-    nltk.download('wordnet')
 
-# Ensure punkt is properly downloaded
-if not nltk.download('punkt', quiet=True):
-    print("Warning: Failed to download punkt tokenizer. Some functionality may not work.")
+@functools.lru_cache(maxsize=100_000)
+def _lemmatize(word: str) -> str:
+    """
+    Lemmatize a word, caching the result across all text processors.
+    
+    Args:
+        word: The word to lemmatize.
+        
+    Returns:
+        The lemma of the word.
+    """
+    return _lemmatizer().lemmatize(word)
 
 
+# spaCy's rule-based English tokenizer, which needs no trained model or data
+# download
+_tokenizer = spacy.blank("en").tokenizer
+
 
 class TextProcessor:
     """
@@ -54,8 +83,8 @@ class TextProcessor:
     
     Attributes:
         ideom_network: The ideom network to use for ideom lookup and creation.
-        lemmatizer: The WordNet lemmatizer for word normalization.
-        stop_words: A set of stop words to filter out.
+        lemmatizer: The WordNet lemmatizer for word normalization, loaded on first use.
+        stop_words: A frozenset of stop words to filter out, loaded on first use.
         n_gram_sizes: The sizes of n-grams to consider.
         semantic_similarity_threshold: The threshold for semantic similarity.
     """
@@ -75,17 +104,22 @@ class TextProcessor:
             semantic_similarity_threshold: The threshold for semantic similarity.
         """
         self.ideom_network = ideom_network
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
         self.n_gram_sizes = n_gram_sizes or [1, 2, 3]
         self.semantic_similarity_threshold = semantic_similarity_threshold
         
-        # Cache for lemmatized words
-        self.lemma_cache: Dict[str, str] = {}
-        
         # Cache for multi-word ideoms
         self.multi_word_ideoms: Dict[str, List[str]] = {}
     
+    @property
+    def lemmatizer(self) -> WordNetLemmatizer:
+        """The shared WordNet lemmatizer, loaded on first use."""
+        return _lemmatizer()
+    
+    @property
+    def stop_words(self) -> FrozenSet[str]:
+        """The shared English stop words, loaded on first use."""
+        return _stop_words()
+    
     def process_text(self, text: str, initial_activation: float = 1.0) -> List[Tuple[str, float]]:
         """
         Process text and convert it to ideom activations.
@@ -127,7 +161,7 @@ class TextProcessor:
             A list of preprocessed tokens.
         """
         # Tokenize
-        tokens = word_tokenize(text.lower())
+        tokens = [token.text for token in _tokenizer(text.lower())]
         
         # Remove punctuation
         tokens = [token for token in tokens if token.isalnum()]
@@ -136,12 +170,7 @@ class TextProcessor:
         processed_tokens = []
         for token in tokens:
             if token not in self.stop_words:
-                if token in self.lemma_cache:
-                    lemma = self.lemma_cache[token]
-                else:
-                    lemma = self.lemmatizer.lemmatize(token)
-                    self.lemma_cache[token] = lemma
-                processed_tokens.append(lemma)
+                processed_tokens.append(_lemmatize(token))
         
         return processed_tokens
     
@@ -340,8 +369,8 @@ class TextProcessor:
             The word relationship similarity score (0.0 to 1.0).
         """
         # Tokenize and lemmatize
-        tokens1 = [self.lemmatizer.lemmatize(token) for token in text1.split()]
-        tokens2 = [self.lemmatizer.lemmatize(token) for token in text2.split()]
+        tokens1 = [_lemmatize(token) for token in text1.split()]
+        tokens2 = [_lemmatize(token) for token in text2.split()]
         
         # Check for direct matches
         direct_matches = sum(1 for token in tokens1 if token in tokens2)
@@ -501,8 +530,8 @@ class TextProcessor:
         word2 = word2.lower()
         
         # Lemmatize words
-        lemma1 = self.lemmatizer.lemmatize(word1)
-        lemma2 = self.lemmatizer.lemmatize(word2)
+        lemma1 = _lemmatize(word1)
+        lemma2 = _lemmatize(word2)
         
         # If the lemmatized words are the same, high similarity
         if lemma1 == lemma2:
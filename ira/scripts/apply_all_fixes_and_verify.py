@@ -110,8 +110,9 @@ def verify_chat_interface():
             print("  punkt_tab tokenizer is available")
         except LookupError:
             print("  punkt_tab tokenizer is not available, downloading...")
-            # The punkt_tab resource is part of the 'all' package
-            nltk.download('all')
+            # Fall back to punkt on NLTK releases whose index has no punkt_tab
+            if not nltk.download('punkt_tab', quiet=True):
+                nltk.download('punkt', quiet=True)
         
         try:
             nltk.data.find('corpora/stopwords')
@@ -5,18 +5,13 @@ This script tests the functionality of the Conversation Knowledge Integration co
 which connects the Conversation Manager with the Knowledge Graph.
 """
 
-import sys
-import os
 import time
 from datetime import datetime
 
-# Add the parent directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from ira.core.conversation.conversation_context import ConversationContext, Message, MessageType
 from ira.core.conversation.intent_recognizer import IntentRecognizer, Intent, IntentType
 from ira.core.conversation.response_planner import ResponsePlanner
-from ira.core.conversation.memory_manager import MemoryManager
+from ira.core.conversation.memory_manager import MemoryManager, InMemoryStorage
 from ira.core.conversation.conversation_manager import ConversationManager
 from ira.core.knowledge.knowledge_graph import KnowledgeGraph
 from ira.core.knowledge.concept_node import ConceptNode
@@ -297,7 +292,7 @@ def test_integration_with_conversation_manager(kg, integration):
     print("\n=== Testing Integration with Conversation Manager ===")
     
     # Create a conversation manager
-    memory_manager = MemoryManager()
+    memory_manager = MemoryManager(storage=InMemoryStorage())
     intent_recognizer = IntentRecognizer()
     response_planner = ResponsePlanner()
     
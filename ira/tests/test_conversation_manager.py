@@ -6,18 +6,10 @@ including the ConversationContext, IntentRecognizer, ResponsePlanner,
 MemoryManager, and ConversationManager classes.
 """
 
-import sys
-import os
-import time
-from datetime import datetime
-
-# Add the parent directory to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from ira.core.conversation.conversation_context import ConversationContext, Message, MessageType, ConversationState
 from ira.core.conversation.intent_recognizer import IntentRecognizer, Intent, IntentType
 from ira.core.conversation.response_planner import ResponsePlanner
-from ira.core.conversation.memory_manager import MemoryManager
+from ira.core.conversation.memory_manager import MemoryManager, InMemoryStorage
 from ira.core.conversation.conversation_manager import ConversationManager
 
 
@@ -35,14 +27,11 @@ def test_conversation_context():
     # Add some messages
     context.add_message(Message(
         content="Hello, how are you?",
-        type=MessageType.USER,
-        timestamp=datetime.now()
+        type=MessageType.USER
     ))
-    time.sleep(0.1)  # Sleep to ensure different timestamps
     context.add_message(Message(
         content="I'm doing well, thank you for asking!",
-        type=MessageType.SYSTEM,
-        timestamp=datetime.now()
+        type=MessageType.SYSTEM
     ))
     
     # Print the messages
@@ -74,6 +63,11 @@ def test_conversation_context():
     assert context.state == new_context.state, "Context states don't match"
     assert len(context.messages) == len(new_context.messages), "Message counts don't match"
     assert context.metadata == new_context.metadata, "Metadata doesn't match"
+    for message, new_message in zip(context.messages, new_context.messages):
+        assert message.id == new_message.id, "Message IDs don't match"
+        assert message.content == new_message.content, "Message contents don't match"
+        assert message.type == new_message.type, "Message types don't match"
+        assert message.timestamp == new_message.timestamp, "Message timestamps don't match"
     
     print("\nConversationContext tests passed!")
 
@@ -112,6 +106,31 @@ def test_intent_recognizer():
     print("\nIntentRecognizer tests passed!")
 
 
+def test_intent_recognizer_custom_patterns():
+    """Test that the IntentRecognizer uses its own intent patterns."""
+    import re
+    
+    recognizer = IntentRecognizer(intent_patterns={
+        IntentType.COMMAND: [re.compile(r"^run\b.*$")]
+    })
+    assert recognizer.recognize_intent("run the tests").type == IntentType.COMMAND
+    assert recognizer.recognize_intent("what is a dog?").type == IntentType.UNKNOWN
+    
+    # Patterns added later are used too
+    recognizer.intent_patterns[IntentType.QUERY] = [re.compile(r".*\?$")]
+    assert recognizer.recognize_intent("what is a dog?").type == IntentType.QUERY
+    
+    # Custom patterns keep their own groups, inline flags and backreferences
+    recognizer = IntentRecognizer(intent_patterns={
+        IntentType.COMMAND: [re.compile(r"(?i)^run (?P<target>\w+)$"), re.compile(r"^do (\w+) \1$")],
+        IntentType.QUERY: [re.compile(r"^(?P<target>\w+)\?$")]
+    })
+    assert recognizer.recognize_intent("run tests").type == IntentType.COMMAND
+    assert recognizer.recognize_intent("do it it").type == IntentType.COMMAND
+    assert recognizer.recognize_intent("do it now").type == IntentType.UNKNOWN
+    assert recognizer.recognize_intent("tests?").type == IntentType.QUERY
+
+
 def test_response_planner():
     """Test the ResponsePlanner class."""
     print("\n=== Testing ResponsePlanner ===")
@@ -144,8 +163,9 @@ def test_memory_manager():
     """Test the MemoryManager class."""
     print("\n=== Testing MemoryManager ===")
     
-    # Create a memory manager
-    memory_manager = MemoryManager()
+    # Create a memory manager backed by in-memory storage
+    storage = InMemoryStorage()
+    memory_manager = MemoryManager(storage=storage)
     print("Created MemoryManager")
     
     # Create some contexts
@@ -158,24 +178,20 @@ def test_memory_manager():
     # Add some messages to the contexts
     context1.add_message(Message(
         content="Hello, how are you?",
-        type=MessageType.USER,
-        timestamp=datetime.now()
+        type=MessageType.USER
     ))
     context1.add_message(Message(
         content="I'm doing well, thank you for asking!",
-        type=MessageType.SYSTEM,
-        timestamp=datetime.now()
+        type=MessageType.SYSTEM
     ))
     
     context2.add_message(Message(
         content="What is the weather like today?",
-        type=MessageType.USER,
-        timestamp=datetime.now()
+        type=MessageType.USER
     ))
     context2.add_message(Message(
         content="I'm sorry, I don't have access to real-time weather information.",
-        type=MessageType.SYSTEM,
-        timestamp=datetime.now()
+        type=MessageType.SYSTEM
     ))
     
     # Test getting contexts
@@ -201,7 +217,7 @@ def test_memory_manager():
     memory_manager.save_memory()
     
     # Create a new memory manager and load the memory
-    new_memory_manager = MemoryManager()
+    new_memory_manager = MemoryManager(storage=storage)
     print("Created new MemoryManager")
     
     print("Loading memory...")
@@ -216,6 +232,9 @@ def test_memory_manager():
     print(f"Loaded context 2 with ID: {loaded_context2.id}")
     print(f"Messages in loaded context 2: {len(loaded_context2.messages)}")
     
+    assert loaded_context1.messages == context1.messages, "Loaded messages don't match"
+    assert loaded_context2.messages == context2.messages, "Loaded messages don't match"
+    
     # Test deleting a context
     print("\nDeleting context 2...")
     memory_manager.delete_context(context2.id)
@@ -224,20 +243,81 @@ def test_memory_manager():
     deleted_context = memory_manager.get_context(context2.id)
     print(f"Deleted context: {deleted_context}")
     
-    # Clean up
-    print("\nCleaning up...")
-    if os.path.exists(memory_manager.memory_file):
-        os.remove(memory_manager.memory_file)
-    
     print("\nMemoryManager tests passed!")
 
 
+def test_memory_manager_message_log():
+    """Test appending messages to the MemoryManager message log."""
+    print("\n=== Testing MemoryManager message log ===")
+    
+    storage = InMemoryStorage()
+    memory_manager = MemoryManager(storage=storage)
+    context = memory_manager.create_context()
+    memory_manager.save_memory()
+    
+    # Appended messages only go to the log
+    memory_manager.append_message(context.id, Message.create_user_message("What is a dog?"))
+    memory_manager.append_message(context.id, Message.create_system_message("A dog is an animal."))
+    log_lines = storage.files[memory_manager.log_file].splitlines()
+    print(f"Log entries: {len(log_lines)}")
+    assert len(log_lines) == 2, "Messages weren't appended to the log"
+    
+    # Loading replays the log on top of the snapshot
+    new_memory_manager = MemoryManager(storage=storage)
+    new_memory_manager.load_memory()
+    loaded_context = new_memory_manager.get_context(context.id)
+    assert loaded_context.messages == context.messages, "Logged messages weren't replayed"
+    
+    # Saving a snapshot compacts the log
+    memory_manager.save_memory()
+    assert storage.files[memory_manager.log_file] == b"", "Log wasn't compacted"
+    
+    new_memory_manager = MemoryManager(storage=storage)
+    new_memory_manager.load_memory()
+    assert new_memory_manager.get_context(context.id).messages == context.messages, \
+        "Messages were lost or duplicated by compaction"
+    
+    print("\nMemoryManager message log tests passed!")
+
+
+def test_memory_manager_context_log():
+    """Test that context changes between snapshots survive a reload."""
+    print("\n=== Testing MemoryManager context log ===")
+    
+    storage = InMemoryStorage()
+    memory_manager = MemoryManager(storage=storage)
+    memory_manager.save_memory()
+    
+    # Create and change contexts without saving a snapshot
+    context = memory_manager.create_context()
+    context.set_metadata("user_name", "Ada")
+    context.set_state(ConversationState.IDLE)
+    memory_manager.update_context(context.id)
+    memory_manager.append_message(context.id, Message.create_user_message("What is a dog?"))
+    deleted_context = memory_manager.create_context()
+    memory_manager.delete_context(deleted_context.id)
+    
+    new_memory_manager = MemoryManager(storage=storage)
+    new_memory_manager.load_memory()
+    loaded_context = new_memory_manager.get_context(context.id)
+    assert loaded_context is not None, "Created context wasn't replayed"
+    assert loaded_context.metadata == {"user_name": "Ada"}, "Context metadata wasn't replayed"
+    assert loaded_context.state == ConversationState.IDLE, "Context state wasn't replayed"
+    assert loaded_context.created_at == context.created_at, "Context creation time wasn't replayed"
+    assert loaded_context.messages == context.messages, "Logged messages weren't replayed"
+    assert new_memory_manager.get_context(deleted_context.id) is None, "Deleted context was restored"
+    
+    print("\nMemoryManager context log tests passed!")
+
+
 def test_conversation_manager():
     """Test the ConversationManager class."""
     print("\n=== Testing ConversationManager ===")
     
     # Create a conversation manager
-    conversation_manager = ConversationManager()
+    conversation_manager = ConversationManager(
+        memory_manager=MemoryManager(storage=InMemoryStorage())
+    )
     print("Created ConversationManager")
     
     # Process some messages
@@ -262,26 +342,5 @@ def test_conversation_manager():
     print(f"\nActive context ID: {context.id}")
     print(f"Messages in active context: {len(context.messages)}")
     
-    # Clean up
-    print("\nCleaning up...")
-    if os.path.exists(conversation_manager.memory_manager.memory_file):
-        os.remove(conversation_manager.memory_manager.memory_file)
-    
     print("\nConversationManager tests passed!")
 
-
-def main():
-    """Run all tests."""
-    print("=== Running Conversation Manager Tests ===")
-    
-    test_conversation_context()
-    test_intent_recognizer()
-    test_response_planner()
-    test_memory_manager()
-    test_conversation_manager()
-    
-    print("\n=== All tests passed! ===")
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -5,52 +5,39 @@ Test script for the IRA system.
 
 import sys
 import os
-import nltk
+
+import pytest
 
 # Add the parent directory to the path so we can import the modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    print("Downloading punkt tokenizer...")
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    print("Downloading punkt_tab tokenizer...")
-    # The punkt_tab resource is part of the 'all' package
-    nltk.download('all')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    print("Downloading stopwords...")
-    nltk.download('stopwords')
-
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    print("Downloading wordnet...")
-    nltk.download('wordnet')
-
-# Ensure punkt is properly downloaded
-if not nltk.download('punkt', quiet=True):
-    print("Warning: Failed to download punkt tokenizer. Some functionality may not work.")
-
 from ira.core.ira_system import IRASystem
 from ira.core.knowledge.knowledge_graph import KnowledgeGraph
 from ira.core.reasoning.ideom_network import IdeomNetwork
+from ira.core.reasoning.activation_pattern import ActivationPattern
+from ira.core.reasoning.dynamic_response_generator import DynamicResponseGenerator
 from ira.core.reasoning.unified_reasoning_core import UnifiedReasoningCore
 from ira.core.integration.reasoning_knowledge_integration import ReasoningKnowledgeIntegration
 from ira.core.integration.reasoning_knowledge_integration_bugfixes import apply_bug_fixes
 
-def test_ira_system():
-    """Test the IRA system."""
-    print("Testing IRA system...")
+# Queries processed by the IRA system test. Each one runs against its own
+# IRA system, so the cases are independent and can be distributed across
+# pytest-xdist workers.
+TEST_QUERIES = [
+    "What is a dog?",
+    "What sound does a cat make?",
+    "How many legs does a dog have?",
+    "Is a cat an animal?"
+]
+
+
+def _create_ira_system():
+    """
+    Create an IRA system with some test concepts.
     
+    Returns:
+        The IRA system.
+    """
     # Initialize the components
     knowledge_graph = KnowledgeGraph()
     ideom_network = IdeomNetwork()
@@ -72,9 +59,8 @@ def test_ira_system():
     )
     
     # Add some test concepts
-    dog_concept = knowledge_graph.add_concept("dog")
-    knowledge_graph.update_concept(
-        dog_concept.id,
+    knowledge_graph.add_concept(
+        "dog",
         properties={
             "type": "animal",
             "legs": "four",
@@ -82,9 +68,8 @@ def test_ira_system():
         }
     )
     
-    cat_concept = knowledge_graph.add_concept("cat")
-    knowledge_graph.update_concept(
-        cat_concept.id,
+    knowledge_graph.add_concept(
+        "cat",
         properties={
             "type": "animal",
             "legs": "four",
@@ -96,21 +81,54 @@ def test_ira_system():
     reasoning_integration.create_ideoms_from_concepts()
     reasoning_integration.create_prefabs_from_concepts()
     
-    # Test processing a message
-    test_queries = [
-        "What is a dog?",
-        "What sound does a cat make?",
-        "How many legs does a dog have?",
-        "Is a cat an animal?"
-    ]
+    return ira
+
+
+@pytest.mark.parametrize("query", TEST_QUERIES)
+def test_ira_system(query):
+    """Test processing a message with the IRA system."""
+    # process_message updates the knowledge graph, the ideom network and the
+    # conversation context, so every query gets a fresh system
+    ira = _create_ira_system()
     
-    print("\nTesting message processing:")
-    for query in test_queries:
-        response = ira.process_message(query)
-        print(f"Query: {query}")
-        print(f"Response: {response}")
-        print()
+    response = ira.process_message(query)
+    print(f"Query: {query}")
+    print(f"Response: {response}")
+    
+    assert isinstance(response, str)
+
+
+def test_response_cache(monkeypatch):
+    """Test that cached responses are reused until the ideom network changes."""
+    ideom_network = IdeomNetwork()
+    dog_id, animal_id = ideom_network.add_ideoms_bulk(["dog", "animal"])
+    ideom_network.connect_ideoms(dog_id, animal_id, 0.9)
+    activation_pattern = ActivationPattern()
+    activation_pattern.add_ideom_activation(dog_id, 1.0)
+    activation_pattern.add_ideom_activation(animal_id, 0.8)
+    
+    generator = DynamicResponseGenerator(ideom_network=ideom_network)
+    calls = []
+    generate = generator._generate_response
+    monkeypatch.setattr(generator, "_generate_response", lambda *args: calls.append(args) or generate(*args))
+    
+    # A repeated request is a hit, other seed words are a miss
+    response = generator.generate_response(activation_pattern)
+    assert generator.generate_response(activation_pattern) == response
+    assert len(calls) == 1
+    generator.generate_response(activation_pattern, seed_words=["dog"])
+    assert len(calls) == 2
+    
+    # Changing the network invalidates the cached responses
+    cat_id = ideom_network.add_ideoms_bulk(["cat"])[0]
+    ideom_network.connect_ideoms(cat_id, animal_id, 0.9)
+    generator.generate_response(activation_pattern)
+    assert len(calls) == 3
+    assert len(generator.response_cache) == 1
 
 if __name__ == "__main__":
     print("=== Testing IRA System ===\n")
-    test_ira_system()
\ No newline at end of file
+    print("\nTesting message processing:")
+    for query in TEST_QUERIES:
+        test_ira_system(query)
+        print()
@@ -7,7 +7,11 @@ and verifies that the implementation works correctly.
 
 import sys
 import os
-import uuid
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -52,7 +56,7 @@ def test_relation():
     
     # Create a relation
     relation = Relation(
-        id=str(uuid.uuid4()),
+        id="cat-is_a-animal",
         type="is_a",
         source_concept_id="cat",
         target_concept_id="animal",
@@ -95,13 +99,17 @@ def test_concept_node():
     print(f"Aliases: {concept.get_aliases()}")
     print(f"Categories: {concept.get_categories()}")
     
+    # Recurring strings are shared between concepts
+    lion = ConceptNode(id="lion", name="Lion", categories=["".join(["mam", "mal"])])
+    assert lion.get_categories()[0] is concept.get_categories()[0]
+    
     # Add a property
     concept = concept.set_property("sound", PropertyValue(value="meow", confidence=1.0))
     print(f"Added property: {concept.get_property('sound')}")
     
     # Add a relation
     relation = Relation(
-        id=str(uuid.uuid4()),
+        id="cat-is_a-animal",
         type="is_a",
         source_concept_id="cat",
         target_concept_id="animal",
@@ -168,6 +176,10 @@ def test_semantic_similarity():
     print(f"Similarity between '{text1}' and '{text2}': {sim1}")
     print(f"Similarity between '{text1}' and '{text3}': {sim2}")
     
+    # The batched similarities match the pairwise ones
+    sims = similarity.text_similarities(text1, [text2, text3])
+    assert abs(sims[0] - sim1) < 1e-9 and abs(sims[1] - sim2) < 1e-9
+    
     # Test concept similarity
     concept1 = ConceptNode(
         id="cat",
@@ -195,6 +207,30 @@ def test_semantic_similarity():
     
     print(f"Similarity between '{concept1.get_name()}' and '{concept2.get_name()}': {sim1}")
     print(f"Similarity between '{concept1.get_name()}' and '{concept3.get_name()}': {sim2}")
+    
+    # The pairwise similarity matrix matches the single-pair similarities
+    pairwise = SemanticSimilarity(embedding_dimension=256)
+    matrix = similarity.concept_similarity_matrix([concept1, concept2, concept3])
+    assert abs(matrix[0, 1] - pairwise.concept_similarity(concept1, concept2)) < 1e-9
+    assert abs(matrix[1, 2] - pairwise.concept_similarity(concept2, concept3)) < 1e-9
+
+
+def test_numba_scorer(monkeypatch):
+    """Test that the Numba cosine kernel matches the NumPy one."""
+    pytest.importorskip("numba")
+    from ira.core.knowledge import semantic_similarity
+    
+    # Restore the NumPy kernel after the test
+    monkeypatch.setattr(semantic_similarity, "_cosine", semantic_similarity._cosine)
+    assert semantic_similarity.activate_numba_scorer()
+    
+    similarity = SemanticSimilarity(embedding_dimension=256)
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        a, b = rng.standard_normal(256), rng.standard_normal(256)
+        expected = semantic_similarity._cosine_numpy(a, b)
+        assert abs(similarity.cosine_similarity(list(a), list(b)) - expected) < 1e-12
+    assert similarity.cosine_similarity([0.0, 0.0], [1.0, 2.0]) == 0.0
 
 
 def test_self_organizing_structure():
@@ -251,7 +287,7 @@ def test_self_organizing_structure():
         print(f"Cluster {i}: {cluster}")
 
 
-def test_knowledge_graph():
+def test_knowledge_graph(tmp_path):
     """Test the KnowledgeGraph class."""
     print("\n=== Testing KnowledgeGraph ===")
     
@@ -304,6 +340,7 @@ def test_knowledge_graph():
         relation_type="is_a",
         bidirectional=False
     )
+    assert cat_is_animal.id != dog_is_animal.id, "Relation IDs aren't unique"
     
     # Print the knowledge graph
     print(f"Number of concepts: {kg.get_concept_count()}")
@@ -330,9 +367,15 @@ def test_knowledge_graph():
     similar_to_cat = kg.find_similar_concepts("Cat", threshold=0.3)
     print(f"Concepts similar to Cat: {[(concept.get_name(), score) for concept, score in similar_to_cat]}")
     
+    # Repeated queries are served from the cache until the graph changes
+    assert kg.find_similar_concepts("Cat", threshold=0.3) == similar_to_cat
+    assert ("name", "Cat", 0.3, 10) in kg.similar_concepts_cache
+    
     # Find path between concepts
     paths = kg.find_path_between_concepts(cat.get_id(), animal.get_id())
     print(f"Paths between Cat and Animal: {paths}")
+    assert paths and kg.find_path_between_concepts(cat.get_id(), animal.get_id()) == paths
+    assert (cat.get_id(), animal.get_id(), 5) in kg.path_cache
     
     # Update a concept
     updated_cat = kg.update_concept(
@@ -341,19 +384,43 @@ def test_knowledge_graph():
     )
     
     print(f"Updated Cat properties: {updated_cat.get_properties()}")
+    assert not kg.similar_concepts_cache, "Updating a concept didn't invalidate the cache"
+    assert not kg.path_cache, "Updating a concept didn't invalidate the path cache"
     
     # Reorganize the knowledge graph
     changes = kg.reorganize()
     print(f"Made {changes} changes during reorganization")
     
     # Save and load the knowledge graph
-    kg.save_to_file("test_knowledge_graph.json")
-    loaded_kg = KnowledgeGraph.load_from_file("test_knowledge_graph.json")
-    
-    if loaded_kg:
-        print(f"Loaded knowledge graph with {loaded_kg.get_concept_count()} concepts")
-    else:
-        print("Failed to load knowledge graph")
+    file_path = tmp_path / "kg.json"
+    assert kg.save_to_file(str(file_path)), "Failed to save knowledge graph"
+    loaded_kg = KnowledgeGraph.load_from_file(str(file_path))
+    
+    assert loaded_kg is not None, "Failed to load knowledge graph"
+    print(f"Loaded knowledge graph with {loaded_kg.get_concept_count()} concepts")
+    assert loaded_kg.get_concept_count() == kg.get_concept_count()
+    
+    # Add several concepts at once
+    generation = loaded_kg.generation
+    fish, bird, fish_again = loaded_kg.add_concepts_bulk([
+        {"name": "Fish", "properties": {"legs": "0"}, "categories": ["pet"]},
+        {"name": "Bird", "aliases": ["avian"], "categories": ["pet"]},
+        {"name": "fish"}
+    ])
+    assert fish_again is fish
+    assert loaded_kg.get_concept_count() == kg.get_concept_count() + 2
+    assert loaded_kg.get_concept_by_alias("avian") is bird
+    assert fish.get_property_value("legs") == "0"
+    assert {fish.id, bird.id} <= {c.id for c in loaded_kg.get_concepts_by_category("pet")}
+    assert loaded_kg.generation == generation + 1
+    
+    # Categories without concepts leave the index
+    category_count = loaded_kg.get_category_count()
+    loaded_kg.update_concept(bird.id, categories=["bird"])
+    loaded_kg.remove_concept(bird.id)
+    assert "bird" not in loaded_kg.get_all_categories()
+    assert loaded_kg.get_category_count() == category_count
+    assert [c.id for c in loaded_kg.get_concepts_by_category("pet")].count(fish.id) == 1
 
 
 def run_all_tests():
@@ -364,7 +431,8 @@ def run_all_tests():
     test_uncertainty_handler()
     test_semantic_similarity()
     test_self_organizing_structure()
-    test_knowledge_graph()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_knowledge_graph(Path(tmp_dir))
 
 
 if __name__ == "__main__":
@@ -7,42 +7,19 @@ components, which allow the IRA system to learn from files and Wikipedia article
 """
 
 import os
+import pickle
 import sys
 import unittest
+from unittest import mock
 from pathlib import Path
 import tempfile
-import nltk
+
+import pytest
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    print("Downloading punkt tokenizer...")
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    print("Downloading punkt_tab tokenizer...")
-    # The punkt_tab resource is part of the 'all' package
-    nltk.download('all')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    print("Downloading stopwords...")
-    nltk.download('stopwords')
-
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    print("Downloading wordnet...")
-    nltk.download('wordnet')
-
 from ira.core.knowledge.knowledge_graph import KnowledgeGraph
 from ira.core.reasoning.ideom_network import IdeomNetwork
 from ira.core.reasoning.unified_reasoning_core import UnifiedReasoningCore
@@ -50,36 +27,66 @@ from ira.core.integration.reasoning_knowledge_integration import ReasoningKnowle
 from ira.core.learning.file_knowledge_loader import FileKnowledgeLoader
 from ira.core.learning.wikipedia_knowledge_loader import WikipediaKnowledgeLoader
 from ira.core.learning.knowledge_loader_manager import KnowledgeLoaderManager
+from ira.core.learning.text_chunker import split_into_chunks
 
 
 class TestKnowledgeLoaders(unittest.TestCase):
     """Test case for the knowledge loaders."""
     
-    def setUp(self):
-        """Set up the test case."""
+    @classmethod
+    def setUpClass(cls):
+        """Build the components once for the test case."""
         # Create a Knowledge Graph
-        self.knowledge_graph = KnowledgeGraph()
+        knowledge_graph = KnowledgeGraph()
         
         # Create an Ideom Network
-        self.ideom_network = IdeomNetwork()
+        ideom_network = IdeomNetwork()
         
         # Create a Unified Reasoning Core
-        self.reasoning_core = UnifiedReasoningCore(
-            ideom_network=self.ideom_network
+        reasoning_core = UnifiedReasoningCore(
+            ideom_network=ideom_network
         )
         
         # Create a Reasoning Knowledge Integration
-        self.integration = ReasoningKnowledgeIntegration(
-            self.knowledge_graph,
-            self.reasoning_core
+        integration = ReasoningKnowledgeIntegration(
+            knowledge_graph,
+            reasoning_core
         )
         
         # Create a Knowledge Loader Manager
-        self.loader_manager = KnowledgeLoaderManager(
+        loader_manager = KnowledgeLoaderManager(
+            knowledge_graph,
+            reasoning_core,
+            integration
+        )
+        
+        # Cache fetched Wikipedia articles in a directory of our own
+        cls.wikipedia_cache_dir = tempfile.TemporaryDirectory()
+        loader_manager.wikipedia_loader.cache_dir = cls.wikipedia_cache_dir.name
+        
+        # Snapshot the components; pickling them together keeps their shared
+        # references, and unpickling is cheaper than rebuilding
+        cls._snapshot = pickle.dumps(
+            (knowledge_graph, ideom_network, reasoning_core, integration, loader_manager),
+            protocol=5
+        )
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests in the class."""
+        cls.wikipedia_cache_dir.cleanup()
+    
+    def setUp(self):
+        """Set up the test case."""
+        # The loaders change the graph, the ideom network and the reasoning
+        # core, so every test restores a fresh copy of the components
+        (
             self.knowledge_graph,
+            self.ideom_network,
             self.reasoning_core,
-            self.integration
-        )
+            self.integration,
+            self.loader_manager
+        ) = pickle.loads(self._snapshot)
         
         # Create a temporary directory for test files
         self.temp_dir = tempfile.TemporaryDirectory()
@@ -138,6 +145,76 @@ class TestKnowledgeLoaders(unittest.TestCase):
         giraffe_concept = self.knowledge_graph.get_concept_by_name("giraffe")
         self.assertIsNotNone(giraffe_concept)
     
+    def test_split_into_chunks(self):
+        """Test splitting text into chunks of whole sentences."""
+        test_text = "Lions are large cats. Tigers are striped cats.\n\nComputers process data."
+        
+        # Every sentence fits into one chunk
+        self.assertEqual(split_into_chunks(test_text), [
+            "Lions are large cats. Tigers are striped cats. Computers process data."
+        ])
+        
+        # Chunks are never split inside a sentence
+        self.assertEqual(split_into_chunks(test_text, chunk_size=30), [
+            "Lions are large cats.",
+            "Tigers are striped cats.",
+            "Computers process data."
+        ])
+    
+    def test_wikipedia_article_cache(self):
+        """Test that fetched Wikipedia articles are cached."""
+        response = mock.Mock()
+        response.json.return_value = {
+            "query": {
+                "pages": {
+                    "123": {
+                        "title": "Lion",
+                        "extract": "The lion is a large cat.",
+                        "revisions": [{"revid": 42}]
+                    }
+                }
+            }
+        }
+        
+        with mock.patch("requests.get", return_value=response) as get:
+            loader = WikipediaKnowledgeLoader(
+                self.knowledge_graph, self.reasoning_core, cache_dir=self.temp_dir.name
+            )
+            article = loader.fetch_article("Lion")
+            self.assertTrue(article["success"])
+            self.assertEqual(article["revid"], 42)
+            
+            # The second fetch is served from memory
+            self.assertEqual(loader.fetch_article("Lion"), article)
+            self.assertEqual(get.call_count, 1)
+            
+            # A new loader reads the article from the disk cache
+            loader = WikipediaKnowledgeLoader(
+                self.knowledge_graph, self.reasoning_core, cache_dir=self.temp_dir.name
+            )
+            self.assertEqual(loader.fetch_article("Lion"), article)
+            self.assertEqual(get.call_count, 1)
+    
+    def test_wikipedia_search_cache_is_bounded(self):
+        """Test that the search cache evicts the least recently used searches."""
+        response = mock.Mock()
+        response.json.return_value = {"query": {"search": [{"title": "Lion"}]}}
+        
+        with mock.patch("requests.get", return_value=response) as get:
+            loader = WikipediaKnowledgeLoader(
+                self.knowledge_graph, self.reasoning_core, cache_size=2
+            )
+            loader.search_articles("lion")
+            loader.search_articles("tiger")
+            loader.search_articles("lion")
+            loader.search_articles("cheetah")
+            self.assertEqual(list(loader.search_cache), [("lion", 5), ("cheetah", 5)])
+            
+            # "tiger" was evicted and is searched again
+            loader.search_articles("tiger")
+            self.assertEqual(get.call_count, 4)
+    
+    @pytest.mark.network
     def test_wikipedia_knowledge_loader(self):
         """Test the WikipediaKnowledgeLoader."""
         # This test requires an internet connection
@@ -164,6 +241,7 @@ class TestKnowledgeLoaders(unittest.TestCase):
         except Exception as e:
             self.skipTest(f"Skipping Wikipedia test due to error: {str(e)}")
     
+    @pytest.mark.network
     def test_wikipedia_search_loader(self):
         """Test loading knowledge from Wikipedia search results."""
         # This test requires an internet connection
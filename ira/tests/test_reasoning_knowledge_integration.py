@@ -15,59 +15,84 @@ from ira.core.reasoning.ideom_network import IdeomNetwork
 from ira.core.integration.reasoning_knowledge_integration import ReasoningKnowledgeIntegration
 
 
+def _build_components(target):
+    """
+    Build the integrated components with two test concepts.
+    
+    Args:
+        target: The test case or test case class to set the components on.
+    """
+    # Create a Knowledge Graph with some test concepts
+    target.knowledge_graph = KnowledgeGraph()
+    
+    # Add some test concepts
+    target.dog_concept = target.knowledge_graph.add_concept(
+        "dog",
+        properties={
+            "type": "animal",
+            "legs": "four",
+            "sound": "bark"
+        }
+    )
+    
+    target.cat_concept = target.knowledge_graph.add_concept(
+        "cat",
+        properties={
+            "type": "animal",
+            "legs": "four",
+            "sound": "meow"
+        }
+    )
+    
+    # Create an Ideom Network
+    target.ideom_network = IdeomNetwork()
+    
+    # Create a Unified Reasoning Core
+    target.reasoning_core = UnifiedReasoningCore(ideom_network=target.ideom_network)
+    
+    # Create a Reasoning Knowledge Integration
+    target.reasoning_integration = ReasoningKnowledgeIntegration(
+        target.knowledge_graph,
+        target.reasoning_core
+    )
+    
+    # Create an IRA System
+    target.ira_system = IRASystem(
+        knowledge_graph=target.knowledge_graph,
+        ideom_network=target.ideom_network,
+        reasoning_core=target.reasoning_core,
+        reasoning_integration=target.reasoning_integration
+    )
+
+
 class TestReasoningKnowledgeIntegration(unittest.TestCase):
-    """Test case for the integration between the Unified Reasoning Core and the Knowledge Graph."""
+    """Test case for the integration between the Unified Reasoning Core and the Knowledge Graph.
+    
+    The tests in this class only read the ideoms and prefabs created from the
+    concepts, so the components are built and populated once for the class.
+    """
 
-    def setUp(self):
-        """Set up the test case."""
-        # Create a Knowledge Graph with some test concepts
-        self.knowledge_graph = KnowledgeGraph()
-        
-        # Add some test concepts
-        self.dog_concept = self.knowledge_graph.add_concept("dog")
-        self.knowledge_graph.update_concept(
-            self.dog_concept.id,
-            properties={
-                "type": "animal",
-                "legs": "four",
-                "sound": "bark"
-            }
-        )
-        
-        self.cat_concept = self.knowledge_graph.add_concept("cat")
-        self.knowledge_graph.update_concept(
-            self.cat_concept.id,
-            properties={
-                "type": "animal",
-                "legs": "four",
-                "sound": "meow"
-            }
-        )
-        
-        # Create an Ideom Network
-        self.ideom_network = IdeomNetwork()
-        
-        # Create a Unified Reasoning Core
-        self.reasoning_core = UnifiedReasoningCore(ideom_network=self.ideom_network)
-        
-        # Create a Reasoning Knowledge Integration
-        self.reasoning_integration = ReasoningKnowledgeIntegration(
-            self.knowledge_graph,
-            self.reasoning_core
-        )
-        
-        # Create an IRA System
-        self.ira_system = IRASystem(
-            knowledge_graph=self.knowledge_graph,
-            ideom_network=self.ideom_network,
-            reasoning_core=self.reasoning_core,
-            reasoning_integration=self.reasoning_integration
-        )
+    _populated = False
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the components shared by all tests in the class."""
+        _build_components(cls)
+        cls._populated = False
+
+    @classmethod
+    def _ensure_populated(cls):
+        """Create the ideoms and prefabs from the concepts, once per class."""
+        if cls._populated:
+            return
+        cls.reasoning_integration.create_ideoms_from_concepts()
+        cls.reasoning_integration.create_prefabs_from_concepts()
+        cls._populated = True
 
     def test_create_ideoms_from_concepts(self):
         """Test creating ideoms from concepts in the Knowledge Graph."""
         # Create ideoms from concepts
-        self.reasoning_integration.create_ideoms_from_concepts()
+        self._ensure_populated()
         
         # Check if ideoms were created for the concepts
         dog_ideoms = self.ideom_network.get_ideoms_by_name("dog")
@@ -88,11 +113,8 @@ class TestReasoningKnowledgeIntegration(unittest.TestCase):
 
     def test_create_prefabs_from_concepts(self):
         """Test creating prefabs from concepts in the Knowledge Graph."""
-        # Create ideoms from concepts first
-        self.reasoning_integration.create_ideoms_from_concepts()
-        
-        # Create prefabs from concepts
-        self.reasoning_integration.create_prefabs_from_concepts()
+        # Create ideoms and prefabs from concepts
+        self._ensure_populated()
         
         # Check if prefabs were created for the concepts
         prefabs = self.reasoning_core.prefab_manager.get_all_prefabs()
@@ -108,6 +130,18 @@ class TestReasoningKnowledgeIntegration(unittest.TestCase):
         cat_prefabs = [p for p in prefabs if "cat" in p.name]
         self.assertGreaterEqual(len(cat_prefabs), 1)
 
+
+class TestReasoningKnowledgeIntegrationProcessing(unittest.TestCase):
+    """Test case for processing input with the integrated components.
+    
+    Processing input updates the Knowledge Graph and the ideom network, so
+    each test gets freshly built components.
+    """
+
+    def setUp(self):
+        """Set up the test case."""
+        _build_components(self)
+
     def test_process_input_with_knowledge(self):
         """Test processing input with knowledge."""
         # Create ideoms and prefabs from concepts
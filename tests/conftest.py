@@ -0,0 +1,56 @@
+"""
+Shared fixtures for the ccai tests.
+
+Session-scoped fixtures are created once per process, so with pytest-xdist
+(``pytest -n auto``) every worker loads the model once.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+import spacy
+
+from ccai.nlp.extractor import EXCLUDED_COMPONENTS
+from ccai.nlp.primitives import PrimitiveManager
+
+# The spaCy model, or the error raised while loading it. It is loaded in a
+# background thread while pytest collects the tests.
+_model: Dict[str, Any] = {}
+_model_thread: Optional[threading.Thread] = None
+
+
+def _load_model():
+    try:
+        _model["nlp"] = spacy.load("en_core_web_sm", exclude=EXCLUDED_COMPONENTS)
+    except Exception as e:
+        _model["error"] = e
+
+
+def pytest_configure(config):
+    """Start loading the model, unless this process won't run any tests."""
+    global _model_thread
+    is_xdist_controller = config.getoption("numprocesses", None) and not hasattr(config, "workerinput")
+    if config.option.collectonly or is_xdist_controller:
+        return
+    _model_thread = threading.Thread(target=_load_model, daemon=True)
+    _model_thread.start()
+
+
+@pytest.fixture(scope="session")
+def primitive_manager():
+    """Load the primitives once for the whole test session."""
+    return PrimitiveManager(Path("primitives.json"))
+
+
+@pytest.fixture(scope="session")
+def spacy_nlp():
+    """The spaCy model, loaded once for the whole test session."""
+    if _model_thread is None:
+        _load_model()
+    else:
+        _model_thread.join()
+    if "error" in _model:
+        raise _model["error"]
+    return _model["nlp"]
@@ -1,71 +1,83 @@
-from pathlib import Path
+import hashlib
+import os
 
 from ccai.core.graph import ConceptGraph
 from ccai.nlp.extractor import InformationExtractor
-from ccai.nlp.primitives import PrimitiveManager
 import pytest
+import spacy
+from spacy.tokens import Doc
+
+
+@pytest.fixture(scope="session")
+def shared_extractor(request, primitive_manager, spacy_nlp):
+    """Create one extractor with the loaded model and the parsed Docs of earlier runs."""
+    extractor = InformationExtractor(None, primitive_manager, nlp=spacy_nlp, doc_cache_size=1024)
+    # Parsed test sentences are kept in pytest's cache, one file per model
+    # version and pipeline config, since Docs from other components differ
+    meta = spacy_nlp.meta
+    config_hash = hashlib.sha1(spacy_nlp.config.to_str().encode("utf-8")).hexdigest()[:12]
+    cache_file = request.config.cache.mkdir("doc_cache") / (
+        f"{meta['lang']}_{meta['name']}-{meta['version']}-{config_hash}.spacy"
+    )
+    try:
+        extractor.load_doc_cache(cache_file)
+    except Exception:
+        # A missing or unreadable file is a cache miss
+        pass
+
+    yield extractor
+
+    # Write to a temporary file first so concurrent or interrupted runs
+    # never leave a partial cache file behind
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    extractor.save_doc_cache(tmp_file)
+    os.replace(tmp_file, cache_file)
 
 
 @pytest.fixture
-def extractor(tmp_path):
-    """Create a fresh extractor with an empty graph for each test."""
-    graph = ConceptGraph(tmp_path)
-    pm = PrimitiveManager(Path("primitives.json"))
-    return InformationExtractor(graph, pm), graph
-
-
-def test_ingest_creates_nodes(extractor):
-    ext, graph = extractor
-    ext.ingest_text("A knife is a tool.")
-
-    assert graph.get_node("knife") is not None
-    knife = graph.get_node("knife")
-    assert "is_a" in knife.relations
-    assert "tool" in knife.relations["is_a"]
-
-
-def test_extract_alias(extractor):
-    ext, graph = extractor
-    ext.ingest_text("A car is called automobile.")
-
-    car = graph.get_node("car")
+def extractor(shared_extractor):
+    """Bind the shared extractor to a fresh empty graph for each test."""
+    graph = ConceptGraph.in_memory()
+    shared_extractor.reset(graph)
+    return shared_extractor, graph
+
+
+# Sentences with one relation each, as (text, concept, relation, target)
+RELATION_CASES = [
+    ("A knife is a tool.", "knife", "is_a", "tool"),
+    ("A car has wheels.", "car", "has_part", "wheels"),
+    ("A knife is used for cutting.", "knife", "used_for", "cutting"),
+    ("A bird can fly.", "bird", "can_do", "fly"),
+]
+ALIAS_TEXT = "A car is called automobile."
+
+
+@pytest.fixture(scope="module")
+def relations_graph(shared_extractor):
+    """Ingest all single-relation sentences as one batch into one graph."""
+    graph = ConceptGraph.in_memory()
+    shared_extractor.reset(graph)
+    shared_extractor.ingest_texts([case[0] for case in RELATION_CASES] + [ALIAS_TEXT])
+    return graph
+
+
+@pytest.mark.parametrize("text, concept, relation, target", RELATION_CASES)
+def test_extract_relation(relations_graph, text, concept, relation, target):
+    node = relations_graph.get_node(concept)
+    assert node is not None
+    assert relation in node.relations
+    assert target in node.relations[relation]
+
+
+def test_extract_alias(relations_graph):
+    car = relations_graph.get_node("car")
     assert car is not None
     assert "automobile" in car.aliases
     # Alias lookup should also return the original node
-    auto = graph.get_node("automobile")
+    auto = relations_graph.get_node("automobile")
     assert auto is car
 
 
-def test_extract_has_part(extractor):
-    ext, graph = extractor
-    ext.ingest_text("A car has wheels.")
-
-    car = graph.get_node("car")
-    assert car is not None
-    assert "has_part" in car.relations
-    assert "wheels" in car.relations["has_part"]
-
-
-def test_extract_used_for(extractor):
-    ext, graph = extractor
-    ext.ingest_text("A knife is used for cutting.")
-
-    knife = graph.get_node("knife")
-    assert knife is not None
-    assert "used_for" in knife.relations
-    assert "cutting" in knife.relations["used_for"]
-
-
-def test_extract_can_do(extractor):
-    ext, graph = extractor
-    ext.ingest_text("A bird can fly.")
-
-    bird = graph.get_node("bird")
-    assert bird is not None
-    assert "can_do" in bird.relations
-    assert "fly" in bird.relations["can_do"]
-
-
 def test_extract_agent_action_object(extractor):
     ext, graph = extractor
     ext.ingest_text("The cat chases the mouse.")
@@ -105,3 +117,75 @@ def test_multiple_extractions(extractor):
     assert "chase" in dog.relations["performs"]
     assert "used_for" in dog.relations
     assert "companionship" in dog.relations["used_for"]
+
+
+def test_ingest_texts(extractor):
+    ext, graph = extractor
+    ext.ingest_texts(["A knife is a tool.", "A bird can fly."])
+
+    assert "tool" in graph.get_node("knife").relations["is_a"]
+    assert "fly" in graph.get_node("bird").relations["can_do"]
+
+
+def test_doc_cache_reuses_parsed_docs(primitive_manager):
+    ext = InformationExtractor(None, primitive_manager, nlp=spacy.blank("en"), doc_cache_size=2)
+    first = list(ext._parse(["A knife is a tool.", "A bird can fly."]))
+    second = list(ext._parse(["A knife is a tool."]))
+    assert second[0] is first[0]
+
+    # The least recently used text is evicted
+    ext._parse(["A cat is an animal."])
+    assert list(ext._doc_cache) == ["A knife is a tool.", "A cat is an animal."]
+
+
+def test_relation_rules_on_parsed_doc(primitive_manager):
+    # "A dog chases the cat and the mouse." parsed by hand, so no model is needed
+    nlp = spacy.blank("en")
+    doc = Doc(
+        nlp.vocab,
+        words=["A", "dog", "chases", "the", "cat", "and", "the", "mouse", "."],
+        heads=[1, 2, 2, 4, 2, 4, 7, 4, 2],
+        deps=["det", "nsubj", "ROOT", "det", "dobj", "cc", "det", "conj", "punct"],
+        pos=["DET", "NOUN", "VERB", "DET", "NOUN", "CCONJ", "DET", "NOUN", "PUNCT"],
+        lemmas=["a", "dog", "chase", "the", "cat", "and", "the", "mouse", "."],
+    )
+    graph = ConceptGraph.in_memory()
+    ext = InformationExtractor(graph, primitive_manager, nlp=nlp)
+
+    matches = ext._match_relations(doc)
+    ext._extract_agent_action_object(doc[:], matches)
+
+    assert graph.get_node("dog").relations["performs"] == ["chase"]
+    assert graph.get_node("chase").relations["affects"] == ["cat"]
+
+
+def test_doc_cache_round_trip(primitive_manager, tmp_path):
+    nlp = spacy.blank("en")
+    texts = ["A knife is a tool.", "A bird  can fly."]
+    ext = InformationExtractor(None, primitive_manager, nlp=nlp, doc_cache_size=8)
+    ext._parse(texts)
+    ext.save_doc_cache(tmp_path / "docs.spacy")
+
+    other = InformationExtractor(None, primitive_manager, nlp=nlp, doc_cache_size=8)
+    other.load_doc_cache(tmp_path / "docs.spacy")
+    assert list(other._doc_cache) == texts
+    assert [doc.text for doc in other._parse(texts)] == texts
+
+
+def test_adjective_property_ignores_case(primitive_manager):
+    # "Knives are SHARP." parsed by hand, so no model is needed
+    nlp = spacy.blank("en")
+    doc = Doc(
+        nlp.vocab,
+        words=["Knives", "are", "SHARP", "."],
+        heads=[1, 1, 1, 1],
+        deps=["nsubj", "ROOT", "acomp", "punct"],
+        pos=["NOUN", "AUX", "ADJ", "PUNCT"],
+    )
+    graph = ConceptGraph.in_memory()
+    ext = InformationExtractor(graph, primitive_manager, nlp=nlp)
+
+    ext._extract_adjective_property(doc[:])
+
+    category, _ = primitive_manager.get_info("sharp")
+    assert graph.get_node("knives").property_stats[category] == {"sharp": 1}
@@ -0,0 +1,80 @@
+import sys
+
+from ccai.core.graph import ConceptGraph
+from ccai.core.models import ConceptNode
+
+
+def _populate(graph):
+    graph.add_node(ConceptNode(name="knife", ctype="object"))
+    graph.add_node(ConceptNode(name="tool", ctype="object"))
+    graph.add_edge("knife", "is_a", "tool")
+    graph.update_property("knife", "color", "silver")
+
+
+def test_disk_graph_reloads_from_wal(tmp_path):
+    graph = ConceptGraph(tmp_path)
+    _populate(graph)
+    graph.close()
+
+    reloaded = ConceptGraph(tmp_path)
+    reloaded.load_from_disk()
+    reloaded.close()
+
+    knife = reloaded.get_node("knife")
+    assert knife is not None
+    assert knife.relations["is_a"] == ["tool"]
+    assert knife.property_stats["color"] == {"silver": 1}
+
+
+def test_in_memory_graph_reloads_from_log():
+    graph = ConceptGraph.in_memory()
+    _populate(graph)
+    graph.save_snapshot()
+    graph.add_edge("tool", "used_for", "knife")
+
+    graph.load_from_disk()
+
+    assert graph.get_node("knife").relations["is_a"] == ["tool"]
+    assert graph.get_node("tool").relations["used_for"] == ["knife"]
+
+
+def test_alias_lookup():
+    graph = ConceptGraph.in_memory()
+    _populate(graph)
+    graph.add_node(ConceptNode(name="car", ctype="object", aliases=["Auto"]))
+    graph.add_alias("car", "Automobile")
+    graph.add_alias("knife", "tool")
+
+    car = graph.get_node("car")
+    assert graph.get_node("automobile") is car
+    assert graph.get_node(" AUTO ") is car
+    # A node's own name takes precedence over another node's alias
+    assert graph.get_node("tool").name == "tool"
+
+
+def test_aliases_survive_reload(tmp_path):
+    graph = ConceptGraph(tmp_path)
+    _populate(graph)
+    graph.add_alias("knife", "blade")
+    graph.close()
+
+    reloaded = ConceptGraph(tmp_path)
+    reloaded.load_from_disk()
+    reloaded.close()
+
+    assert reloaded.get_node("blade") is reloaded.get_node("knife")
+
+
+def test_names_are_interned():
+    # Strings built at runtime, unlike literals, aren't interned already
+    graph = ConceptGraph.in_memory()
+    graph.add_node(ConceptNode(name="".join(["kni", "fe"]), ctype="object"))
+    graph.add_node(ConceptNode(name="tool", ctype="object"))
+    graph.add_edge("knife", "".join(["is", "_a"]), "".join(["to", "ol"]))
+    graph.add_alias("knife", "".join(["bla", "de"]))
+
+    knife = graph.get_node("knife")
+    assert knife.name is sys.intern("knife")
+    assert next(iter(knife.relations)) is sys.intern("is_a")
+    assert knife.relations["is_a"][0] is graph.get_node("tool").name
+    assert knife.aliases[0] is sys.intern("blade")
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 from ccai.nlp.parser import QueryParser
 
 def test_define_question():
@@ -8,3 +12,32 @@ def test_define_question():
     assert sig.payload["ask"] == "relation.is_a"
     assert sig.origin == "car"
 
+
+# Runs in a fresh interpreter, so replacing spacy.load can't affect the
+# model that conftest.py loads in a background thread
+WITHOUT_MODEL_SCRIPT = """
+import spacy
+
+def fail_load(*args, **kwargs):
+    raise AssertionError("the model shouldn't be loaded")
+
+spacy.load = fail_load
+
+from ccai.nlp.parser import QueryParser
+
+
+sig = QueryParser().parse_question("Define a knife?")
+assert sig is not None
+assert sig.payload["ask"] == "relation.is_a"
+assert sig.origin == "knife"
+"""
+
+
+def test_define_question_without_model():
+    result = subprocess.run(
+        [sys.executable, "-c", WITHOUT_MODEL_SCRIPT],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,13 @@
+from pathlib import Path
+
+import pytest
+
+from ccai.nlp.primitives import PrimitiveManager
+
+
+def test_managers_share_parsed_primitives(primitive_manager):
+    other = PrimitiveManager(Path(".") / ".." / Path.cwd().name / "primitives.json")
+
+    assert other._category_map is primitive_manager._category_map
+    with pytest.raises(TypeError):
+        other._category_map["red"] = ("color", "tags")